@@ -0,0 +1,202 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Enlaces de afiliado a partir de content/affiliates.json.
+
+Cada searchUrlTemplate se compila una vez en una lista de segmentos: el
+texto fijo y los datos propios del socio (aid, marker) quedan ya
+codificados, y al formatear solo se codifican y unen los valores de la
+búsqueda (ciudad, fechas, idioma). Los socios con active: false o sin
+plantilla no se compilan.
+
+Cada plantilla es de un tipo según los campos que pide: una búsqueda de
+hotel lleva ciudad y fechas de entrada y salida. Con las plantillas de
+hotel se genera de una vez la matriz sede × fecha de partido × idioma, y
+con ella el bloque de enlaces (con su aviso de afiliado) que el build
+añade a las páginas comerciales de /travel/stay/. Las de /travel/flights/
+solo llevan bloque si algún socio tiene plantilla de vuelos; hoy ninguno
+la tiene (Travelpayouts solo configura widgets), así que se quedan sin él.
+"""
+
+from collections import defaultdict
+from datetime import date, timedelta
+from html import escape
+from string import Formatter
+from urllib.parse import quote
+
+from content_store import CONTENT_DIR, load_collection
+
+# Secciones cuyas páginas comerciales llevan enlaces de afiliado, con el tipo de enlace
+COMMERCIAL_SECTIONS = {'travel/stay': 'hotels', 'travel/flights': 'flights'}
+
+# Campos de la búsqueda que identifican el tipo de una plantilla
+KIND_FIELDS = {
+    'hotels': {'city', 'checkin', 'checkout'},
+    'flights': {'origin', 'destination'},
+}
+
+# Campos que salen del propio socio en lugar de la búsqueda
+PARTNER_FIELDS = ('aid', 'marker', 'token')
+
+MONTHS_SHORT = {
+    'es': ('ene', 'feb', 'mar', 'abr', 'may', 'jun', 'jul', 'ago', 'sep', 'oct', 'nov', 'dic'),
+    'en': ('Jan', 'Feb', 'Mar', 'Apr', 'May', 'Jun', 'Jul', 'Aug', 'Sep', 'Oct', 'Nov', 'Dec'),
+}
+
+TEXT = {
+    'es': {
+        'title': 'Reserva alojamiento para tus partidos',
+        'intro': 'Hoteles en cada sede para la noche anterior y la posterior a cada partido:',
+        'cta': 'Ver hoteles en {partner}',
+    },
+    'en': {
+        'title': 'Book a stay for your matches',
+        'intro': 'Hotels in each host city for the night before and after every match:',
+        'cta': 'See hotels on {partner}',
+    },
+}
+
+
+def encode(value):
+    """Codifica un valor para una query string (espacios, acentos, &, /...)"""
+    return quote(str(value), safe='')
+
+
+class LinkTemplate:
+    """searchUrlTemplate compilada para un socio"""
+    __slots__ = ('partner', '_parts')
+
+    def __init__(self, partner):
+        self.partner = partner
+        # Lista de str ya codificados (texto fijo) y (campo,) para los valores de la búsqueda
+        parts = []
+        for literal, field, _, _ in Formatter().parse(partner['searchUrlTemplate']):
+            literal = literal or ''
+            if field in PARTNER_FIELDS:
+                literal += encode(partner[field])
+                field = None
+            if literal:
+                if parts and isinstance(parts[-1], str):
+                    parts[-1] += literal
+                else:
+                    parts.append(literal)
+            if field:
+                parts.append((field,))
+        self._parts = tuple(parts)
+
+    @property
+    def fields(self):
+        return [part[0] for part in self._parts if not isinstance(part, str)]
+
+    @property
+    def kind(self):
+        """'hotels', 'flights' o None según los campos de la búsqueda"""
+        fields = set(self.fields)
+        return next((kind for kind, required in KIND_FIELDS.items() if required <= fields), None)
+
+    def format(self, **values):
+        """URL final con los valores de la búsqueda codificados"""
+        return ''.join(part if isinstance(part, str) else encode(values[part[0]]) for part in self._parts)
+
+
+def compile_partners(partners):
+    """Plantillas de los socios activos con searchUrlTemplate"""
+    return [LinkTemplate(p) for p in partners if p.get('active') and p.get('searchUrlTemplate')]
+
+
+def short_date(iso_date, lang):
+    """'2026-06-11' -> '11 jun' / 'Jun 11'"""
+    d = date.fromisoformat(iso_date)
+    month = MONTHS_SHORT[lang][d.month - 1]
+    return f"{d.day} {month}" if lang == 'es' else f"{month} {d.day}"
+
+
+class AffiliateLinks:
+    """Matriz de enlaces por sede, fecha de partido e idioma"""
+
+    def __init__(self, partners, matrix, matches, langs=('es', 'en')):
+        # Solo la búsqueda de hotel tiene los datos de la matriz (sede y fechas del partido)
+        self.templates = [template for template in compile_partners(partners) if template.kind == 'hotels']
+        self.cities = matrix.cities
+        self.langs = langs
+        self.dates = defaultdict(set)
+        for match in matches:
+            self.dates[matrix.ids[matrix.city_index(match['city'])]].add(match['date'])
+        self._blocks = {}
+
+    @classmethod
+    def from_content(cls, matrix, matches, content_dir=CONTENT_DIR):
+        return cls(load_collection('affiliates.json', 'partners', content_dir), matrix, matches)
+
+    def link_matrix(self):
+        """{(sede, fecha, idioma): [(plantilla, url)]} para todas las combinaciones"""
+        links = {}
+        for city in self.cities:
+            for match_date in sorted(self.dates[city['id']]):
+                day = date.fromisoformat(match_date)
+                checkin = (day - timedelta(days=1)).isoformat()
+                checkout = (day + timedelta(days=1)).isoformat()
+                for lang in self.langs:
+                    links[city['id'], match_date, lang] = [
+                        (template, template.format(city=city['name'][lang], checkin=checkin,
+                                                   checkout=checkout, lang=lang))
+                        for template in self.templates
+                    ]
+        return links
+
+    def cta_html(self, lang, kind='hotels'):
+        """
+        Bloque de enlaces por sede y fecha con el aviso de cada socio (igual
+        en todas las páginas del tipo); '' si ningún socio tiene enlaces de
+        ese tipo.
+        """
+        if kind != 'hotels':
+            return ''
+        block = self._blocks.get(lang)
+        if block is None:
+            block = self._blocks[lang] = self._render_cta(lang)
+        return block
+
+    def _render_cta(self, lang):
+        if not self.templates:
+            return ''
+        text = TEXT[lang]
+        links = self.link_matrix()
+        sections = []
+        for template in self.templates:
+            partner = template.partner
+            items = []
+            for city in self.cities:
+                dates = sorted(self.dates[city['id']])
+                if not dates:
+                    continue
+                anchors = ' · '.join(
+                    f'<a href="{escape(url)}" rel="sponsored nofollow noopener" target="_blank">'
+                    f'{short_date(match_date, lang)}</a>'
+                    for match_date in dates
+                    for tpl, url in links[city['id'], match_date, lang] if tpl is template
+                )
+                items.append(f"                <li><strong>{escape(city['name'][lang], quote=False)}:</strong> {anchors}</li>")
+            sections.append(f'''<div class="affiliate-cta" data-partner="{partner['id']}">
+            <h3>{text['cta'].format(partner=partner['name'])}</h3>
+            <ul>
+{chr(10).join(items)}
+            </ul>
+            <p class="affiliate-disclosure"><small>{escape(partner['disclosure'][lang], quote=False)}</small></p>
+        </div>''')
+        return f"<h2>{text['title']}</h2>\n\n        <p>{text['intro']}</p>\n\n        " + '\n\n        '.join(sections)
+
+
+def cta_kind(spec):
+    """Tipo de enlace de afiliado de una página comercial ('hotels', 'flights') o None"""
+    if spec.intent != 'Comercial':
+        return None
+    return next((kind for section, kind in COMMERCIAL_SECTIONS.items() if spec.url.startswith(f"{section}/")),
+                None)
+
+
+def insert_cta(html, block):
+    """Añade el bloque al final del <main> de una página ya renderizada"""
+    if not block:
+        return html
+    return html.replace('\n    </main>', f'\n\n        {block}\n    </main>', 1)
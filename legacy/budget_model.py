@@ -0,0 +1,131 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Modelo de presupuesto de la calculadora (tools/budget-calculator).
+
+Combina, por sede:
+- transporte entre el origen y cada sede (rango bajo/alto de TravelMatrix,
+  a partir de flightCostMin/Max y busCostMin/Max de routes.json)
+- alojamiento por noche (costPerNight de city-comparisons.json) y comida
+  (metroBudgetMeal), escalados según el nivel de viaje
+- partidos que se juegan en la sede (matches.json)
+
+Cada componente se calcula una vez por sede o par de sedes; el build
+evalúa con ellos todas las combinaciones origen × destino × noches × nivel
+y exporta tablas planas en tools/budget-calculator.json. La página estática
+lee un escenario directamente por índice, y los itinerarios con varias
+sedes se suman con las tablas de componentes. Un par de sedes sin ninguna
+ruta en routes.json no tiene tarifa: sus escenarios se exportan como null
+en lugar de contar el viaje como gratis.
+"""
+
+import json
+from collections import Counter, namedtuple
+
+from content_store import CONTENT_DIR, city_metric, load_collection, load_json
+from match_pages import SCHEDULE_FILE
+
+BUDGET_FILE = 'tools/budget-calculator.json'
+MAX_NIGHTS = 14
+MEALS_PER_DAY = 3
+
+# Nivel de viaje: multiplicadores (bajo, alto) sobre el precio base de la noche y de la comida
+Tier = namedtuple('Tier', 'id label stay meals')
+TIERS = (
+    Tier('economico', 'Económico', (1.0, 1.6), (1.0, 1.5)),
+    Tier('medio', 'Medio', (1.8, 2.8), (2.0, 3.0)),
+    Tier('premium', 'Premium', (3.5, 5.0), (4.0, 6.0)),
+)
+
+
+class BudgetModel:
+    """Componentes de costo por sede y nivel, y la rejilla de escenarios"""
+
+    def __init__(self, matrix, comparisons, matches):
+        self.matrix = matrix
+        n = matrix.n
+        nightly = city_metric(comparisons, 'costPerNight')
+        meal = city_metric(comparisons, 'metroBudgetMeal')
+        missing = [city_id for city_id in matrix.ids if city_id not in nightly]
+        if missing:
+            raise ValueError(f"city-comparisons.json no tiene costPerNight de: {', '.join(missing)}")
+
+        # Transporte de ida por par (origen, destino): 0 en la misma sede,
+        # None si no hay ruta entre las dos
+        self.fare = (list(matrix.cost), list(matrix.cost_high))
+        # Por (sede, nivel): costo de una noche y de un día de comida, bajo y alto
+        self.night = tuple(
+            [round(nightly[city_id] * tier.stay[band]) for city_id in matrix.ids for tier in TIERS]
+            for band in (0, 1)
+        )
+        self.food = tuple(
+            [round(MEALS_PER_DAY * meal[city_id] * tier.meals[band]) for city_id in matrix.ids for tier in TIERS]
+            for band in (0, 1)
+        )
+        counts = Counter(matrix.city_index(match['city']) for match in matches)
+        self.matches = [counts[i] for i in range(n)]
+
+    @classmethod
+    def from_content(cls, matrix, content_dir=CONTENT_DIR):
+        return cls(matrix,
+                   load_collection('programmatic/city-comparisons.json', 'comparisons', content_dir),
+                   load_json(SCHEDULE_FILE, content_dir)['matches'])
+
+    def estimate(self, origin, stops, tier):
+        """
+        Rango (bajo, alto) en USD de un viaje desde origin por stops =
+        [(sede, noches)], volviendo al origen al final. None si algún
+        trayecto no tiene ruta.
+        """
+        n, t = self.matrix.n, [tier_.id for tier_ in TIERS].index(tier)
+        cities = [self.matrix.city_index(origin)] + [self.matrix.city_index(c) for c, _ in stops]
+        cities.append(cities[0])
+        totals = []
+        for band in (0, 1):
+            fares = [self.fare[band][a * n + b] for a, b in zip(cities, cities[1:])]
+            if None in fares:
+                return None
+            total = sum(fares)
+            for (_, nights), i in zip(stops, cities[1:-1]):
+                total += nights * self.night[band][i * len(TIERS) + t]
+                total += (nights + 1) * self.food[band][i * len(TIERS) + t]
+            totals.append(round(total))
+        return tuple(totals)
+
+    def scenarios(self):
+        """
+        Costo bajo y alto de cada escenario origen × destino × noches × nivel,
+        en listas planas con índice ((o * n + d) * MAX_NIGHTS + noches - 1) * niveles + nivel.
+        Los escenarios sin ruta entre origen y destino valen None.
+        """
+        n, tiers = self.matrix.n, len(TIERS)
+        grid = []
+        for band in (0, 1):
+            fare, night, food = self.fare[band], self.night[band], self.food[band]
+            # Estancia de 1..MAX_NIGHTS noches por (destino, nivel), reutilizada para cada origen
+            stay = [[nights * night[k] + (nights + 1) * food[k] for nights in range(1, MAX_NIGHTS + 1)]
+                    for k in range(n * tiers)]
+            grid.append([
+                None if fare[o * n + d] is None else 2 * fare[o * n + d] + stay[d * tiers + t][nights]
+                for o in range(n) for d in range(n)
+                for nights in range(MAX_NIGHTS) for t in range(tiers)
+            ])
+        return grid
+
+    def to_json(self):
+        """Tablas de componentes y de escenarios para la página estática"""
+        low, high = self.scenarios()
+        return json.dumps({
+            'cities': self.matrix.ids,
+            'tiers': [{'id': tier.id, 'label': tier.label} for tier in TIERS],
+            'maxNights': MAX_NIGHTS,
+            'matches': self.matches,
+            'fareLow': self.fare[0],
+            'fareHigh': self.fare[1],
+            'nightLow': self.night[0],
+            'nightHigh': self.night[1],
+            'foodLow': self.food[0],
+            'foodHigh': self.food[1],
+            'low': low,
+            'high': high,
+        }, ensure_ascii=False, separators=(',', ':'))
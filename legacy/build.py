@@ -0,0 +1,491 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Build completo del sitio legacy.
+
+Lee el CSV una vez, construye el trie de URLs, comprueba que no haya
+colisiones (entre las páginas y con los archivos que ya hay en --out)
+antes de escribir ningún archivo y ejecuta las etapas:
+
+- static: portada, estilos y robots.txt del repositorio, copiados a --out
+  cuando es otra carpeta
+- pages: una página por fila del CSV (con el generador elegido); las
+  comerciales de /travel/stay/ y /travel/flights/ llevan enlaces de afiliado
+- sections: páginas índice para las rutas intermedias (/travel/, /fan/...)
+- matches: páginas por partido, fecha, grupo y sede + calendarios .ics
+  (incremental según el lastUpdated de content/schedule/matches.json)
+- teams: fichas de las 48 selecciones en español e inglés (content/teams.json)
+- transport: matriz de viaje entre sedes y páginas de transporte por ciudad
+  (content/cities.json + content/programmatic/routes.json)
+- compare: comparativas entre sedes en español e inglés
+  (content/programmatic/city-comparisons.json)
+- collections: guías de viaje y de fan, rankings, respuestas y guías del
+  día de partido desde el esquema de cada colección (collection_pages.py)
+- tools: itinerarios precalculados para el planificador de viaje y tablas
+  de la calculadora de presupuesto
+- sitemap: sitemap.xml con las páginas del CSV y todas las que generaron
+  las etapas anteriores, en todos los idiomas (generate_sitemap.py)
+- llms: llms.txt y llms-full.txt desde content/ y las páginas ya escritas
+  (incremental según el lastUpdated de cada entrada)
+- validate: revisa todas las páginas escritas (etiquetas, <h1>, longitud
+  de title/description y enlaces internos) y reporta solo los fallos
+- metrics: palabras, legibilidad, encabezados, densidad de la keyword,
+  imágenes, peso y nodos del DOM de cada página en
+  .build-state/page-metrics.csv
+- budgets: compara esas métricas con los presupuestos por plantilla de
+  page_budgets.json y reporta los excesos (--fail-on-budget: código 1)
+- package: manifiesto {ruta: hash} y almacén de blobs para el deploy, con
+  el delta respecto al build anterior
+
+Cada build se registra en .build-state/stats.sqlite (tiempos por etapa,
+archivos, bytes, caché de imágenes y memoria); build_stats.py muestra el
+historial y las etapas que se volvieron más lentas.
+
+Las etapas que generan páginas desde content/ reservan sus rutas en el trie
+antes del control de colisiones (PLANS); la de partidos también escribe
+sus índices (/world-cup-2026/matches/, fecha/, grupo/, sede/). Las etapas bilingües (teams,
+transport, compare, collections) renderizan todos los idiomas de --locales a partir de
+los mismos datos ya cargados y enlazan las versiones con hreflang.
+
+Con --shard i/N el build genera solo su parte de las páginas del CSV y
+de los índices en .shards/i-of-N/ (ver shards.py, que une los shards).
+
+Uso:
+    python3 build.py [--out DIR] [--renderer seo|basic|enhanced] [--csv RUTA] [--full]
+                    [--locales es,en] [--all-comparisons] [--fail-on-budget] [--shard i/N]
+"""
+
+import argparse
+import importlib
+import shutil
+import sys
+import time
+from itertools import chain
+from pathlib import Path
+
+from affiliate_links import AffiliateLinks, cta_kind, insert_cta
+from budget_model import BUDGET_FILE, BudgetModel
+from collection_pages import build_collection_pages, claim_collection_pages, collection_routes, load_collections
+from build_stats import StageTimer
+from comparison_pages import build_comparison_pages, claim_comparison_pages, comparison_routes, load_comparisons
+from content_store import load_json
+from deploy_bundle import package
+from generate_sitemap import iter_page_entries, iter_url_entries, write_sitemaps
+from llms_txt import generate as generate_llms_txt
+from match_pages import (SCHEDULE_FILE, MatchIndex, build_match_pages, claim_match_pages, match_routes,
+                         page_files as match_page_files)
+from page_budgets import (BUDGETS_FILE, BudgetConfigError, check as check_budgets, format_violations,
+                          load_templates)
+from page_metrics import METRICS_FILE, collect as collect_metrics, keyword_targets
+from page_shell import LOCALES
+from page_spec import CSV_PATH, CSVSchemaError, load_page_specs
+from shards import parse_shard, shard_dir, shard_of, write_shard_info
+from team_pages import TeamStore, build_team_pages, claim_team_pages, team_routes
+from travel_matrix import TravelMatrix, build_transport_pages, claim_transport_pages, transport_routes
+from trip_planner import PLANNER_FILE, TripPlanner, build_planner_data
+from url_trie import UrlCollisionError, UrlTrie, render_section_index
+from validate_output import format_report, validate
+
+# Generadores disponibles para las páginas del CSV
+RENDERERS = {
+    'enhanced': 'generate_enhanced_pages',
+    'basic': 'generate_pages',
+    'seo': 'generate_seo_content',
+}
+# enhanced necesita pexels_integration, que no siempre está instalado
+DEFAULT_RENDERER = 'seo'
+
+SOURCE_DIR = Path(__file__).parent
+# Archivos del repositorio que el build no genera pero el sitio necesita
+STATIC_FILES = ('index.html', 'styles.css', 'robots.txt')
+
+
+def load_renderer(name):
+    """Devuelve una función (spec, crumbs) -> html para el generador elegido"""
+    module = importlib.import_module(RENDERERS[name])
+    if name == 'seo':
+        return lambda spec, crumbs: module.create_html_page(
+            spec, module.generate_seo_content_for_page(spec), crumbs=crumbs)
+    return lambda spec, crumbs: module.create_html_page(spec, crumbs=crumbs)
+
+
+class Build:
+    """Estado compartido por las etapas de un build"""
+
+    def __init__(self, out_dir, specs, renderer, full=False, all_comparisons=False, locales=LOCALES,
+                 shard=None):
+        self.out_dir = Path(out_dir)
+        self.specs = specs
+        self.trie = UrlTrie.from_specs(specs)
+        self.renderer = renderer
+        # Ignorar el estado de builds anteriores y regenerar todo
+        self.full = full
+        # Idiomas de las etapas bilingües; todos se renderizan desde los mismos objetos
+        self.locales = locales
+        # (i, N) en un build repartido: solo se generan las URLs de este shard
+        self.shard = shard
+        self.pages_written = 0
+        self.pages_skipped = 0
+        # URLs (sin barras exteriores) de las páginas HTML de este build, para el sitemap
+        self.pages = set()
+        self.bytes_written = 0
+        # Tiempos finos dentro de las etapas ({'pages:render': segundos}) para el historial
+        self.timers = {}
+        self.teams = TeamStore()
+        self._match_index = None
+        self._travel_matrix = None
+        self._affiliates = None
+        # Comparativas: renderer compartido y pares a generar
+        self.comparisons = load_comparisons(all_pairs=all_comparisons)
+        # Colecciones de content/ con su plan de render ya compilado
+        self.collections = load_collections()
+        # Métricas por página (etapa metrics) y páginas fuera de presupuesto (etapa budgets)
+        self.metrics = None
+        self.budget_violations = []
+
+    @property
+    def match_index(self):
+        """Índice de partidos compartido por las etapas que lo necesitan"""
+        if self._match_index is None:
+            self._match_index = MatchIndex(load_json(SCHEDULE_FILE)['matches'])
+        return self._match_index
+
+    @property
+    def travel_matrix(self):
+        """Matriz de viaje entre sedes, calculada una vez por build"""
+        if self._travel_matrix is None:
+            self._travel_matrix = TravelMatrix.from_content()
+        return self._travel_matrix
+
+    @property
+    def affiliates(self):
+        """Enlaces de afiliado por sede y fecha (content/affiliates.json)"""
+        if self._affiliates is None:
+            self._affiliates = AffiliateLinks.from_content(self.travel_matrix, self.match_index.matches)
+        return self._affiliates
+
+    def owns(self, url):
+        """True si la URL toca a este build (siempre, salvo en un build repartido)"""
+        return self.shard is None or shard_of(url, self.shard[1]) == self.shard[0]
+
+    def write(self, rel_path, html):
+        """Escribe un archivo de salida creando sus carpetas"""
+        file_path = self.out_dir / rel_path
+        file_path.parent.mkdir(parents=True, exist_ok=True)
+        data = html.encode('utf-8')
+        file_path.write_bytes(data)
+        self.pages_written += 1
+        self.bytes_written += len(data)
+        if rel_path.endswith('.html'):
+            self.pages.add(page_url(rel_path))
+
+
+def page_url(rel_path):
+    """'travel/index.html' -> 'travel', 'travel/visa.html' -> 'travel/visa'"""
+    path = rel_path.removesuffix('.html')
+    return '' if path == 'index' else path.removesuffix('/index')
+
+
+def build_static(build):
+    """Etapa static: copia la portada y los estáticos si --out no es la carpeta del repositorio"""
+    if build.out_dir.resolve() == SOURCE_DIR.resolve():
+        return
+    for rel_path in STATIC_FILES:
+        target = build.out_dir / rel_path
+        target.parent.mkdir(parents=True, exist_ok=True)
+        shutil.copyfile(SOURCE_DIR / rel_path, target)
+        build.pages_written += 1
+        build.bytes_written += target.stat().st_size
+    print(f"Static: {', '.join(STATIC_FILES)}")
+
+
+def build_pages(build):
+    """Etapa pages: una página por fila del CSV"""
+    render_seconds = 0.0
+    for node in build.trie.page_nodes():
+        if not build.owns(node.path):
+            continue
+        start = time.perf_counter()
+        html = build.renderer(node.spec, node.crumbs())
+        render_seconds += time.perf_counter() - start
+        kind = cta_kind(node.spec)
+        if kind:
+            html = insert_cta(html, build.affiliates.cta_html('es', kind))
+        build.write(node.output_path, html)
+        print(f"Generated: {node.output_path}")
+    build.timers['pages:render'] = render_seconds
+
+
+def build_sections(build):
+    """Etapa sections: índices para las rutas intermedias sin fila en el CSV"""
+    for node in build.trie.section_nodes():
+        if not build.owns(node.path):
+            continue
+        build.write(node.output_path, render_section_index(node))
+        print(f"Generated index: {node.output_path}")
+
+
+def build_matches(build):
+    """Etapa matches: calendario de partidos desde content/schedule/matches.json"""
+    written, skipped = build_match_pages(build.out_dir, build.write, full=build.full)
+    build.pages_skipped += skipped
+    # Las páginas sin cambios no pasan por build.write pero van al sitemap
+    build.pages.update(page_url(path) for path in match_page_files(build.match_index))
+    print(f"Matches: {written} archivos regenerados, {skipped} sin cambios")
+
+
+def build_teams(build):
+    """Etapa teams: fichas de selecciones desde content/teams.json"""
+    start = time.perf_counter()
+    count = build_team_pages(build.trie, build.teams, build.write, build.match_index, build.locales)
+    print(f"Teams: {count} páginas en {time.perf_counter() - start:.2f}s")
+
+
+def build_transport(build):
+    """Etapa transport: matriz entre sedes y transporte por ciudad"""
+    start = time.perf_counter()
+    count = build_transport_pages(build.trie, build.travel_matrix, build.write, build.locales)
+    print(f"Transport: {count} archivos en {time.perf_counter() - start:.2f}s")
+
+
+def build_compare(build):
+    """Etapa compare: comparativas entre sedes"""
+    start = time.perf_counter()
+    renderer, pairs = build.comparisons
+    count = build_comparison_pages(build.trie, renderer, pairs, build.write, build.locales)
+    print(f"Compare: {count} páginas en {time.perf_counter() - start:.2f}s")
+
+
+def build_collections(build):
+    """Etapa collections: páginas de las colecciones descritas por esquema"""
+    start = time.perf_counter()
+    count = build_collection_pages(build.trie, build.collections, build.write, build.locales)
+    print(f"Collections: {count} páginas de {len(build.collections)} colecciones "
+          f"en {time.perf_counter() - start:.2f}s")
+
+
+def build_tools(build):
+    """Etapa tools: datos precalculados para las herramientas estáticas"""
+    start = time.perf_counter()
+    planner = TripPlanner(build.match_index.matches, build.travel_matrix)
+    build.write(PLANNER_FILE, build_planner_data(planner))
+    build.write(BUDGET_FILE, BudgetModel.from_content(build.travel_matrix).to_json())
+    print(f"Tools: {PLANNER_FILE}, {BUDGET_FILE} en {time.perf_counter() - start:.2f}s")
+
+
+def build_sitemap(build):
+    """
+    Etapa sitemap: las filas del CSV con la prioridad de su nivel (la portada,
+    en el shard 1) y después el resto de páginas escritas por este build
+    """
+    specs = [spec for spec in build.specs if not spec.is_placeholder and build.owns(spec.url)]
+    home = build.shard is None or build.shard[0] == 1
+    csv_urls = {spec.url.strip('/') for spec in build.specs}
+    generated = sorted(url for url in build.pages - csv_urls if url)
+    entries = chain(iter_url_entries(specs, home=home), iter_page_entries(generated))
+    files = write_sitemaps(build.out_dir, entries)
+    print(f"Sitemap: {len(specs) + home + len(generated)} URLs en {', '.join(path.name for path in files)}")
+
+
+def build_llms(build):
+    """Etapa llms: índice y texto completo para LLMs, al final para incluir todas las páginas"""
+    start = time.perf_counter()
+    rendered, copied = generate_llms_txt(build.out_dir, full=build.full)
+    print(f"LLMs: {rendered} entradas regeneradas, {copied} copiadas en {time.perf_counter() - start:.2f}s")
+
+
+def build_validate(build):
+    """Etapa validate: fallos de las páginas del árbol de salida"""
+    start = time.perf_counter()
+    checked, failures = validate(build.out_dir)
+    if failures:
+        print(format_report(failures))
+    print(f"Validate: {checked} páginas, {len(failures)} con fallos en {time.perf_counter() - start:.2f}s")
+
+
+def build_metrics(build):
+    """Etapa metrics: métricas de contenido por página en un CSV por columnas"""
+    start = time.perf_counter()
+    metrics = build.metrics = collect_metrics(build.out_dir, keyword_targets(build.trie))
+    metrics.write_csv(build.out_dir / METRICS_FILE)
+    print(f"Metrics: {len(metrics)} páginas -> {METRICS_FILE} en {time.perf_counter() - start:.2f}s")
+    print(metrics.summary())
+
+
+def build_budgets(build):
+    """Etapa budgets: páginas que superan el presupuesto de peso de su plantilla"""
+    try:
+        templates = load_templates(BUDGETS_FILE)
+    except BudgetConfigError as e:
+        print(f"{BUDGETS_FILE.name}: {e}", file=sys.stderr)
+        return
+    build.budget_violations = check_budgets(build.metrics, templates)
+    if build.budget_violations:
+        print(format_violations(build.budget_violations))
+    pages = len({v.path for v in build.budget_violations})
+    print(f"Budgets: {pages} páginas fuera de presupuesto ({len(build.budget_violations)} excesos)")
+
+
+def build_package(build):
+    """Etapa package: blobs nuevos y delta de deploy respecto al build anterior"""
+    start = time.perf_counter()
+    manifest, delta = package(build.out_dir)
+    print(f"Package: {len(manifest)} archivos, {len(delta['blobs'])} blobs nuevos "
+          f"({delta['bytes'] / 1024:.0f} KB) en {time.perf_counter() - start:.2f}s")
+
+
+def plan_matches(build):
+    claim_match_pages(build.trie, build.match_index)
+
+
+def plan_teams(build):
+    claim_team_pages(build.trie, build.teams)
+
+
+def plan_transport(build):
+    claim_transport_pages(build.trie, build.travel_matrix)
+
+
+def plan_compare(build):
+    claim_comparison_pages(build.trie, *build.comparisons)
+
+
+def plan_collections(build):
+    claim_collection_pages(build.trie, build.collections)
+
+
+# Reservas de rutas en el trie, antes del control de colisiones
+PLANS = (
+    plan_matches,
+    plan_teams,
+    plan_transport,
+    plan_compare,
+    plan_collections,
+)
+
+
+def routes_matches(build):
+    return match_routes(build.match_index, load_json(SCHEDULE_FILE)['lastUpdated'])
+
+
+def routes_teams(build):
+    return team_routes(build.trie, build.teams, build.match_index, build.locales)
+
+
+def routes_transport(build):
+    return transport_routes(build.trie, build.travel_matrix, build.locales)
+
+
+def routes_compare(build):
+    return comparison_routes(build.trie, *build.comparisons, build.locales)
+
+
+def routes_collections(build):
+    return collection_routes(build.trie, build.collections, build.locales)
+
+
+# Páginas de cada etapa de content/ como Route, después de PLANS; serve.py
+# las renderiza bajo demanda con los mismos renderers que el build
+STAGE_ROUTES = {
+    'matches': routes_matches,
+    'teams': routes_teams,
+    'transport': routes_transport,
+    'compare': routes_compare,
+    'collections': routes_collections,
+}
+
+STAGES = (
+    ('static', build_static),
+    ('pages', build_pages),
+    ('sections', build_sections),
+    ('matches', build_matches),
+    ('teams', build_teams),
+    ('transport', build_transport),
+    ('compare', build_compare),
+    ('collections', build_collections),
+    ('tools', build_tools),
+    ('sitemap', build_sitemap),
+    ('llms', build_llms),
+    ('validate', build_validate),
+    ('metrics', build_metrics),
+    ('budgets', build_budgets),
+    ('package', build_package),
+)
+
+# En un build repartido: etapas de content/ que corren solo en el shard 1, y
+# etapas que necesitan el sitio entero y se ejecutan después de unir los shards
+FIRST_SHARD_STAGES = {'static', 'matches', 'teams', 'transport', 'compare', 'collections', 'tools'}
+MERGED_STAGES = {'llms', 'validate'}
+
+
+def stages_for(shard):
+    if shard is None:
+        return STAGES
+    skip = MERGED_STAGES | (FIRST_SHARD_STAGES if shard[0] != 1 else set())
+    return tuple((name, stage) for name, stage in STAGES if name not in skip)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description='Build del sitio legacy del Mundial 2026')
+    parser.add_argument('--out', default=str(Path(__file__).parent), help='carpeta de salida')
+    parser.add_argument('--csv', default=CSV_PATH, help='CSV de estructura')
+    parser.add_argument('--renderer', choices=sorted(RENDERERS), default=DEFAULT_RENDERER,
+                        help='generador para las páginas del CSV')
+    parser.add_argument('--full', action='store_true',
+                        help='regenerar todo aunque el contenido no haya cambiado')
+    parser.add_argument('--locales', default=','.join(LOCALES),
+                        help=f"idiomas separados por comas (por defecto {','.join(LOCALES)})")
+    parser.add_argument('--all-comparisons', action='store_true',
+                        help='generar las comparativas de todos los pares de sedes')
+    parser.add_argument('--fail-on-budget', action='store_true',
+                        help='código 1 si alguna página supera el presupuesto de su plantilla')
+    parser.add_argument('--shard', metavar='i/N', help='generar solo el shard i de N (ver shards.py)')
+    args = parser.parse_args(argv)
+    locales = tuple(lang for lang in args.locales.split(',') if lang)
+    unknown = [lang for lang in locales if lang not in LOCALES]
+    if unknown:
+        parser.error(f"idiomas no soportados: {', '.join(unknown)}")
+    try:
+        shard = parse_shard(args.shard) if args.shard else None
+    except ValueError as e:
+        parser.error(str(e))
+    out_dir = shard_dir(args.out, shard) if shard else args.out
+
+    try:
+        specs = load_page_specs(args.csv)
+    except CSVSchemaError as e:
+        print(f"{args.csv}: {e}", file=sys.stderr)
+        return 1
+
+    try:
+        renderer = load_renderer(args.renderer)
+    except ModuleNotFoundError as e:
+        print(f"El generador {args.renderer} necesita el módulo {e.name}, que no está instalado "
+              f"(usar --renderer basic o seo)", file=sys.stderr)
+        return 1
+    build = Build(out_dir, specs, renderer, full=args.full,
+                  all_comparisons=args.all_comparisons, locales=locales, shard=shard)
+    for plan in PLANS:
+        plan(build)
+    try:
+        build.trie.check(build.out_dir)
+    except UrlCollisionError as e:
+        print(f"Colisiones de URL, no se escribió nada:\n{e}", file=sys.stderr)
+        return 1
+
+    timer = StageTimer(build)
+    for name, stage in stages_for(shard):
+        timer.run(name, stage)
+    timer.record(args.renderer)
+    if shard:
+        write_shard_info(build.out_dir, shard, args.csv, args.renderer, build.pages_written)
+
+    print(f"{build.pages_written} archivos ({build.pages_skipped} sin cambios), "
+          f"{build.bytes_written / 1024:.0f} KB")
+    if args.fail_on_budget and build.budget_violations:
+        return 1
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
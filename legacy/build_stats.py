@@ -0,0 +1,190 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Historial de builds en SQLite (.build-state/stats.sqlite).
+
+Cada build añade una fila con sus totales (archivos escritos y sin
+cambios, bytes, aciertos de la caché de imágenes, pico de memoria) y una
+por etapa con su tiempo y lo que escribió. Además de las etapas de
+build.py se guardan los contadores finos que acumula el build, como el
+tiempo dentro del generador del CSV (pages:render), para que un cambio
+lento en create_html_page o markdown_to_html se vea aunque la etapa
+entera apenas cambie.
+
+El comando muestra las últimas builds y marca las etapas cuyo tiempo
+supera el percentil elegido de las builds anteriores.
+
+Uso:
+    python3 build_stats.py [--out DIR] [--last 10] [--window 20] [--percentile 90] [--check]
+"""
+
+import argparse
+import resource
+import sqlite3
+import sys
+import time
+from pathlib import Path
+from statistics import quantiles
+
+STATS_FILE = '.build-state/stats.sqlite'
+# Builds anteriores con las que se compara cada etapa, y mínimo para opinar
+WINDOW = 20
+MIN_HISTORY = 5
+PERCENTILE = 90
+# Diferencias menores no se marcan: en etapas de milisegundos son ruido
+MIN_REGRESSION_SECONDS = 0.05
+
+SCHEMA = '''
+CREATE TABLE IF NOT EXISTS builds (
+    id INTEGER PRIMARY KEY,
+    started_at TEXT NOT NULL,
+    renderer TEXT,
+    seconds REAL NOT NULL,
+    pages_written INTEGER NOT NULL,
+    pages_skipped INTEGER NOT NULL,
+    bytes_written INTEGER NOT NULL,
+    image_hits INTEGER,
+    image_misses INTEGER,
+    peak_rss_kb INTEGER
+);
+CREATE TABLE IF NOT EXISTS stages (
+    build_id INTEGER NOT NULL REFERENCES builds(id),
+    name TEXT NOT NULL,
+    seconds REAL NOT NULL,
+    pages_written INTEGER,
+    pages_skipped INTEGER,
+    bytes_written INTEGER,
+    PRIMARY KEY (build_id, name)
+);
+'''
+
+
+def connect(out_dir):
+    path = Path(out_dir) / STATS_FILE
+    path.parent.mkdir(parents=True, exist_ok=True)
+    db = sqlite3.connect(path)
+    db.executescript(SCHEMA)
+    return db
+
+
+def peak_rss_kb():
+    """Pico de memoria residente del build y de sus procesos hijos (pool de validación)"""
+    own = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    children = resource.getrusage(resource.RUSAGE_CHILDREN).ru_maxrss
+    peak = max(own, children)
+    # Linux lo da en KB, macOS en bytes
+    return peak // 1024 if sys.platform == 'darwin' else peak
+
+
+def image_cache_counts():
+    """
+    (aciertos, fallos) de la caché de imágenes si el generador la expone
+    (get_pexels_image con cache_info(), como functools.lru_cache); si no,
+    (None, None).
+    """
+    module = sys.modules.get('pexels_integration')
+    info = getattr(getattr(module, 'get_pexels_image', None), 'cache_info', None)
+    if info is None:
+        return None, None
+    info = info()
+    return info.hits, info.misses
+
+
+class StageTimer:
+    """Mide cada etapa y lo que escribió a partir de los contadores del build"""
+
+    def __init__(self, build):
+        self.build = build
+        self.started = time.time()
+        self.stages = []
+
+    def run(self, name, stage):
+        build = self.build
+        before = (build.pages_written, build.pages_skipped, build.bytes_written)
+        start = time.perf_counter()
+        stage(build)
+        seconds = time.perf_counter() - start
+        after = (build.pages_written, build.pages_skipped, build.bytes_written)
+        self.stages.append((name, seconds, *(b - a for a, b in zip(before, after))))
+
+    def record(self, renderer=None):
+        """Guarda la build en el historial; devuelve su id"""
+        build = self.build
+        hits, misses = image_cache_counts()
+        db = connect(build.out_dir)
+        with db:
+            cursor = db.execute(
+                'INSERT INTO builds (started_at, renderer, seconds, pages_written, pages_skipped, '
+                'bytes_written, image_hits, image_misses, peak_rss_kb) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)',
+                (time.strftime('%Y-%m-%dT%H:%M:%S', time.localtime(self.started)), renderer,
+                 time.time() - self.started, build.pages_written, build.pages_skipped,
+                 build.bytes_written, hits, misses, peak_rss_kb()))
+            build_id = cursor.lastrowid
+            rows = [(build_id, *stage) for stage in self.stages]
+            rows += [(build_id, name, seconds, None, None, None) for name, seconds in build.timers.items()]
+            db.executemany('INSERT INTO stages VALUES (?, ?, ?, ?, ?, ?)', rows)
+        db.close()
+        return build_id
+
+
+def regressions(db, build_id, window=WINDOW, percentile=PERCENTILE, min_history=MIN_HISTORY):
+    """[(etapa, segundos, umbral)] de las etapas de una build más lentas que el percentil de las anteriores"""
+    flagged = []
+    for name, seconds in db.execute('SELECT name, seconds FROM stages WHERE build_id = ?', (build_id,)):
+        history = [row[0] for row in db.execute(
+            'SELECT seconds FROM stages WHERE name = ? AND build_id < ? ORDER BY build_id DESC LIMIT ?',
+            (name, build_id, window))]
+        if len(history) < min_history:
+            continue
+        threshold = quantiles(history, n=100, method='inclusive')[percentile - 1]
+        if seconds > threshold + MIN_REGRESSION_SECONDS:
+            flagged.append((name, seconds, threshold))
+    return flagged
+
+
+def format_build(row):
+    build_id, started_at, renderer, seconds, written, skipped, size, hits, misses, rss = row
+    hit_rate = f"{hits / (hits + misses):.0%}" if hits is not None and hits + misses else '-'
+    rss = f"{rss / 1024:.0f} MB" if rss else '-'
+    return (f"#{build_id:<5} {started_at}  {renderer or '-':<8} {seconds:7.2f}s  {written:>6} escritos  "
+            f"{skipped:>6} sin cambios  {size / 1024:>8.0f} KB  imágenes {hit_rate:>4}  RSS {rss}")
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description='Historial y regresiones de los builds')
+    parser.add_argument('--out', default=str(Path(__file__).parent), help='carpeta de salida del build')
+    parser.add_argument('--last', type=int, default=10, help='builds a mostrar')
+    parser.add_argument('--window', type=int, default=WINDOW, help='builds anteriores para comparar')
+    parser.add_argument('--percentile', type=int, default=PERCENTILE, help='percentil del umbral (1-99)')
+    parser.add_argument('--check', action='store_true', help='código 1 si la última build tiene regresiones')
+    args = parser.parse_args(argv)
+    if not 1 <= args.percentile <= 99:
+        parser.error('--percentile debe estar entre 1 y 99')
+
+    if not (Path(args.out) / STATS_FILE).exists():
+        print("Sin historial de builds")
+        return 0
+    db = connect(args.out)
+    rows = db.execute('SELECT * FROM builds ORDER BY id DESC LIMIT ?', (args.last,)).fetchall()
+    latest_flagged = []
+    for row in reversed(rows):
+        print(format_build(row))
+        flagged = regressions(db, row[0], args.window, args.percentile)
+        for name, seconds, threshold in flagged:
+            print(f"       lenta: {name} {seconds:.2f}s (p{args.percentile} anterior {threshold:.2f}s, "
+                  f"+{(seconds / threshold - 1) if threshold else 0:.0%})")
+        if row is rows[0]:
+            latest_flagged = flagged
+
+    if rows:
+        print(f"\nTiempo medio por etapa (últimas {args.window} builds):")
+        for name, avg, worst in db.execute(
+                'SELECT name, AVG(seconds), MAX(seconds) FROM stages WHERE build_id > ? '
+                'GROUP BY name ORDER BY MIN(rowid)', (rows[0][0] - args.window,)):
+            print(f"  {name:<14} {avg:7.3f}s  (máx. {worst:.3f}s)")
+    db.close()
+    return 1 if args.check and latest_flagged else 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,478 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Páginas de las colecciones de content/ descritas por un esquema: guías de
+viaje y de fan, rankings, respuestas y guías del día de partido.
+
+Cada colección se declara en COLLECTIONS con su archivo y clave raíz, la
+ruta de sus páginas, los campos de título y descripción y los bloques del
+cuerpo (Text, Sections, Faq, Fields, Ranking, Links, Sources, Nearby). Un campo
+puede ser:
+- una clave de la entrada ('title'); si su valor es {'es': ..., 'en': ...}
+  se toma el idioma de la página
+- Ref(clave, tipo): nombre de la ciudad o estadio al que apunta la clave
+- Format({'es': ..., 'en': ...}, {hueco: campo}): texto con huecos
+
+El esquema se compila una vez por colección a un RenderPlan. La primera
+entrada fija la forma (qué campos están traducidos y, con ellos, en qué
+idiomas se publica la colección) y cada campo y bloque queda como una
+función (entrada, idioma) -> texto; las entradas pasan después de una en
+una por el plan hasta page_shell.render_page. Una colección nueva solo
+necesita su entrada en COLLECTIONS.
+
+Las páginas en español reservan su ruta en el trie (breadcrumbs, índices de
+sección y control de colisiones); las demás van bajo /<idioma>/.
+"""
+
+import re
+from collections import namedtuple
+from functools import partial
+from html import escape
+
+from content_store import CONTENT_DIR, by_id, load_collection
+from page_shell import DEFAULT_LOCALE, LOCALES, esc, format_number, locale_path, render_page
+from spatial_index import SpatialIndex
+from url_trie import stage_route, write_routes
+
+STAGE = 'collections'
+
+TEXT = {
+    'es': {
+        'faq': 'Preguntas frecuentes',
+        'sources': 'Fuentes',
+        'rank': 'Puesto',
+        'name': 'Nombre',
+        'value': 'Dato',
+        'note': 'Comentario',
+    },
+    'en': {
+        'faq': 'Frequently asked questions',
+        'sources': 'Sources',
+        'rank': 'Rank',
+        'name': 'Name',
+        'value': 'Value',
+        'note': 'Notes',
+    },
+}
+
+# Colecciones a las que puede apuntar un Ref o un elemento de Ranking (por 'type')
+REFS = {
+    'city': ('cities.json', 'cities'),
+    'stadium': ('stadiums.json', 'stadiums'),
+}
+
+BOLD_RE = re.compile(r'\*\*(.+?)\*\*')
+
+
+class CollectionError(ValueError):
+    """Esquema que no encaja con la forma del JSON o entrada a la que le falta un campo"""
+
+
+Ref = namedtuple('Ref', 'key kind')
+Format = namedtuple('Format', 'text fields')
+
+
+def bold(text):
+    return BOLD_RE.sub(r'<strong>\1</strong>', esc(text))
+
+
+def rich_text(text):
+    """Párrafos separados por línea en blanco, listas '- ' y **negrita** -> HTML"""
+    blocks = []
+    for block in text.split('\n\n'):
+        lines = [line.strip() for line in block.strip().splitlines() if line.strip()]
+        if not lines:
+            continue
+        if all(line.startswith('- ') for line in lines):
+            items = '\n'.join(f"            <li>{bold(line[2:])}</li>" for line in lines)
+            blocks.append(f"<ul>\n{items}\n        </ul>")
+        else:
+            blocks.append(f"<p>{bold(' '.join(lines))}</p>")
+    return '\n\n        '.join(blocks)
+
+
+def is_localized(value):
+    return isinstance(value, dict) and DEFAULT_LOCALE in value
+
+
+class Refs:
+    """Entidades referenciadas {tipo: {id: entidad}}, cargadas al primer uso"""
+
+    def __init__(self, content_dir=CONTENT_DIR):
+        self.content_dir = content_dir
+        self._tables = {}
+        self._places = None
+
+    @property
+    def places(self):
+        """Índice espacial de sedes y estadios (bloques Nearby)"""
+        if self._places is None:
+            self._places = SpatialIndex.from_content(self.content_dir)
+        return self._places
+
+    def __getitem__(self, kind):
+        table = self._tables.get(kind)
+        if table is None:
+            table = self._tables[kind] = by_id(load_collection(*REFS[kind], self.content_dir))
+        return table
+
+    def name(self, kind, entity_id, lang):
+        return self[kind][entity_id]['name'][lang]
+
+
+def compile_field(spec, sample, refs):
+    """(función (entrada, idioma) -> texto, traducido) de un campo del esquema"""
+    if isinstance(spec, Ref):
+        key, kind = spec
+        if kind not in REFS:
+            raise CollectionError(f"Ref a un tipo desconocido: {kind}")
+        return (lambda entry, lang: refs.name(kind, entry[key], lang)), True
+    if isinstance(spec, Format):
+        getters = {name: compile_field(field, sample, refs)[0] for name, field in spec.fields.items()}
+        text = spec.text
+        return ((lambda entry, lang: text[lang].format(**{name: get(entry, lang) for name, get in getters.items()})),
+                all(lang in text for lang in LOCALES))
+    if spec not in sample:
+        raise CollectionError(f"la entrada de muestra no tiene el campo {spec}")
+    if is_localized(sample[spec]):
+        return (lambda entry, lang: entry[spec][lang]), True
+    return (lambda entry, lang: entry[spec]), False
+
+
+def item_sample(entries, field):
+    """Primer elemento de la lista field en cualquier entrada (None si todas están vacías)"""
+    return next((entry[field][0] for entry in entries if entry.get(field)), None)
+
+
+def join(parts):
+    return '\n\n        '.join(parts)
+
+
+class Text:
+    """Párrafos de un campo"""
+
+    def __init__(self, field):
+        self.field = field
+
+    def compile(self, entries, refs):
+        get = compile_field(self.field, entries[0], refs)[0]
+        return lambda entry, lang: rich_text(str(get(entry, lang)))
+
+
+class Sections:
+    """Lista de secciones: <h2> y párrafos de cada una"""
+
+    def __init__(self, field, title='title', body='content'):
+        self.field, self.title, self.body = field, title, body
+
+    def compile(self, entries, refs):
+        sample = item_sample(entries, self.field)
+        if sample is None:
+            return lambda entry, lang: ''
+        field = self.field
+        title = compile_field(self.title, sample, refs)[0]
+        body = compile_field(self.body, sample, refs)[0]
+        return lambda entry, lang: join(
+            f"<h2>{esc(title(item, lang))}</h2>\n\n        {rich_text(body(item, lang))}"
+            for item in entry.get(field, ()))
+
+
+class Faq:
+    """Preguntas frecuentes; además van al FAQPage de los datos estructurados"""
+
+    def __init__(self, field, question='question', answer='answer'):
+        self.field, self.question, self.answer = field, question, answer
+
+    def compile_pairs(self, entries, refs):
+        """Función (entrada, idioma) -> [(pregunta, respuesta)]"""
+        sample = item_sample(entries, self.field)
+        if sample is None:
+            return lambda entry, lang: []
+        field = self.field
+        question = compile_field(self.question, sample, refs)[0]
+        answer = compile_field(self.answer, sample, refs)[0]
+        return lambda entry, lang: [(question(item, lang), answer(item, lang)) for item in entry.get(field, ())]
+
+    def compile(self, entries, refs):
+        pairs = self.compile_pairs(entries, refs)
+
+        def step(entry, lang):
+            faqs = pairs(entry, lang)
+            if not faqs:
+                return ''
+            return join([f"<h2>{TEXT[lang]['faq']}</h2>",
+                         *(f"<h3>{esc(q)}</h3>\n\n        {rich_text(a)}" for q, a in faqs)])
+        return step
+
+
+class Fields:
+    """Campos sueltos de la entrada, cada uno con su <h2>: ((campo, {idioma: título}), ...)"""
+
+    def __init__(self, rows):
+        self.rows = rows
+
+    def compile(self, entries, refs):
+        rows = [(compile_field(field, entries[0], refs)[0], label) for field, label in self.rows]
+        return lambda entry, lang: join(
+            f"<h2>{label[lang]}</h2>\n\n        {rich_text(str(get(entry, lang)))}" for get, label in rows)
+
+
+class Ranking:
+    """
+    Tabla de elementos ordenados por 'rank' que apuntan a una entidad
+    ('type' y 'entityId'), con su valor, unidad y comentario opcional.
+    units traduce la unidad, escrita en español en el JSON.
+    """
+
+    def __init__(self, field, units=None):
+        self.field = field
+        self.units = units or {}
+
+    def compile(self, entries, refs):
+        field, units = self.field, self.units
+
+        def cell(item, lang):
+            value = item['value']
+            value = format_number(value, lang) if isinstance(value, int) and value >= 10000 else value
+            unit = units.get(item['unit'], item['unit']) if lang != DEFAULT_LOCALE else item['unit']
+            return f"{value} {esc(unit)}"
+
+        def step(entry, lang):
+            text = TEXT[lang]
+            rows = []
+            for item in sorted(entry[field], key=lambda item: item['rank']):
+                note = item.get('note')
+                note = note[lang] if is_localized(note) else (note or '')
+                rows.append(f"                <tr><td>{item['rank']}</td>"
+                            f"<td>{esc(refs.name(item['type'], item['entityId'], lang))}</td>"
+                            f"<td>{cell(item, lang)}</td><td>{esc(note)}</td></tr>")
+            return f'''<table>
+            <thead>
+                <tr><th>{text['rank']}</th><th>{text['name']}</th><th>{text['value']}</th><th>{text['note']}</th></tr>
+            </thead>
+            <tbody>
+{chr(10).join(rows)}
+            </tbody>
+        </table>'''
+        return step
+
+
+class Links:
+    """Enlaces de afiliado con su aviso"""
+
+    def __init__(self, field, label='label', url='url', note='disclosure'):
+        self.field, self.label, self.url, self.note = field, label, url, note
+
+    def compile(self, entries, refs):
+        sample = item_sample(entries, self.field)
+        if sample is None:
+            return lambda entry, lang: ''
+        field = self.field
+        label, url, note = (compile_field(spec, sample, refs)[0] for spec in (self.label, self.url, self.note))
+        return lambda entry, lang: join(
+            f'''<div class="affiliate-cta" data-partner="{escape(item.get('partner', ''))}">
+            <p><a href="{escape(url(item, lang))}" rel="sponsored nofollow noopener" target="_blank">{esc(label(item, lang))}</a></p>
+            <p><small>{esc(note(item, lang))}</small></p>
+        </div>''' for item in entry.get(field, ()))
+
+
+class Sources:
+    """Lista de fuentes externas"""
+
+    def __init__(self, field, name='name', url='url'):
+        self.field, self.name, self.url = field, name, url
+
+    def compile(self, entries, refs):
+        sample = item_sample(entries, self.field)
+        if sample is None:
+            return lambda entry, lang: ''
+        field = self.field
+        name, url = compile_field(self.name, sample, refs)[0], compile_field(self.url, sample, refs)[0]
+
+        def step(entry, lang):
+            items = '\n'.join(
+                f'            <li><a href="{escape(url(s, lang))}" rel="nofollow noopener" target="_blank">{esc(name(s, lang))}</a></li>'
+                for s in entry.get(field, ()))
+            return f"<h2>{TEXT[lang]['sources']}</h2>\n\n        <ul>\n{items}\n        </ul>" if items else ''
+        return step
+
+
+class Nearby:
+    """
+    Lugares cercanos a la entidad de la entrada (spatial_index.py): los k
+    más cercanos o, con radius_km, los que están a menos de esa distancia.
+    link es la ruta de la página de cada lugar ('travel/transport/{slug}').
+    """
+
+    def __init__(self, key, kind, target, title, k=3, radius_km=None, link=None):
+        self.key, self.kind, self.target, self.title = key, kind, target, title
+        self.k, self.radius_km, self.link = k, radius_km, link
+
+    def compile(self, entries, refs):
+        key, kind, target, title, link = self.key, self.kind, self.target, self.title, self.link
+        if self.radius_km is None:
+            query = lambda entity_id: refs.places.nearest(kind, entity_id, target, self.k)
+        else:
+            query = lambda entity_id: refs.places.within(kind, entity_id, target, self.radius_km)
+        # El bloque depende solo de la entidad y el idioma: se renderiza una vez
+        fragments = {}
+
+        def step(entry, lang):
+            fragment_key = (entry[key], lang)
+            fragment = fragments.get(fragment_key)
+            if fragment is None:
+                items = []
+                for place, km in query(entry[key]):
+                    name = esc(place.name[lang])
+                    if link and place.slugs:
+                        name = f'<a href="/{locale_path(link.format(slug=place.slugs[lang]), lang)}/">{name}</a>'
+                    items.append(f"            <li>{name} ({format_number(round(km), lang)} km)</li>")
+                fragment = fragments[fragment_key] = (
+                    f"<h2>{title[lang]}</h2>\n\n        <ul>\n{chr(10).join(items)}\n        </ul>" if items else '')
+            return fragment
+        return step
+
+
+Collection = namedtuple('Collection', 'name file key path slug title description blocks updated schema_type',
+                        defaults=('lastUpdated', 'Article'))
+
+COLLECTIONS = (
+    Collection(
+        name='travel-guides', file='guides/travel.json', key='guides',
+        path='travel/guides/{slug}', slug='slugs', title='title', description='description',
+        blocks=(Text('overview'), Sections('sections'), Links('affiliateCTAs'), Faq('faq'), Sources('sources')),
+    ),
+    Collection(
+        name='fan-guides', file='guides/fan.json', key='guides',
+        path='fan/guides/{slug}', slug='slugs', title='title', description='description',
+        blocks=(Text('overview'), Sections('sections'), Links('affiliateCTAs'), Faq('faq'), Sources('sources')),
+    ),
+    Collection(
+        name='listicles', file='programmatic/listicles.json', key='listicles',
+        path='world-cup-2026/rankings/{slug}', slug='slug', title='title', description='description',
+        blocks=(Text('description'), Ranking('items', units={
+            'personas': 'people',
+            'puntuacion /10': 'score /10',
+            'USD/noche hotel': 'USD/night (hotel)',
+            'USD/noche': 'USD/night',
+            'USD/dia estimado': 'USD/day (estimated)',
+            'habitantes metro': 'metro population',
+            'grados C promedio junio': '°C June average',
+            'ano apertura': 'year opened',
+            'ano renovacion': 'year renovated',
+        })),
+    ),
+    Collection(
+        name='answers', file='faq-pages.json', key='pages',
+        path='answers/{slug}', slug='slug', title='question', description='shortAnswer',
+        blocks=(Text('shortAnswer'), Sections('sections', body='body')),
+        updated=None,
+    ),
+    Collection(
+        name='match-day', file='programmatic/match-day-guides.json', key='guides',
+        path='world-cup-2026/match-day/{slug}', slug='slug',
+        title=Format({'es': 'Día de partido en {city}',
+                      'en': 'Match day in {city}'}, {'city': Ref('cityId', 'city')}),
+        description=Format({'es': 'Guía del día de partido en {city}: cuándo llegar al {stadium}, transporte, '
+                                  'zonas de fans, comida y qué llevar al Mundial 2026.',
+                            'en': 'Match day guide for {city}: when to arrive at {stadium}, transport, fan zones, '
+                                  'food and what to bring to the 2026 World Cup.'},
+                           {'city': Ref('cityId', 'city'), 'stadium': Ref('stadium', 'stadium')}),
+        blocks=(
+            Text(Format({'es': 'Llega al {stadium} al menos {hours} horas antes del partido.',
+                         'en': 'Get to {stadium} at least {hours} hours before kick-off.'},
+                        {'stadium': Ref('stadium', 'stadium'), 'hours': 'arriveHours'})),
+            Fields((
+                ('transport', {'es': 'Cómo llegar al estadio', 'en': 'Getting to the stadium'}),
+                ('fanZones', {'es': 'Zonas de fans', 'en': 'Fan zones'}),
+                ('food', {'es': 'Dónde comer', 'en': 'Where to eat'}),
+                ('whatToBring', {'es': 'Qué llevar', 'en': 'What to bring'}),
+                ('weatherWarning', {'es': 'Clima', 'en': 'Weather'}),
+            )),
+            Nearby('cityId', 'city', 'city', {'es': 'Sedes más cercanas', 'en': 'Nearest host cities'},
+                   k=3, link='travel/transport/{slug}'),
+            Nearby('stadium', 'stadium', 'stadium',
+                   {'es': 'Otros estadios a menos de 500 km', 'en': 'Other stadiums within 500 km'}, radius_km=500),
+        ),
+    ),
+)
+
+
+class RenderPlan:
+    """Esquema de una colección compilado contra la forma de sus entradas"""
+
+    def __init__(self, collection, entries, refs):
+        self.collection = collection
+        self.path_template = collection.path
+        self.slug = compile_field(collection.slug, entries[0], refs)[0]
+        self.title, localized = compile_field(collection.title, entries[0], refs)
+        self.description = compile_field(collection.description, entries[0], refs)[0]
+        self.updated = collection.updated if collection.updated in entries[0] else None
+        # Una colección sin traducir se publica solo en el idioma principal
+        self.locales = LOCALES if localized else (DEFAULT_LOCALE,)
+        self.steps = tuple(block.compile(entries, refs) for block in collection.blocks)
+        self.faqs = tuple(block.compile_pairs(entries, refs) for block in collection.blocks if isinstance(block, Faq))
+
+    def page_path(self, entry, lang):
+        return locale_path(self.path_template.format(slug=self.slug(entry, lang)), lang)
+
+    def render(self, entry, lang, crumbs=None, langs=LOCALES):
+        """Página completa de una entrada"""
+        try:
+            title = self.title(entry, lang)
+            path = self.page_path(entry, lang)
+            body = join(html for html in (step(entry, lang) for step in self.steps) if html)
+            faqs = [pair for get in self.faqs for pair in get(entry, lang)]
+            description = self.description(entry, lang)
+        except (KeyError, TypeError, IndexError) as e:
+            entry_id = entry.get('id') or entry.get('slug')
+            raise CollectionError(f"{self.collection.name}: la entrada {entry_id} no tiene {e}") from None
+        if crumbs is None:
+            crumbs = [(path, title)]
+        return render_page(
+            title=title,
+            description=description,
+            keywords=f"{title.lower()}, mundial 2026, world cup 2026",
+            path=path,
+            crumbs=crumbs,
+            body_html=body,
+            h1=title,
+            schema_type=self.collection.schema_type,
+            lang=lang,
+            alternates={alt: self.page_path(entry, alt) for alt in self.locales if alt in langs},
+            faqs=faqs,
+            date_published=entry.get(self.updated) if self.updated else None,
+        )
+
+
+def load_collections(collections=COLLECTIONS, content_dir=CONTENT_DIR):
+    """[(plan, entradas)] de las colecciones con entradas"""
+    refs = Refs(content_dir)
+    plans = []
+    for collection in collections:
+        entries = load_collection(collection.file, collection.key, content_dir)
+        if entries:
+            plans.append((RenderPlan(collection, entries, refs), entries))
+    return plans
+
+
+def claim_collection_pages(trie, plans):
+    """Reserva en el trie las rutas en español de todas las entradas"""
+    for plan, entries in plans:
+        for entry in entries:
+            trie.claim(plan.page_path(entry, DEFAULT_LOCALE), STAGE, plan.title(entry, DEFAULT_LOCALE))
+
+
+def collection_routes(trie, plans, langs=LOCALES):
+    """Route de cada entrada de las colecciones en sus idiomas"""
+    for plan, entries in plans:
+        for lang in plan.locales:
+            if lang not in langs:
+                continue
+            for entry in entries:
+                yield stage_route(trie, plan.page_path(entry, lang), partial(plan.render, entry, lang, langs=langs))
+
+
+def build_collection_pages(trie, plans, write, langs=LOCALES):
+    """Escribe las páginas de todas las colecciones en sus idiomas; devuelve el número de páginas"""
+    return write_routes(collection_routes(trie, plans, langs), write)
@@ -0,0 +1,247 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Comparativas entre sedes a partir de content/programmatic/city-comparisons.json,
+en español (/travel/compare/<slug>/) e inglés (/en/travel/compare/<slug>/).
+
+Cada página repite para las dos ciudades el mismo bloque (descripción,
+estadio, clima, costos). Ese bloque se renderiza una vez por (ciudad,
+idioma) y las páginas se componen desde la caché, así que el costo crece
+con el número de ciudades y no con el de pares. Con all_pairs=True se
+generan los 120 pares posibles en lugar de los del JSON.
+"""
+
+from functools import partial
+from itertools import combinations
+
+from content_store import CONTENT_DIR, by_id, city_metric, load_collection
+from page_shell import LOCALES, esc, format_number, locale_path, paragraphs, render_page
+from url_trie import stage_route, write_routes
+
+COMPARE_PATH = 'travel/compare'
+STAGE = 'compare'
+
+# (clave, etiqueta es, etiqueta en, formato, mejor valor: 'low', 'high' o None)
+METRICS = (
+    ('costPerNight', 'Hotel por noche', 'Hotel per night', 'US${}', 'low'),
+    ('metroBudgetMeal', 'Comida económica', 'Budget meal', 'US${}', 'low'),
+    ('transportScore', 'Transporte público', 'Public transport', '{}/10', 'high'),
+    ('safetyIndex', 'Seguridad', 'Safety', '{}/10', 'high'),
+    ('weatherJuneAvg', 'Temperatura media en junio', 'Average June temperature', '{} °C', None),
+    ('altitude', 'Altitud', 'Altitude', '{} m', None),
+    ('stadiumCapacity', 'Capacidad del estadio', 'Stadium capacity', '{}', None),
+    ('airportCode', 'Aeropuerto', 'Airport', '{}', None),
+)
+
+TEXT = {
+    'es': {
+        'index_title': 'Comparativas entre sedes',
+        'index_intro': 'Compara las sedes del Mundial 2026 de dos en dos: precio del hotel, transporte, clima y seguridad.',
+        'title': '{a} vs {b}: comparación para el Mundial 2026',
+        'description': 'Compara {a} y {b} para el Mundial 2026: costos, transporte, clima y seguridad para elegir tu sede.',
+        'intro': '¿Dudas entre {a} y {b}? Comparamos las dos sedes del Mundial 2026 en precio, transporte, clima y seguridad.',
+        'metrics': 'Comparación rápida',
+        'metric': 'Dato',
+        'better': 'mejor opción',
+        'recommendation': 'Nuestra recomendación',
+        'reasons': {'budget': 'Presupuesto', 'transport': 'Transporte', 'weather': 'Clima',
+                    'nightlife': 'Vida nocturna', 'families': 'Familias'},
+        'tie': 'Empate',
+        'stadium': 'Estadio',
+        'capacity': 'espectadores',
+        'costs': 'Hotel desde US${night} por noche; comida económica desde US${meal}.',
+    },
+    'en': {
+        'index_title': 'Host city comparisons',
+        'index_intro': 'Compare 2026 World Cup host cities two at a time: hotel prices, transport, weather and safety.',
+        'title': '{a} vs {b}: World Cup 2026 comparison',
+        'description': 'Compare {a} and {b} for the 2026 World Cup: costs, transport, weather and safety to choose your host city.',
+        'intro': 'Torn between {a} and {b}? We compare both 2026 World Cup host cities on price, transport, weather and safety.',
+        'metrics': 'Quick comparison',
+        'metric': 'Metric',
+        'better': 'better option',
+        'recommendation': 'Our recommendation',
+        'reasons': {'budget': 'Budget', 'transport': 'Transport', 'weather': 'Weather',
+                    'nightlife': 'Nightlife', 'families': 'Families'},
+        'tie': 'Tie',
+        'stadium': 'Stadium',
+        'capacity': 'spectators',
+        'costs': 'Hotels from US${night} per night; budget meals from US${meal}.',
+    },
+}
+
+
+def comparison_path(slug, lang):
+    return locale_path(f"{COMPARE_PATH}/{slug}", lang)
+
+
+def index_path(lang):
+    return locale_path(COMPARE_PATH, lang)
+
+
+def pair_slugs(city1, city2):
+    """Slugs de un par que no está en city-comparisons.json"""
+    return {lang: f"{city1['slugs'][lang]}-vs-{city2['slugs'][lang]}" for lang in ('es', 'en')}
+
+
+class ComparisonRenderer:
+    """Compone las comparativas a partir de los bloques por ciudad"""
+
+    def __init__(self, cities, stadiums, comparisons):
+        self.cities = by_id(cities)
+        self.stadiums = by_id(stadiums)
+        self.metrics = {key: city_metric(comparisons, key) for key, *_ in METRICS}
+        self._fragments = {}
+
+    def city_fragment(self, city_id, lang):
+        """Bloque de una ciudad, renderizado una sola vez por idioma"""
+        key = (city_id, lang)
+        fragment = self._fragments.get(key)
+        if fragment is None:
+            city = self.cities[city_id]
+            stadium = self.stadiums[city['stadium']]
+            text = TEXT[lang]
+            weather = city['content']['weather']
+            first_paragraph = weather['content'][lang].split('\n\n')[0]
+            capacity = format_number(stadium['capacity'], lang)
+            costs = text['costs'].format(night=self.metrics['costPerNight'][city_id],
+                                         meal=self.metrics['metroBudgetMeal'][city_id])
+            fragment = self._fragments[key] = f'''<h2>{esc(city['name'][lang])}</h2>
+
+        <p>{esc(city['description'][lang])}</p>
+
+        <p><strong>{text['stadium']}:</strong> {esc(stadium['name'][lang])} ({capacity} {text['capacity']})</p>
+
+        <h3>{esc(weather['title'][lang])}</h3>
+
+        {paragraphs(first_paragraph)}
+
+        <p>{costs}</p>'''
+        return fragment
+
+    def metrics_table(self, city1, city2, lang):
+        """Tabla de métricas con la mejor opción marcada"""
+        text = TEXT[lang]
+        names = [esc(self.cities[c]['name'][lang]) for c in (city1, city2)]
+        rows = []
+        for key, label_es, label_en, fmt, better in METRICS:
+            values = [self.metrics[key][c] for c in (city1, city2)]
+            cells = []
+            for value, other in zip(values, reversed(values)):
+                cell = fmt.format(format_number(value, lang) if isinstance(value, int) else value)
+                if better and value != other and (value < other) == (better == 'low'):
+                    cell += f" ({text['better']})"
+                cells.append(f"<td>{cell}</td>")
+            label = label_es if lang == 'es' else label_en
+            rows.append(f"                <tr><th>{label}</th>{''.join(cells)}</tr>")
+        return f'''<h2>{text['metrics']}</h2>
+
+        <table>
+            <thead>
+                <tr><th>{text['metric']}</th><th>{names[0]}</th><th>{names[1]}</th></tr>
+            </thead>
+            <tbody>
+{chr(10).join(rows)}
+            </tbody>
+        </table>'''
+
+    def recommendation(self, comparison, lang):
+        text = TEXT[lang]
+        items = []
+        for reason, winner in comparison['recommendation'].items():
+            name = esc(self.cities[winner]['name'][lang]) if winner in self.cities else text['tie']
+            items.append(f"            <li><strong>{text['reasons'].get(reason, reason)}:</strong> {name}</li>")
+        return f"<h2>{text['recommendation']}</h2>\n\n        <ul>\n{chr(10).join(items)}\n        </ul>"
+
+    def render_pair(self, city1, city2, slugs, lang, comparison=None, crumbs=None, langs=LOCALES):
+        """Página de una comparativa; comparison añade la recomendación del JSON"""
+        text = TEXT[lang]
+        a, b = (self.cities[c]['name'][lang] for c in (city1, city2))
+        title = text['title'].format(a=a, b=b)
+        path = comparison_path(slugs[lang], lang)
+        parts = [f"<p>{esc(text['intro'].format(a=a, b=b))}</p>", self.metrics_table(city1, city2, lang)]
+        if comparison:
+            parts.append(self.recommendation(comparison, lang))
+        parts += [self.city_fragment(city1, lang), self.city_fragment(city2, lang)]
+        if crumbs is None:
+            crumbs = [(index_path(lang), text['index_title']), (path, f"{a} vs {b}")]
+        return render_page(
+            title=title,
+            description=text['description'].format(a=a, b=b),
+            keywords=f"{a.lower()} vs {b.lower()}, {b.lower()} vs {a.lower()}, mundial 2026, world cup 2026",
+            path=path,
+            crumbs=crumbs,
+            body_html='\n\n        '.join(parts),
+            h1=title,
+            lang=lang,
+            alternates={alt: comparison_path(slugs[alt], alt) for alt in langs},
+        )
+
+    def render_index(self, pairs, lang, crumbs=None, langs=LOCALES):
+        """Índice con todas las comparativas generadas"""
+        text = TEXT[lang]
+        items = []
+        for city1, city2, slugs, _ in pairs:
+            a, b = (esc(self.cities[c]['name'][lang]) for c in (city1, city2))
+            items.append(f'            <li><a href="/{comparison_path(slugs[lang], lang)}/">{a} vs {b}</a></li>')
+        if crumbs is None:
+            crumbs = [(index_path(lang), text['index_title'])]
+        return render_page(
+            title=text['index_title'],
+            description=text['index_intro'],
+            keywords='comparar sedes mundial 2026, world cup 2026 host city comparison',
+            path=index_path(lang),
+            crumbs=crumbs,
+            body_html=f"<p>{text['index_intro']}</p>\n\n        <ul>\n{chr(10).join(items)}\n        </ul>",
+            schema_type='CollectionPage',
+            lang=lang,
+            alternates={alt: index_path(alt) for alt in langs},
+        )
+
+
+def comparison_pairs(cities, comparisons, all_pairs=False):
+    """
+    [(city1, city2, slugs, comparison o None)] a generar. Un par aparece una
+    sola vez aunque el JSON lo liste en los dos sentidos (se queda el primero).
+    """
+    pairs, listed = [], set()
+    for c in comparisons:
+        pair = frozenset((c['city1'], c['city2']))
+        if pair not in listed:
+            listed.add(pair)
+            pairs.append((c['city1'], c['city2'], c['slugs'], c))
+    if all_pairs:
+        pairs += [(c1['id'], c2['id'], pair_slugs(c1, c2), None)
+                  for c1, c2 in combinations(cities, 2)
+                  if frozenset((c1['id'], c2['id'])) not in listed]
+    return pairs
+
+
+def load_comparisons(content_dir=CONTENT_DIR, all_pairs=False):
+    """(renderer, pares) desde content/"""
+    cities = load_collection('cities.json', 'cities', content_dir)
+    comparisons = load_collection('programmatic/city-comparisons.json', 'comparisons', content_dir)
+    renderer = ComparisonRenderer(cities, load_collection('stadiums.json', 'stadiums', content_dir), comparisons)
+    return renderer, comparison_pairs(cities, comparisons, all_pairs)
+
+
+def claim_comparison_pages(trie, renderer, pairs):
+    """Reserva en el trie las rutas en español (índice y comparativas)"""
+    trie.claim(COMPARE_PATH, STAGE, TEXT['es']['index_title'])
+    for city1, city2, slugs, _ in pairs:
+        names = (renderer.cities[c]['name']['es'] for c in (city1, city2))
+        trie.claim(comparison_path(slugs['es'], 'es'), STAGE, ' vs '.join(names))
+
+
+def comparison_routes(trie, renderer, pairs, langs=LOCALES):
+    """Route del índice y de cada comparativa en todos los idiomas"""
+    for lang in langs:
+        yield stage_route(trie, index_path(lang), partial(renderer.render_index, pairs, lang, langs=langs), index=True)
+        for city1, city2, slugs, comparison in pairs:
+            yield stage_route(trie, comparison_path(slugs[lang], lang),
+                              partial(renderer.render_pair, city1, city2, slugs, lang, comparison, langs=langs))
+
+
+def build_comparison_pages(trie, renderer, pairs, write, langs=LOCALES):
+    """Escribe índice y comparativas en todos los idiomas; devuelve el número de páginas"""
+    return write_routes(comparison_routes(trie, renderer, pairs, langs), write)
@@ -0,0 +1,222 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Análisis de páginas de la competencia guardadas en local (sin descargar nada).
+
+Lee una carpeta con HTML guardado (por ejemplo con "Guardar como" del
+navegador), extrae en un pool de procesos el texto y los encabezados de
+cada página y, para cada keyword del CSV, calcula:
+- los términos con más TF-IDF entre las páginas que tratan esa keyword
+  (las que contienen todos sus términos)
+- los temas de encabezado (h1-h3, palabras y pares de palabras) y qué
+  fracción de esas páginas los cubre
+
+Con --site se compara con la página propia de cada keyword y el reporte
+marca los términos y temas que faltan. seo_content_rewriter.py lee ese
+reporte compacto (competitor-gaps.json) al generar el contenido.
+
+Las páginas no se guardan: cada proceso devuelve solo sus conteos y el
+proceso principal los suma por keyword, recortando los términos menos
+frecuentes cuando una keyword acumula demasiados, así que la memoria no
+crece con el número de páginas.
+
+Uso:
+    python3 competitor_analysis.py CARPETA [--site DIR] [--output competitor-gaps.json] [--workers N]
+"""
+
+import argparse
+import json
+import math
+import os
+import re
+import sys
+import unicodedata
+from collections import Counter
+from html import unescape
+from multiprocessing import Pool
+from pathlib import Path
+
+from page_spec import CSV_PATH, iter_page_specs
+
+# Junto al script, donde lo busca seo_content_rewriter.py, desde cualquier carpeta
+GAPS_FILE = Path(__file__).parent / 'competitor-gaps.json'
+TOP_TERMS = 30
+TOP_HEADINGS = 15
+# Temas de encabezado que aparecen en al menos esta fracción de las páginas
+MIN_COVERAGE = 0.3
+# Términos por keyword antes de recortar a los más frecuentes
+MAX_TERMS = 5000
+
+STOPWORDS = frozenset('''
+a al algo algunos ante antes así aún cada como cómo con contra cual cuál cuales cuando cuándo de
+del desde donde dónde durante e el él ella ellas ellos en entre era es esa ese eso esta está están
+este esto estos fue ha hay la las le les lo los más me mi muy ni no nos o para pero por porque qué
+que se sea según ser si sí sin sobre su sus también te tiene tu tú un una uno unos y ya yo
+about after all also an and are as at be been but by can do for from has have how if in into is
+it its more not of on or our out so than that the their there they this to was we what when
+where which who will with you your
+'''.split())
+
+SKIP_RE = re.compile(r'<(script|style|noscript|nav|header|footer|svg)\b[^>]*>.*?</\1\s*>|<!--.*?-->', re.S | re.I)
+HEADING_RE = re.compile(r'<h([1-3])\b[^>]*>(.*?)</h\1\s*>', re.S | re.I)
+TITLE_RE = re.compile(r'<title[^>]*>(.*?)</title\s*>', re.S | re.I)
+TAG_RE = re.compile(r'<[^>]+>')
+WORD_RE = re.compile(r'[^\W_]+')
+
+
+def tokens(text):
+    """Palabras en minúsculas (con acentos, para poder usarlas en el contenido) sin stopwords"""
+    text = unicodedata.normalize('NFC', text.lower())
+    return [word for word in WORD_RE.findall(text) if word not in STOPWORDS and len(word) > 2]
+
+
+def heading_topics(headings):
+    """Palabras y pares de palabras consecutivas de los encabezados"""
+    topics = set()
+    for heading in headings:
+        words = tokens(heading)
+        topics.update(words)
+        topics.update(f"{a} {b}" for a, b in zip(words, words[1:]))
+    return topics
+
+
+def extract(path):
+    """(conteo de términos, temas de encabezado) de una página guardada"""
+    try:
+        with open(path, encoding='utf-8', errors='replace') as f:
+            html = SKIP_RE.sub(' ', f.read())
+    except OSError:
+        return None
+    headings = [unescape(TAG_RE.sub(' ', text)) for _, text in HEADING_RE.findall(html)]
+    title = TITLE_RE.search(html)
+    if title:
+        headings.append(unescape(title.group(1)))
+    text = unescape(TAG_RE.sub(' ', html))
+    return Counter(tokens(text)), heading_topics(headings)
+
+
+class KeywordStats:
+    """Conteos acumulados de las páginas que tratan una keyword"""
+    __slots__ = ('keyword', 'url', 'terms', 'docs', 'term_counts', 'heading_docs')
+
+    def __init__(self, keyword, url):
+        self.keyword = keyword
+        self.url = url
+        self.terms = frozenset(tokens(keyword))
+        self.docs = 0
+        self.term_counts = Counter()
+        self.heading_docs = Counter()
+
+    def add(self, counts, topics):
+        self.docs += 1
+        total = sum(counts.values()) or 1
+        # Frecuencia relativa: una página larga no pesa más que una corta
+        for term, count in counts.items():
+            self.term_counts[term] += count / total
+        self.heading_docs.update(topics)
+        if len(self.term_counts) > 2 * MAX_TERMS:
+            self.term_counts = Counter(dict(self.term_counts.most_common(MAX_TERMS)))
+        if len(self.heading_docs) > 2 * MAX_TERMS:
+            self.heading_docs = Counter(dict(self.heading_docs.most_common(MAX_TERMS)))
+
+
+def analyze(paths, keywords, workers=None):
+    """
+    Procesa las páginas y devuelve (páginas leídas, frecuencia documental,
+    {keyword: KeywordStats}).
+    """
+    stats = {keyword: KeywordStats(keyword, url) for keyword, url in keywords}
+    # Índice término -> keywords que lo contienen, para no comparar cada página con todas
+    by_term = {}
+    for keyword_stats in stats.values():
+        for term in keyword_stats.terms:
+            by_term.setdefault(term, []).append(keyword_stats)
+
+    document_frequency = Counter()
+    pages = 0
+    with Pool(workers) as pool:
+        for result in pool.imap_unordered(extract, paths, chunksize=16):
+            if result is None:
+                continue
+            counts, topics = result
+            pages += 1
+            document_frequency.update(counts.keys())
+            candidates = {id(s): s for term in counts.keys() & by_term.keys() for s in by_term[term]}
+            for keyword_stats in candidates.values():
+                if keyword_stats.terms and keyword_stats.terms <= counts.keys():
+                    keyword_stats.add(counts, topics)
+    return pages, document_frequency, stats
+
+
+def own_page(site_dir, url):
+    """Conteos y temas de la página propia de una URL del CSV, o None si no está generada"""
+    for candidate in (f"{url}.html", f"{url}/index.html"):
+        path = Path(site_dir) / candidate
+        if path.exists():
+            return extract(path)
+    return None
+
+
+def gap_report(pages, document_frequency, stats, site_dir=None):
+    """{keyword: resumen compacto} para las keywords con alguna página de la competencia"""
+    report = {}
+    for keyword, keyword_stats in stats.items():
+        if not keyword_stats.docs:
+            continue
+        docs = keyword_stats.docs
+        scores = {
+            term: (weight / docs) * (math.log((1 + pages) / (1 + document_frequency[term])) + 1)
+            for term, weight in keyword_stats.term_counts.items() if term not in keyword_stats.terms
+        }
+        top_terms = sorted(scores, key=scores.get, reverse=True)[:TOP_TERMS]
+        headings = [(topic, count / docs) for topic, count in keyword_stats.heading_docs.most_common()
+                    if count / docs >= MIN_COVERAGE and not set(topic.split()) <= keyword_stats.terms][:TOP_HEADINGS]
+        entry = {
+            'url': keyword_stats.url,
+            'pages': docs,
+            'terms': [[term, round(scores[term], 5)] for term in top_terms],
+            'headings': [[topic, round(coverage, 2)] for topic, coverage in headings],
+        }
+        own = own_page(site_dir, keyword_stats.url) if site_dir else None
+        if own is not None:
+            own_counts, own_topics = own
+            entry['missingTerms'] = [term for term in top_terms if term not in own_counts]
+            entry['missingHeadings'] = [topic for topic, _ in headings if topic not in own_topics]
+        report[keyword] = entry
+    return report
+
+
+def saved_pages(directory):
+    """Archivos .html/.htm de la carpeta, en orden estable"""
+    found = []
+    for root, _, names in os.walk(directory):
+        found += [os.path.join(root, name) for name in names if name.lower().endswith(('.html', '.htm'))]
+    return sorted(found)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description='Análisis de páginas de la competencia guardadas en local')
+    parser.add_argument('directory', help='carpeta con las páginas guardadas')
+    parser.add_argument('--csv', default=CSV_PATH, help='CSV de estructura (keywords)')
+    parser.add_argument('--site', help='carpeta del build para marcar lo que falta en cada página propia')
+    parser.add_argument('--output', default=str(GAPS_FILE), help='reporte JSON por keyword')
+    parser.add_argument('--workers', type=int, help='procesos (por defecto, uno por CPU)')
+    args = parser.parse_args(argv)
+
+    keywords = {}
+    for spec in iter_page_specs(args.csv, skip_placeholders=True):
+        keywords.setdefault(spec.keywords_es, spec.url)
+    paths = saved_pages(args.directory)
+    if not paths:
+        print(f"{args.directory}: no hay páginas .html", file=sys.stderr)
+        return 1
+
+    pages, document_frequency, stats = analyze(paths, keywords.items(), args.workers)
+    report = gap_report(pages, document_frequency, stats, args.site)
+    Path(args.output).write_text(json.dumps(report, ensure_ascii=False, separators=(',', ':')), encoding='utf-8')
+    print(f"{pages} páginas analizadas; {len(report)} de {len(keywords)} keywords con competencia -> {args.output}")
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,38 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Acceso de solo lectura a los JSON de content/ que comparte la app Next.js.
+Cada archivo se parsea una sola vez por proceso.
+"""
+
+import json
+from functools import lru_cache
+from pathlib import Path
+
+CONTENT_DIR = Path(__file__).resolve().parent.parent / 'content'
+
+
+@lru_cache(maxsize=None)
+def load_json(rel_path, content_dir=CONTENT_DIR):
+    """Carga content/<rel_path> (e.g. 'schedule/matches.json')"""
+    with open(Path(content_dir) / rel_path, 'r', encoding='utf-8') as f:
+        return json.load(f)
+
+
+def load_collection(rel_path, key, content_dir=CONTENT_DIR):
+    """Lista de entidades bajo la clave raíz (e.g. 'cities.json', 'cities')"""
+    return load_json(rel_path, content_dir)[key]
+
+
+def by_id(entities, key='id'):
+    """Índice {id: entidad}"""
+    return {entity[key]: entity for entity in entities}
+
+
+def city_metric(comparisons, metric):
+    """{sede: valor} de una métrica de city-comparisons.json (city1/city2)"""
+    values = {}
+    for comparison in comparisons:
+        for side in ('city1', 'city2'):
+            values.setdefault(comparison[side], comparison['metrics'][metric][side])
+    return values
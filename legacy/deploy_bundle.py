@@ -0,0 +1,270 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Empaquetado del sitio para deploy con almacenamiento direccionado por contenido.
+
+Cada archivo publicable de la carpeta de salida se guarda una sola vez en
+.build-state/blobs/<hash[:2]>/<hash> (sha256 del contenido), y el
+manifiesto {ruta: hash} describe el sitio completo. Al comparar con el
+manifiesto anterior se obtiene el delta: rutas nuevas, cambiadas y
+borradas, y los blobs que el destino todavía no tiene. Subir solo esos
+blobs más el manifiesto basta para publicar una edición de una página.
+
+Los archivos cuyo tamaño y fecha de modificación no cambiaron reutilizan
+el hash del manifiesto anterior sin volver a leerse.
+
+Para hosts que necesitan un archivo único, --export escribe el sitio (o
+solo el delta con --delta-only) en .tar.gz o .zip leyendo los blobs por
+bloques, sin cargarlos en memoria.
+
+El CLI trabaja sobre el manifiesto y el delta que dejó la etapa package
+del build; solo vuelve a empaquetar (y rota manifest.prev.json) con
+--package.
+
+Uso:
+    python3 deploy_bundle.py [--out DIR] [--package] [--export sitio.tar.gz|sitio.zip] [--delta-only] [--prune]
+"""
+
+import argparse
+import hashlib
+import json
+import os
+import shutil
+import sys
+import tarfile
+import time
+import zipfile
+from pathlib import Path
+
+STATE_DIR = '.build-state'
+BLOBS_DIR = f'{STATE_DIR}/blobs'
+MANIFEST_FILE = f'{STATE_DIR}/manifest.json'
+PREVIOUS_MANIFEST_FILE = f'{STATE_DIR}/manifest.prev.json'
+DELTA_FILE = f'{STATE_DIR}/delta.json'
+CHUNK = 1 << 20
+
+# Qué se publica: archivos del sitio, no el código ni los datos del generador
+PUBLISH_SUFFIXES = {'.html', '.css', '.js', '.xml', '.txt', '.json', '.ics',
+                    '.png', '.jpg', '.jpeg', '.webp', '.svg', '.ico'}
+EXCLUDE_FILES = {'requirements.txt', 'redirects.json', 'page_budgets.json'}
+EXCLUDE_DIRS = {STATE_DIR, '__pycache__'}
+
+
+def iter_publishable(out_dir):
+    """Rutas relativas (posix) de los archivos a publicar, en orden estable"""
+    out_dir = Path(out_dir)
+    for root, dirs, files in os.walk(out_dir):
+        dirs[:] = sorted(d for d in dirs if d not in EXCLUDE_DIRS and not d.startswith('.'))
+        for name in sorted(files):
+            if name in EXCLUDE_FILES or os.path.splitext(name)[1] not in PUBLISH_SUFFIXES:
+                continue
+            yield (Path(root) / name).relative_to(out_dir).as_posix()
+
+
+def file_hash(path):
+    digest = hashlib.sha256()
+    with open(path, 'rb') as f:
+        for block in iter(lambda: f.read(CHUNK), b''):
+            digest.update(block)
+    return digest.hexdigest()
+
+
+def load_manifest(path):
+    if not path.exists():
+        return {}
+    return json.loads(path.read_text(encoding='utf-8'))['files']
+
+
+def load_delta(out_dir):
+    """Delta guardado por el último empaquetado, o None si no hay"""
+    path = Path(out_dir) / DELTA_FILE
+    if not path.exists():
+        return None
+    return json.loads(path.read_text(encoding='utf-8'))
+
+
+class BlobStore:
+    """Blobs {sha256: bytes} en disco, uno por contenido distinto"""
+
+    def __init__(self, root):
+        self.root = Path(root)
+
+    def path(self, digest):
+        return self.root / digest[:2] / digest
+
+    def __contains__(self, digest):
+        return self.path(digest).exists()
+
+    def add(self, digest, source):
+        """Copia source al almacén si ese contenido no estaba; devuelve True si es nuevo"""
+        target = self.path(digest)
+        if target.exists():
+            return False
+        target.parent.mkdir(parents=True, exist_ok=True)
+        tmp = target.with_suffix('.tmp')
+        shutil.copyfile(source, tmp)
+        os.replace(tmp, target)
+        return True
+
+    def open(self, digest):
+        return open(self.path(digest), 'rb')
+
+    def prune(self, keep):
+        """Borra los blobs que no están en keep; devuelve cuántos"""
+        removed = 0
+        for path in self.root.glob('*/*'):
+            if path.name not in keep:
+                path.unlink()
+                removed += 1
+        return removed
+
+
+def diff_manifests(previous, current):
+    """Delta entre dos manifiestos {ruta: {hash, ...}}"""
+    added = sorted(path for path in current if path not in previous)
+    changed = sorted(path for path in current
+                     if path in previous and previous[path]['hash'] != current[path]['hash'])
+    removed = sorted(path for path in previous if path not in current)
+    known = {entry['hash'] for entry in previous.values()}
+    blobs = {}
+    for path in added + changed:
+        digest = current[path]['hash']
+        if digest not in known:
+            blobs[digest] = current[path]['size']
+    return {
+        'added': added,
+        'changed': changed,
+        'removed': removed,
+        'blobs': sorted(blobs),
+        'bytes': sum(blobs.values()),
+    }
+
+
+def package(out_dir):
+    """
+    Guarda los archivos nuevos en el almacén, escribe el manifiesto y el
+    delta respecto al anterior. Devuelve (manifiesto, delta).
+    """
+    out_dir = Path(out_dir)
+    store = BlobStore(out_dir / BLOBS_DIR)
+    manifest_path = out_dir / MANIFEST_FILE
+    previous = load_manifest(manifest_path)
+
+    current = {}
+    for rel_path in iter_publishable(out_dir):
+        source = out_dir / rel_path
+        stat = source.stat()
+        old = previous.get(rel_path)
+        if old and old['size'] == stat.st_size and old['mtime'] == stat.st_mtime_ns and old['hash'] in store:
+            digest = old['hash']
+        else:
+            digest = file_hash(source)
+            store.add(digest, source)
+        current[rel_path] = {'hash': digest, 'size': stat.st_size, 'mtime': stat.st_mtime_ns}
+
+    return current, save_manifest(out_dir, current, previous)
+
+
+def save_manifest(out_dir, current, previous=None):
+    """
+    Escribe el manifiesto (el actual pasa a manifest.prev.json) y el delta
+    respecto al anterior. Devuelve el delta.
+    """
+    out_dir = Path(out_dir)
+    manifest_path = out_dir / MANIFEST_FILE
+    if previous is None:
+        previous = load_manifest(manifest_path)
+    delta = diff_manifests(previous, current)
+    manifest_path.parent.mkdir(parents=True, exist_ok=True)
+    if manifest_path.exists():
+        os.replace(manifest_path, out_dir / PREVIOUS_MANIFEST_FILE)
+    manifest_path.write_text(json.dumps({'version': 1, 'files': current}, indent=1), encoding='utf-8')
+    (out_dir / DELTA_FILE).write_text(json.dumps(delta, indent=1), encoding='utf-8')
+    return delta
+
+
+def checkout(out_dir, manifest, target_dir=None):
+    """
+    Escribe en target_dir (por defecto out_dir) los archivos del manifiesto
+    desde el almacén de out_dir, solo los que faltan o tienen otro
+    contenido. Devuelve cuántos escribió.
+    """
+    out_dir = Path(out_dir)
+    target_dir = out_dir if target_dir is None else Path(target_dir)
+    store = BlobStore(out_dir / BLOBS_DIR)
+    written = 0
+    for rel_path, entry in manifest.items():
+        target = target_dir / rel_path
+        if target.exists() and target.stat().st_size == entry['size'] and file_hash(target) == entry['hash']:
+            continue
+        target.parent.mkdir(parents=True, exist_ok=True)
+        shutil.copyfile(store.path(entry['hash']), target)
+        written += 1
+    return written
+
+
+def export_archive(out_dir, manifest, target, paths=None):
+    """
+    Escribe las rutas (todas por defecto) en un .tar.gz o .zip leyendo los
+    blobs por bloques. Devuelve el número de archivos.
+    """
+    store = BlobStore(Path(out_dir) / BLOBS_DIR)
+    paths = sorted(manifest) if paths is None else paths
+    target = str(target)
+    if target.endswith('.zip'):
+        with zipfile.ZipFile(target, 'w', zipfile.ZIP_DEFLATED) as archive:
+            for rel_path in paths:
+                entry = manifest[rel_path]
+                info = zipfile.ZipInfo(rel_path, time.localtime(entry['mtime'] // 1_000_000_000)[:6])
+                info.compress_type = zipfile.ZIP_DEFLATED
+                with store.open(entry['hash']) as src, archive.open(info, 'w') as dst:
+                    shutil.copyfileobj(src, dst, CHUNK)
+    else:
+        # 'w|gz': modo flujo, el archivo se escribe secuencialmente sin buscar hacia atrás
+        with open(target, 'wb') as f, tarfile.open(fileobj=f, mode='w|gz') as archive:
+            for rel_path in paths:
+                entry = manifest[rel_path]
+                info = tarfile.TarInfo(rel_path)
+                info.size = entry['size']
+                info.mtime = entry['mtime'] // 1_000_000_000
+                with store.open(entry['hash']) as src:
+                    archive.addfile(info, src)
+    return len(paths)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description='Paquete de deploy direccionado por contenido')
+    parser.add_argument('--out', default=str(Path(__file__).parent), help='carpeta de salida del build')
+    parser.add_argument('--package', action='store_true',
+                        help='volver a empaquetar la carpeta de salida (nuevo manifiesto y delta)')
+    parser.add_argument('--export', help='escribir el sitio en un .tar.gz o .zip')
+    parser.add_argument('--delta-only', action='store_true',
+                        help='exportar solo las rutas nuevas o cambiadas')
+    parser.add_argument('--prune', action='store_true',
+                        help='borrar los blobs que no usan el manifiesto actual ni el anterior')
+    args = parser.parse_args(argv)
+
+    out_dir = Path(args.out)
+    if args.package:
+        manifest, delta = package(out_dir)
+    else:
+        manifest, delta = load_manifest(out_dir / MANIFEST_FILE), load_delta(out_dir)
+        if not manifest or delta is None:
+            parser.error(f"no hay manifiesto en {out_dir / STATE_DIR}: ejecuta el build o usa --package")
+    print(f"{len(manifest)} archivos: {len(delta['added'])} nuevos, {len(delta['changed'])} cambiados, "
+          f"{len(delta['removed'])} borrados; subir {len(delta['blobs'])} blobs "
+          f"({delta['bytes'] / 1024:.0f} KB)")
+
+    if args.export:
+        paths = delta['added'] + delta['changed'] if args.delta_only else None
+        count = export_archive(out_dir, manifest, args.export, paths)
+        print(f"Exportados {count} archivos a {args.export}")
+    if args.prune:
+        keep = {entry['hash'] for entry in manifest.values()}
+        keep |= {entry['hash'] for entry in load_manifest(out_dir / PREVIOUS_MANIFEST_FILE).values()}
+        print(f"{BlobStore(out_dir / BLOBS_DIR).prune(keep)} blobs borrados")
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
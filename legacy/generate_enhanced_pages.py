@@ -1,8 +1,10 @@
 #!/usr/bin/env python3
 # -*- coding: utf-8 -*-
-import csv
 import os
 from pathlib import Path
+from page_spec import iter_page_specs, crumbs as spec_crumbs
+from page_shell import page_description, page_title, render_breadcrumb
+from structured_data import json_ld
 from pexels_integration import get_relevant_image_for_page, generate_image_html, get_multiple_images_for_content, insert_images_in_content
 
 # Content templates for specific topics
@@ -296,11 +298,9 @@ def get_content_section_images(tema: str, url: str, content: str) -> list:
     
     return images
 
-def generate_specific_content(row):
+def generate_specific_content(spec):
     """Generate specific, unique content based on page type"""
-    tema = row['Página / Tema']
-    url = row['URL sugerida'].strip('/')
-    intencion = row['Intención']
+    url = spec.url
     
     # Check if it's a city page
     city_content = get_city_content(url)
@@ -415,12 +415,12 @@ def generate_specific_content(row):
     
     # Add more specific content templates as needed
     # For now, return generic content
-    return generate_generic_content(row)
+    return generate_generic_content(spec)
 
-def generate_generic_content(row):
+def generate_generic_content(spec):
     """Generate generic but SEO-optimized content"""
-    tema = row['Página / Tema']
-    intencion = row['Intención']
+    tema = spec.tema
+    intencion = spec.intent
     
     if intencion == 'Informacional':
         return f'''
@@ -471,33 +471,22 @@ def generate_generic_content(row):
         <p>Además de esta guía, proporcionamos recursos adicionales y herramientas para ayudarte en tu planificación. Estos recursos incluyen comparaciones detalladas, consejos de expertos, y acceso a información actualizada sobre el Mundial 2026.</p>
         '''
 
-def create_html_page(row, base_url="https://www.superfan.com"):
-    """Create a complete HTML page from CSV row"""
-    tema = row['Página / Tema']
-    h1 = row['H1 ejemplo']
-    keywords_en, keywords_es = row['Keywords objetivo (EN/ES)'].split(' / ')
-    url = row['URL sugerida'].strip('/')
-    intencion = row['Intención']
+def create_html_page(spec, base_url="https://www.superfan.com", crumbs=None):
+    """Create a complete HTML page from a PageSpec"""
+    tema = spec.tema
+    h1 = spec.h1
+    keywords_en, keywords_es = spec.keywords_en, spec.keywords_es
+    url = spec.url
+    intencion = spec.intent
     
     # Generate title and description
-    title = f"{h1} | Mundial 2026"
-    description = f"Información completa sobre {tema.lower()} para el Mundial 2026. {h1}. Guía detallada con toda la información que necesitas sobre {keywords_es} en la Copa del Mundo 2026."
+    title = page_title(h1)
+    description = page_description(f"Información completa sobre {tema.lower()} para el Mundial 2026.", f"{h1}.",
+                                   f"Guía detallada con toda la información que necesitas sobre {keywords_es} en la Copa del Mundo 2026.")
     
-    # Build breadcrumb
-    breadcrumb_parts = url.split('/')
-    breadcrumb_html = '<div class="breadcrumb">\n            <a href="/">Inicio</a>'
-    current_path = ""
-    for i, part in enumerate(breadcrumb_parts):
-        if part:
-            current_path += f"/{part}"
-            part_name = part.replace('-', ' ').title()
-            if part == breadcrumb_parts[-1] or '[' in part:
-                breadcrumb_html += f' > <span>{part_name}</span>'
-            else:
-                breadcrumb_html += f' > <a href="{current_path}/">{part_name}</a>'
-    breadcrumb_html += '\n        </div>'
+    crumbs = crumbs or spec_crumbs(spec)
     
-    content = generate_specific_content(row)
+    content = generate_specific_content(spec)
     
     # Obtener imagen principal relevante de Pexels
     image_data = get_relevant_image_for_page(tema, url, intencion)
@@ -520,13 +509,13 @@ def create_html_page(row, base_url="https://www.superfan.com"):
     <meta charset="UTF-8">
     <meta name="viewport" content="width=device-width, initial-scale=1.0">
     <title>{title}</title>
-    <meta name="description" content="{description[:160]}">
+    <meta name="description" content="{description}">
     <meta name="keywords" content="{keywords_en}, {keywords_es}, mundial 2026, world cup 2026">
     <meta name="robots" content="index, follow">
     <link rel="canonical" href="{base_url}/{url}/">
     
     <meta property="og:title" content="{h1}">
-    <meta property="og:description" content="{description[:200]}">
+    <meta property="og:description" content="{description}">
     <meta property="og:type" content="website">
     <meta property="og:url" content="{base_url}/{url}/">
     {og_image_tag}
@@ -535,29 +524,12 @@ def create_html_page(row, base_url="https://www.superfan.com"):
     
     <meta name="twitter:card" content="summary_large_image">
     <meta name="twitter:title" content="{h1}">
-    <meta name="twitter:description" content="{description[:200]}">
+    <meta name="twitter:description" content="{description}">
     {twitter_image_tag}
     
     <link rel="stylesheet" href="/styles.css">
     
-    <script type="application/ld+json">
-    {{
-        "@context": "https://schema.org",
-        "@type": "Article",
-        "headline": "{h1}",
-        "description": "{description[:200]}",
-        "author": {{
-            "@type": "Organization",
-            "name": "SuperFan Mundial 2026"
-        }},
-        "datePublished": "2024-01-01",
-        "dateModified": "2024-01-01",
-        "mainEntityOfPage": {{
-            "@type": "WebPage",
-            "@id": "{base_url}/{url}/"
-        }}
-    }}
-    </script>
+    {json_ld(url, h1, description, base_url=base_url, date_published='2024-01-01', crumbs=crumbs)}
 </head>
 <body>
     <header>
@@ -573,7 +545,7 @@ def create_html_page(row, base_url="https://www.superfan.com"):
     </header>
 
     <main class="container">
-        {breadcrumb_html}
+        {render_breadcrumb(crumbs)}
 
         <h1>{h1}</h1>
 
@@ -597,26 +569,19 @@ def main():
     """Main function to generate all pages from CSV"""
     base_dir = Path(__file__).parent
     
-    with open('seo_world_cup_structure.csv', 'r', encoding='utf-8') as f:
-        reader = csv.DictReader(f)
-        for row in reader:
-            url = row['URL sugerida'].strip('/')
-            if not url or url.startswith('['):  # Skip placeholder URLs
-                continue
-            
-            # Create directory structure
-            path_parts = url.split('/')
-            if len(path_parts) > 1:
-                dir_path = base_dir / '/'.join(path_parts[:-1])
-                dir_path.mkdir(parents=True, exist_ok=True)
-            
-            # Generate HTML
-            html = create_html_page(row)
-            
-            # Write file
-            file_path = base_dir / f"{url}.html"
-            file_path.write_text(html, encoding='utf-8')
-            print(f"Generated: {url}.html")
+    for spec in iter_page_specs(skip_placeholders=True):
+        # Create directory structure
+        if len(spec.path_parts) > 1:
+            dir_path = base_dir / '/'.join(spec.path_parts[:-1])
+            dir_path.mkdir(parents=True, exist_ok=True)
+        
+        # Generate HTML
+        html = create_html_page(spec)
+        
+        # Write file
+        file_path = base_dir / spec.file_path
+        file_path.write_text(html, encoding='utf-8')
+        print(f"Generated: {spec.file_path}")
 
 if __name__ == '__main__':
     main()
@@ -1,17 +1,15 @@
 #!/usr/bin/env python3
 # -*- coding: utf-8 -*-
-import csv
 import os
 from pathlib import Path
+from page_spec import iter_page_specs, crumbs as spec_crumbs
+from page_shell import page_description, page_title, render_breadcrumb
+from structured_data import json_ld
 
-def generate_content(row):
+def generate_content(spec):
     """Generate SEO-optimized content for each landing page"""
-    tema = row['Página / Tema']
-    h1 = row['H1 ejemplo']
-    keywords_en, keywords_es = row['Keywords objetivo (EN/ES)'].split(' / ')
-    intencion = row['Intención']
-    nivel = row['Nivel']
-    pilar = row['Pilar']
+    tema = spec.tema
+    intencion = spec.intent
     
     # Base content templates based on intent
     if intencion == 'Informacional':
@@ -89,33 +87,21 @@ def generate_content(row):
     
     return content
 
-def create_html_page(row, base_url="https://www.superfan.com"):
-    """Create a complete HTML page from CSV row"""
-    tema = row['Página / Tema']
-    h1 = row['H1 ejemplo']
-    keywords_en, keywords_es = row['Keywords objetivo (EN/ES)'].split(' / ')
-    url = row['URL sugerida'].strip('/')
-    intencion = row['Intención']
+def create_html_page(spec, base_url="https://www.superfan.com", crumbs=None):
+    """Create a complete HTML page from a PageSpec"""
+    tema = spec.tema
+    h1 = spec.h1
+    keywords_en, keywords_es = spec.keywords_en, spec.keywords_es
+    url = spec.url
     
     # Generate title and description
-    title = f"{h1} | Mundial 2026"
-    description = f"Información completa sobre {tema.lower()} para el Mundial 2026. {h1}. Guía detallada con toda la información que necesitas sobre {keywords_es} en la Copa del Mundo 2026."
+    title = page_title(h1)
+    description = page_description(f"Información completa sobre {tema.lower()} para el Mundial 2026.", f"{h1}.",
+                                   f"Guía detallada con toda la información que necesitas sobre {keywords_es} en la Copa del Mundo 2026.")
     
-    # Build breadcrumb
-    breadcrumb_parts = url.split('/')
-    breadcrumb_html = '<div class="breadcrumb">\n            <a href="/">Inicio</a>'
-    current_path = ""
-    for part in breadcrumb_parts:
-        if part:
-            current_path += f"/{part}"
-            part_name = part.replace('-', ' ').title()
-            if part == breadcrumb_parts[-1]:
-                breadcrumb_html += f' > <span>{part_name}</span>'
-            else:
-                breadcrumb_html += f' > <a href="{current_path}/">{part_name}</a>'
-    breadcrumb_html += '\n        </div>'
+    crumbs = crumbs or spec_crumbs(spec)
     
-    content = generate_content(row)
+    content = generate_content(spec)
     
     html = f"""<!DOCTYPE html>
 <html lang="es">
@@ -129,34 +115,17 @@ def create_html_page(row, base_url="https://www.superfan.com"):
     <link rel="canonical" href="{base_url}/{url}/">
     
     <meta property="og:title" content="{h1}">
-    <meta property="og:description" content="{description[:200]}...">
+    <meta property="og:description" content="{description}">
     <meta property="og:type" content="website">
     <meta property="og:url" content="{base_url}/{url}/">
     
     <meta name="twitter:card" content="summary_large_image">
     <meta name="twitter:title" content="{h1}">
-    <meta name="twitter:description" content="{description[:200]}...">
+    <meta name="twitter:description" content="{description}">
     
     <link rel="stylesheet" href="/styles.css">
     
-    <script type="application/ld+json">
-    {{
-        "@context": "https://schema.org",
-        "@type": "Article",
-        "headline": "{h1}",
-        "description": "{description[:200]}",
-        "author": {{
-            "@type": "Organization",
-            "name": "SuperFan Mundial 2026"
-        }},
-        "datePublished": "2024-01-01",
-        "dateModified": "2024-01-01",
-        "mainEntityOfPage": {{
-            "@type": "WebPage",
-            "@id": "{base_url}/{url}/"
-        }}
-    }}
-    </script>
+    {json_ld(url, h1, description, base_url=base_url, date_published='2024-01-01', crumbs=crumbs)}
 </head>
 <body>
     <header>
@@ -172,7 +141,7 @@ def create_html_page(row, base_url="https://www.superfan.com"):
     </header>
 
     <main class="container">
-        {breadcrumb_html}
+        {render_breadcrumb(crumbs)}
 
         <h1>{h1}</h1>
 
@@ -194,26 +163,19 @@ def main():
     """Main function to generate all pages from CSV"""
     base_dir = Path(__file__).parent
     
-    with open('seo_world_cup_structure.csv', 'r', encoding='utf-8') as f:
-        reader = csv.DictReader(f)
-        for row in reader:
-            url = row['URL sugerida'].strip('/')
-            if not url or url.startswith('['):  # Skip placeholder URLs
-                continue
-            
-            # Create directory structure
-            path_parts = url.split('/')
-            if len(path_parts) > 1:
-                dir_path = base_dir / '/'.join(path_parts[:-1])
-                dir_path.mkdir(parents=True, exist_ok=True)
-            
-            # Generate HTML
-            html = create_html_page(row)
-            
-            # Write file
-            file_path = base_dir / f"{url}.html"
-            file_path.write_text(html, encoding='utf-8')
-            print(f"Generated: {url}.html")
+    for spec in iter_page_specs(skip_placeholders=True):
+        # Create directory structure
+        if len(spec.path_parts) > 1:
+            dir_path = base_dir / '/'.join(spec.path_parts[:-1])
+            dir_path.mkdir(parents=True, exist_ok=True)
+        
+        # Generate HTML
+        html = create_html_page(spec)
+        
+        # Write file
+        file_path = base_dir / spec.file_path
+        file_path.write_text(html, encoding='utf-8')
+        print(f"Generated: {spec.file_path}")
 
 if __name__ == '__main__':
     main()
@@ -6,9 +6,12 @@ del Mundial 2026. Genera contenido listo para copiar en Word con
 formato aplicado (H1, H2, negritas, listas, FAQs).
 """
 
-import csv
 import re
 from pathlib import Path
+from page_spec import iter_page_specs, crumbs as spec_crumbs
+from slot_template import render_template
+from page_shell import page_description, page_title, render_breadcrumb
+from structured_data import faq_pairs, json_ld
 
 # Contenido específico optimizado para cada tipo de página
 CONTENT_TEMPLATES = {
@@ -1098,13 +1101,13 @@ def get_city_specific_content(city_name, url):
         return CITY_CONTENT.get(city_map[city_key])
     return None
 
-def generate_seo_content_for_page(row):
+def generate_seo_content_for_page(spec):
     """Genera contenido SEO optimizado para una página específica"""
-    tema = row['Página / Tema']
-    h1 = row['H1 ejemplo']
-    keywords_en, keywords_es = row['Keywords objetivo (EN/ES)'].split(' / ')
-    intencion = row['Intención']
-    url = row['URL sugerida'].strip('/')
+    tema = spec.tema
+    h1 = spec.h1
+    keywords_es = spec.keywords_es
+    intencion = spec.intent
+    url = spec.url
     
     # Verificar contenido específico de ciudad
     city_content = get_city_specific_content(tema, url)
@@ -1118,382 +1121,23 @@ def generate_seo_content_for_page(row):
     
     # Generar contenido basado en el tipo
     if intencion == 'Informacional':
-        return generate_informational_seo_content(tema, h1, keywords_es)
+        return generate_informational_seo_content(tema, h1, keywords_es, url)
     elif intencion == 'Comercial':
-        return generate_commercial_seo_content(tema, h1, keywords_es)
+        return generate_commercial_seo_content(tema, h1, keywords_es, url)
     else:
-        return generate_transactional_seo_content(tema, h1, keywords_es)
+        return generate_transactional_seo_content(tema, h1, keywords_es, url)
 
-def generate_informational_seo_content(tema, h1, keyword):
-    """Genera contenido informacional SEO optimizado"""
-    content = f'''# {h1}
+def generate_informational_seo_content(tema, h1, keyword, url=''):
+    """Genera contenido informacional SEO optimizado (templates/seo_informational.md)"""
+    return render_template('seo_informational', url, tema=tema, h1=h1, keyword=keyword.lower())
 
-{tema} es uno de los aspectos más importantes del **Mundial 2026** que todo fanático debe comprender. Con la expansión histórica del torneo a **48 equipos** y la celebración simultánea en **tres países** (México, Estados Unidos y Canadá), {keyword.lower()} adquiere una relevancia y complejidad sin precedentes en la historia de la Copa del Mundo.
+def generate_commercial_seo_content(tema, h1, keyword, url=''):
+    """Genera contenido comercial SEO optimizado (templates/seo_commercial.md)"""
+    return render_template('seo_commercial', url, tema=tema, h1=h1, keyword=keyword.lower())
 
-Esta guía completa te proporciona toda la información esencial que necesitas saber sobre {keyword.lower()} para el **Mundial 2026**. Ya sea que estés planificando asistir en persona o simplemente quieras estar bien informado sobre este aspecto crucial del torneo, aquí encontrarás respuestas a todas tus preguntas.
-
-## ¿Qué es {tema} y Por Qué es Importante?
-
-{tema} representa uno de los componentes fundamentales del **Mundial 2026**. Con el formato ampliado del torneo y la naturaleza trinacional del evento, {keyword.lower()} juega un papel crucial en la experiencia tanto de los equipos participantes como de los millones de fanáticos que seguirán el torneo alrededor del mundo.
-
-La importancia de {keyword.lower()} radica en varios factores clave:
-
-- **Impacto directo en la experiencia del torneo**: {keyword.lower()} afecta directamente cómo se desarrolla el evento y cómo los fanáticos lo experimentan
-
-- **Relevancia para la planificación**: Comprender {keyword.lower()} es esencial para planificar adecuadamente tu participación en el mundial
-
-- **Cambios históricos**: El formato del **Mundial 2026** introduce elementos nuevos en {keyword.lower()} que no existían en ediciones anteriores
-
-## Aspectos Clave de {tema} en el Mundial 2026
-
-Cuando se trata de {keyword.lower()} para el **Mundial 2026**, hay varios aspectos importantes que debes considerar:
-
-### Aspectos Técnicos
-
-El formato ampliado a **48 equipos** modifica significativamente {keyword.lower()} comparado con ediciones anteriores del mundial. Estos cambios técnicos afectan:
-
-- La estructura del torneo
-- La distribución de partidos
-- Los requisitos logísticos
-- La planificación necesaria
-
-### Aspectos Logísticos
-
-La celebración del torneo en **tres países diferentes** añade capas adicionales de complejidad a {keyword.lower()}. Esto incluye:
-
-- Consideraciones de viaje internacional
-- Diferentes zonas horarias
-- Variedad de infraestructuras
-- Diversidad de regulaciones locales
-
-### Aspectos Prácticos
-
-Desde la perspectiva práctica, {keyword.lower()} involucra:
-
-- Decisiones de planificación anticipada
-- Consideraciones de presupuesto
-- Evaluación de opciones disponibles
-- Toma de decisiones informadas
-
-## Cómo Afecta el Formato Ampliado a {tema}
-
-El cambio a **48 equipos** en el **Mundial 2026** tiene implicaciones significativas para {keyword.lower()}:
-
-**Más participación global**: Con más equipos participando, {keyword.lower()} adquiere mayor relevancia para más países y fanáticos alrededor del mundo.
-
-**Mayor demanda**: El formato ampliado significa más fanáticos interesados en el mundial, lo que afecta directamente {keyword.lower()}.
-
-**Nuevas oportunidades**: La expansión del torneo crea nuevas oportunidades y opciones relacionadas con {keyword.lower()}.
-
-**Complejidad aumentada**: Más equipos y más partidos significan mayor complejidad en {keyword.lower()}.
-
-## Recomendaciones para {tema}
-
-Basado en las características únicas del **Mundial 2026**, aquí tienes recomendaciones clave relacionadas con {keyword.lower()}:
-
-**Planificación anticipada**: Comienza a planificar {keyword.lower()} tan pronto como sea posible, idealmente **12-18 meses antes** del inicio del torneo.
-
-**Investigación exhaustiva**: Dedica tiempo a investigar todas las opciones disponibles relacionadas con {keyword.lower()}.
-
-**Flexibilidad**: Mantén cierta flexibilidad en tus planes para adaptarte a cambios y oportunidades que puedan surgir.
-
-**Información actualizada**: Mantente al día con los últimos anuncios oficiales relacionados con {keyword.lower()} y el mundial en general.
-
-## Consideraciones Adicionales
-
-Además de los aspectos mencionados, considera también:
-
-- El impacto de {keyword.lower()} en tu presupuesto total para el mundial
-- Cómo {keyword.lower()} se relaciona con otros aspectos de tu planificación
-- Las opciones disponibles para diferentes presupuestos y preferencias
-- Los recursos adicionales que pueden ayudarte con {keyword.lower()}
-
-## Preguntas Frecuentes sobre {tema}
-
-### ¿Cómo afecta el formato de 48 equipos a {keyword.lower()}?
-
-El formato ampliado a **48 equipos** significa que {keyword.lower()} adquiere mayor relevancia debido al aumento en participantes, partidos y demanda general del evento.
-
-### ¿Cuándo debo comenzar a planificar {keyword.lower()}?
-
-Se recomienda comenzar a planificar {keyword.lower()} al menos **12-18 meses antes** del inicio del **Mundial 2026** para asegurar mejores opciones y precios.
-
-### ¿Qué opciones hay disponibles para {keyword.lower()}?
-
-Hay múltiples opciones disponibles para diferentes presupuestos y preferencias. Es importante investigar todas las alternativas antes de tomar una decisión.
-
-### ¿Cómo puedo mantenerme actualizado sobre {keyword.lower()}?
-
-Mantente atento a los canales oficiales de FIFA y otras fuentes confiables para recibir información actualizada sobre {keyword.lower()} y el mundial en general.
-
-### ¿Qué factores debo considerar al elegir opciones para {keyword.lower()}?
-
-Factores importantes incluyen tu presupuesto, preferencias personales, fechas de viaje, ubicación deseada, y las opciones disponibles que mejor se ajusten a tus necesidades específicas.
-
-'''
-    return content
-
-def generate_commercial_seo_content(tema, h1, keyword):
-    """Genera contenido comercial SEO optimizado"""
-    content = f'''# {h1}
-
-Planificar {keyword.lower()} para el **Mundial 2026** es uno de los aspectos más importantes de tu experiencia en el torneo. Con la expansión histórica a **48 equipos** y la celebración simultánea en **tres países**, las opciones y decisiones relacionadas con {keyword.lower()} pueden afectar significativamente tanto tu experiencia como tu presupuesto.
-
-Esta guía completa te proporciona toda la información que necesitas para tomar decisiones informadas sobre {keyword.lower()} para el **Mundial 2026**. Desde opciones económicas hasta alternativas premium, exploramos todas las posibilidades para ayudarte a encontrar la mejor solución según tus necesidades específicas.
-
-## ¿Por Qué {tema} es Esencial para el Mundial 2026?
-
-{tema} juega un papel crucial en la planificación del **Mundial 2026** por varias razones:
-
-**Impacto en la experiencia**: {keyword.lower()} afecta directamente qué tan bien disfrutarás del mundial y qué tan cómoda será tu experiencia.
-
-**Impacto en el presupuesto**: {keyword.lower()} puede ser uno de los componentes más costosos de tu viaje al mundial, por lo que tomar decisiones inteligentes es fundamental.
-
-**Alta demanda esperada**: Con millones de fanáticos esperados, {keyword.lower()} tendrá una demanda sin precedentes, haciendo la planificación anticipada esencial.
-
-**Variedad de opciones**: Con múltiples ciudades sede y opciones disponibles, hay mucho que considerar cuando se trata de {keyword.lower()}.
-
-## Opciones Disponibles para {tema}
-
-Cuando se trata de {keyword.lower()} para el **Mundial 2026**, hay múltiples opciones disponibles para diferentes necesidades:
-
-### Opciones Económicas
-
-Las opciones económicas para {keyword.lower()} son perfectas para fanáticos que buscan:
-
-- Maximizar su presupuesto sin comprometer la experiencia básica
-- Ahorrar dinero para otras actividades durante el mundial
-- Enfocarse en la experiencia futbolística sobre el lujo
-- Viajar con grupos grandes o familiares
-
-### Opciones de Gama Media
-
-Las opciones de gama media ofrecen un balance ideal entre:
-
-- Costo y calidad
-- Comodidad y presupuesto
-- Ubicación conveniente y precio razonable
-- Servicios básicos y valor agregado
-
-### Opciones Premium
-
-Las opciones premium para {keyword.lower()} son ideales para quienes buscan:
-
-- Máxima comodidad y servicios
-- Ubicaciones privilegiadas
-- Experiencias exclusivas durante el mundial
-- Atención personalizada y servicios de lujo
-
-## Consejos para Maximizar tu Presupuesto
-
-El **Mundial 2026** puede ser una inversión significativa, y {keyword.lower()} es a menudo uno de los componentes más costosos. Aquí tienes estrategias para maximizar tu presupuesto:
-
-**Reserva con máxima anticipación**: Las reservas tempranas generalmente ofrecen los mejores precios y más opciones disponibles.
-
-**Compara múltiples fuentes**: No te quedes con la primera opción que encuentres. Compara precios y servicios de diferentes proveedores.
-
-**Considera fechas alternativas**: Pequeños ajustes en tus fechas de viaje pueden resultar en ahorros significativos.
-
-**Busca ofertas y promociones**: Muchos proveedores ofrecen descuentos especiales para eventos como el mundial, especialmente con reservas anticipadas.
-
-**Viaja en grupo cuando sea posible**: Algunas opciones ofrecen descuentos para grupos grandes.
-
-**Evalúa ubicaciones alternativas**: Considera opciones en ubicaciones cercanas pero menos populares que pueden ofrecer mejor valor.
-
-## Planificación Anticipada: Por Qué es Crucial
-
-Dada la popularidad masiva esperada del **Mundial 2026**, planificar {keyword.lower()} con anticipación no es solo recomendable, es esencial:
-
-**Demanda sin precedentes**: Se esperan millones de visitantes durante el mundial, creando una demanda que puede agotar rápidamente las opciones disponibles.
-
-**Aumentos de precios**: Los precios pueden aumentar significativamente a medida que se acerca el evento y la oferta se vuelve más limitada.
-
-**Mejores opciones primero**: Las mejores opciones para {keyword.lower()} generalmente se agotan primero, haciendo la reserva anticipada crucial.
-
-**Tranquilidad mental**: Planificar con anticipación te permite enfocarte en disfrutar el mundial en lugar de preocuparte por {keyword.lower()} de último minuto.
-
-**Recomendación**: Comienza a investigar y reservar {keyword.lower()} al menos **12-18 meses antes** del inicio del torneo.
-
-## Factores a Considerar al Elegir {tema}
-
-Para tomar la mejor decisión sobre {keyword.lower()}, considera cuidadosamente estos factores:
-
-**Ubicación**: ¿Qué tan cerca está de los estadios, transporte público y atracciones principales?
-
-**Precio**: ¿Se ajusta a tu presupuesto total para el mundial sin comprometer otros aspectos importantes?
-
-**Disponibilidad**: ¿Está disponible para las fechas específicas que necesitas?
-
-**Calidad y servicios**: ¿Cumple con tus expectativas en términos de comodidad, limpieza y servicios ofrecidos?
-
-**Accesibilidad**: ¿Es fácil llegar desde el aeropuerto y moverse hacia otros lugares importantes?
-
-**Cancelación y cambios**: ¿Qué tan flexible es la política de cancelación y cambios en caso de que tus planes cambien?
-
-## Preguntas Frecuentes sobre {tema}
-
-### ¿Cuánto cuesta {keyword.lower()} para el Mundial 2026?
-
-El costo de {keyword.lower()} varía significativamente dependiendo de varios factores incluyendo ubicación, calidad, fechas y demanda. Las opciones económicas pueden comenzar desde rangos básicos, mientras que opciones premium pueden ser significativamente más costosas. Se espera que los precios sean más altos durante el mundial debido a la demanda masiva.
-
-### ¿Cuándo debo reservar {keyword.lower()}?
-
-Se recomienda reservar {keyword.lower()} tan pronto como sea posible, idealmente **12-18 meses antes** del inicio del torneo. Esto te dará acceso a mejores precios y más opciones disponibles antes de que la demanda masiva aumente los precios y limite la disponibilidad.
-
-### ¿Qué pasa si necesito cancelar o cambiar mi reserva de {keyword.lower()}?
-
-Las políticas de cancelación y cambios varían según el proveedor y el tipo de reserva. Algunas ofrecen flexibilidad completa con cancelación gratuita hasta cierta fecha, mientras que otras pueden tener políticas más estrictas. Siempre revisa cuidadosamente los términos y condiciones antes de reservar.
-
-### ¿Hay opciones de {keyword.lower()} disponibles para diferentes presupuestos?
-
-Sí, hay opciones disponibles para prácticamente todos los presupuestos, desde opciones económicas básicas hasta alternativas de lujo. La clave es investigar todas las opciones disponibles y comparar para encontrar la que mejor se ajuste a tu presupuesto y necesidades.
-
-### ¿Cómo puedo encontrar las mejores ofertas para {keyword.lower()}?
-
-Para encontrar las mejores ofertas:
-- Reserva con la mayor anticipación posible
-- Compara precios de múltiples fuentes
-- Busca promociones y descuentos especiales
-- Considera fechas y ubicaciones alternativas
-- Únete a listas de correo de proveedores para recibir ofertas exclusivas
-
-### ¿Debo pagar todo de inmediato o puedo hacer pagos parciales?
-
-Esto depende completamente del proveedor y sus políticas. Algunos requieren pago completo al momento de la reserva, mientras que otros ofrecen planes de pago parciales o pago al llegar. Revisa las opciones de pago disponibles al hacer tu reserva.
-
-'''
-    return content
-
-def generate_transactional_seo_content(tema, h1, keyword):
-    """Genera contenido transaccional SEO optimizado"""
-    content = f'''# {h1}
-
-Planificar tu experiencia en el **Mundial 2026** puede ser abrumador, especialmente cuando se trata de {keyword.lower()}. Con el formato ampliado a **48 equipos** y la celebración en múltiples ciudades a través de **tres países**, contar con herramientas y guías efectivas para {keyword.lower()} es esencial para maximizar tu experiencia y minimizar el estrés.
-
-Esta herramienta y guía completa está diseñada para simplificar todo el proceso de {keyword.lower()} para el **Mundial 2026**. Ya sea que estés en las primeras etapas de planificación o ya tengas ideas específicas en mente, aquí encontrarás recursos y herramientas que te ayudarán a tomar decisiones informadas y planificar con confianza.
-
-## ¿Cómo Funciona {tema}?
-
-{tema} está diseñado para ser intuitivo y fácil de usar, incluso si no tienes experiencia previa planificando viajes a eventos deportivos masivos. La herramienta y guía funcionan de la siguiente manera:
-
-**Análisis de necesidades**: Primero, identificas qué buscas específicamente para el **Mundial 2026** relacionado con {keyword.lower()}.
-
-**Exploración de opciones**: Luego, exploras las opciones disponibles que se ajustan a tus criterios específicos.
-
-**Comparación y evaluación**: Comparas diferentes opciones lado a lado para identificar cuál ofrece mejor valor y se ajusta mejor a tus necesidades.
-
-**Toma de decisión informada**: Finalmente, tomas una decisión basada en información completa y análisis objetivo.
-
-## Características Principales de {tema}
-
-{tema} incluye varias características diseñadas para hacer tu planificación más eficiente:
-
-### Herramientas de Comparación
-
-- Compara múltiples opciones simultáneamente
-- Evalúa pros y contras de cada alternativa
-- Filtra resultados según criterios específicos
-- Visualiza diferencias clave entre opciones
-
-### Información Actualizada
-
-- Acceso a información más reciente sobre el **Mundial 2026**
-- Actualizaciones sobre disponibilidad y precios
-- Noticias relevantes sobre {keyword.lower()}
-- Alertas sobre cambios importantes
-
-### Recomendaciones Personalizadas
-
-- Sugerencias basadas en tus preferencias
-- Recomendaciones considerando tu presupuesto
-- Opciones adaptadas a tus fechas de viaje
-- Consejos personalizados para tu situación específica
-
-### Recursos Adicionales
-
-- Guías detalladas sobre aspectos relacionados
-- Herramientas complementarias útiles
-- Preguntas frecuentes y respuestas
-- Soporte para resolver dudas
-
-## Beneficios de Usar {tema}
-
-Usar {tema} para planificar tu experiencia en el **Mundial 2026** ofrece múltiples ventajas:
-
-**Ahorro de tiempo**: Evita horas de investigación manual navegando múltiples sitios web y comparando opciones manualmente.
-
-**Mejores decisiones**: Accede a información completa y objetiva que te permite tomar decisiones más informadas sobre {keyword.lower()}.
-
-**Ahorro de dinero**: Identifica ofertas, descuentos y opciones que se ajustan mejor a tu presupuesto, potencialmente ahorrando dinero significativo.
-
-**Reducción de estrés**: Simplifica el proceso de planificación, reduciendo el estrés y permitiéndote enfocarte en disfrutar la anticipación del mundial.
-
-**Confianza**: Toma decisiones con confianza sabiendo que has considerado todas las opciones relevantes y tienes toda la información necesaria.
-
-## Cómo Empezar con {tema}
-
-Empezar a usar {tema} es simple y directo:
-
-**Paso 1: Define tus Necesidades**
-
-Identifica específicamente qué buscas relacionado con {keyword.lower()} para el **Mundial 2026**. Considera:
-- Tus fechas de viaje preferidas
-- Tu presupuesto aproximado
-- Tus preferencias personales
-- Cualquier requisito específico que tengas
-
-**Paso 2: Explora las Opciones**
-
-Usa las herramientas disponibles para explorar las opciones que se ajustan a tus criterios. No te limites a la primera opción; explora múltiples alternativas.
-
-**Paso 3: Compara y Evalúa**
-
-Compara las opciones que más te interesen, evaluando factores como precio, ubicación, calidad, servicios y disponibilidad.
-
-**Paso 4: Toma una Decisión**
-
-Basándote en tu análisis, toma una decisión informada sobre {keyword.lower()} que mejor se ajuste a tus necesidades y presupuesto.
-
-## Recursos y Soporte Adicional
-
-Además de {tema}, proporcionamos recursos adicionales para ayudarte en tu planificación:
-
-**Guías complementarias**: Información detallada sobre otros aspectos del **Mundial 2026** que pueden ser relevantes para tu planificación.
-
-**Herramientas relacionadas**: Otras herramientas que pueden ser útiles para diferentes aspectos de tu experiencia en el mundial.
-
-**Preguntas frecuentes**: Respuestas a preguntas comunes que otros fanáticos tienen sobre {keyword.lower()} y la planificación del mundial.
-
-**Actualizaciones**: Mantente informado sobre cambios importantes, nuevos recursos y oportunidades relacionadas con el **Mundial 2026**.
-
-## Preguntas Frecuentes sobre {tema}
-
-### ¿Es {tema} gratuito de usar?
-
-{tema} está diseñado para ser accesible y proporcionar valor sin costo para ayudarte en tu planificación del **Mundial 2026**.
-
-### ¿Qué información necesito para usar {tema}?
-
-Para usar {tema} efectivamente, es útil tener idea de:
-- Tus fechas de viaje aproximadas o preferidas
-- Tu presupuesto aproximado para {keyword.lower()}
-- Tus preferencias generales (ubicación, calidad, etc.)
-- Cualquier requisito específico que tengas
-
-### ¿Con qué frecuencia se actualiza la información en {tema}?
-
-La información en {tema} se actualiza regularmente para reflejar los últimos datos disponibles sobre el **Mundial 2026** y {keyword.lower()}. Te recomendamos revisar periódicamente para información actualizada.
-
-### ¿Puedo usar {tema} si aún no tengo fechas definitivas?
-
-Sí, puedes usar {tema} para explorar opciones y obtener ideas incluso si tus fechas aún no están completamente definidas. Esto puede ayudarte a planificar mejor una vez que tengas fechas confirmadas.
-
-### ¿Qué pasa si tengo preguntas específicas sobre {tema}?
-
-{tema} incluye recursos y guías diseñados para responder la mayoría de preguntas. Si tienes preguntas específicas, consulta la sección de preguntas frecuentes o explora los recursos adicionales disponibles.
-
-'''
-    return content
+def generate_transactional_seo_content(tema, h1, keyword, url=''):
+    """Genera contenido transaccional SEO optimizado (templates/seo_transactional.md)"""
+    return render_template('seo_transactional', url, tema=tema, h1=h1, keyword=keyword.lower())
 
 def markdown_to_html(markdown_content):
     """Convierte markdown a HTML manteniendo formato"""
@@ -1550,33 +1194,21 @@ def markdown_to_html(markdown_content):
     
     return html
 
-def create_html_page(row, markdown_content, base_url="https://www.superfan.com"):
+def create_html_page(spec, markdown_content, base_url="https://www.superfan.com", crumbs=None):
     """Crea página HTML completa desde contenido markdown"""
-    tema = row['Página / Tema']
-    h1 = row['H1 ejemplo']
-    keywords_en, keywords_es = row['Keywords objetivo (EN/ES)'].split(' / ')
-    url = row['URL sugerida'].strip('/')
+    h1 = spec.h1
+    keywords_en, keywords_es = spec.keywords_en, spec.keywords_es
+    url = spec.url
     
     # Convertir markdown a HTML
     html_content = markdown_to_html(markdown_content)
     
     # Generar título y descripción
-    title = f"{h1} | Mundial 2026"
-    description = f"Información completa sobre {keywords_es} para el Mundial 2026. {h1}. Guía detallada con toda la información que necesitas sobre {keywords_es} en la Copa del Mundo 2026."
+    title = page_title(h1)
+    description = page_description(f"Información completa sobre {keywords_es} para el Mundial 2026.", f"{h1}.",
+                                   f"Guía detallada con toda la información que necesitas sobre {keywords_es} en la Copa del Mundo 2026.")
     
-    # Build breadcrumb
-    breadcrumb_parts = url.split('/')
-    breadcrumb_html = '<div class="breadcrumb">\n            <a href="/">Inicio</a>'
-    current_path = ""
-    for i, part in enumerate(breadcrumb_parts):
-        if part:
-            current_path += f"/{part}"
-            part_name = part.replace('-', ' ').title()
-            if part == breadcrumb_parts[-1] or '[' in part:
-                breadcrumb_html += f' > <span>{part_name}</span>'
-            else:
-                breadcrumb_html += f' > <a href="{current_path}/">{part_name}</a>'
-    breadcrumb_html += '\n        </div>'
+    crumbs = crumbs or spec_crumbs(spec)
     
     html = f'''<!DOCTYPE html>
 <html lang="es">
@@ -1584,40 +1216,23 @@ def create_html_page(row, markdown_content, base_url="https://www.superfan.com")
     <meta charset="UTF-8">
     <meta name="viewport" content="width=device-width, initial-scale=1.0">
     <title>{title}</title>
-    <meta name="description" content="{description[:160]}">
+    <meta name="description" content="{description}">
     <meta name="keywords" content="{keywords_en}, {keywords_es}, mundial 2026, world cup 2026">
     <meta name="robots" content="index, follow">
     <link rel="canonical" href="{base_url}/{url}/">
     
     <meta property="og:title" content="{h1}">
-    <meta property="og:description" content="{description[:200]}">
+    <meta property="og:description" content="{description}">
     <meta property="og:type" content="website">
     <meta property="og:url" content="{base_url}/{url}/">
     
     <meta name="twitter:card" content="summary_large_image">
     <meta name="twitter:title" content="{h1}">
-    <meta name="twitter:description" content="{description[:200]}">
+    <meta name="twitter:description" content="{description}">
     
     <link rel="stylesheet" href="/styles.css">
     
-    <script type="application/ld+json">
-    {{
-        "@context": "https://schema.org",
-        "@type": "Article",
-        "headline": "{h1}",
-        "description": "{description[:200]}",
-        "author": {{
-            "@type": "Organization",
-            "name": "SuperFan Mundial 2026"
-        }},
-        "datePublished": "2024-01-01",
-        "dateModified": "2024-01-01",
-        "mainEntityOfPage": {{
-            "@type": "WebPage",
-            "@id": "{base_url}/{url}/"
-        }}
-    }}
-    </script>
+    {json_ld(url, h1, description, faqs=faq_pairs(markdown_content), base_url=base_url, date_published='2024-01-01', crumbs=crumbs)}
 </head>
 <body>
     <header>
@@ -1633,7 +1248,7 @@ def create_html_page(row, markdown_content, base_url="https://www.superfan.com")
     </header>
 
     <main class="container">
-        {breadcrumb_html}
+        {render_breadcrumb(crumbs)}
 
         {html_content}
     </main>
@@ -1653,31 +1268,24 @@ def main():
     """Función principal para generar todas las páginas con contenido SEO optimizado"""
     base_dir = Path(__file__).parent
     
-    with open('seo_world_cup_structure.csv', 'r', encoding='utf-8') as f:
-        reader = csv.DictReader(f)
-        for row in reader:
-            url = row['URL sugerida'].strip('/')
-            if not url or url.startswith('['):
-                continue
-            
-            print(f"Procesando: {url}")
-            
-            # Generar contenido SEO optimizado
-            markdown_content = generate_seo_content_for_page(row)
-            
-            # Convertir a HTML
-            html = create_html_page(row, markdown_content)
-            
-            # Crear estructura de directorios
-            path_parts = url.split('/')
-            if len(path_parts) > 1:
-                dir_path = base_dir / '/'.join(path_parts[:-1])
-                dir_path.mkdir(parents=True, exist_ok=True)
-            
-            # Escribir archivo
-            file_path = base_dir / f"{url}.html"
-            file_path.write_text(html, encoding='utf-8')
-            print(f"  ✓ Generado: {url}.html")
+    for spec in iter_page_specs(skip_placeholders=True):
+        print(f"Procesando: {spec.url}")
+        
+        # Generar contenido SEO optimizado
+        markdown_content = generate_seo_content_for_page(spec)
+        
+        # Convertir a HTML
+        html = create_html_page(spec, markdown_content)
+        
+        # Crear estructura de directorios
+        if len(spec.path_parts) > 1:
+            dir_path = base_dir / '/'.join(spec.path_parts[:-1])
+            dir_path.mkdir(parents=True, exist_ok=True)
+        
+        # Escribir archivo
+        file_path = base_dir / spec.file_path
+        file_path.write_text(html, encoding='utf-8')
+        print(f"  ✓ Generado: {spec.file_path}")
 
 if __name__ == '__main__':
     main()
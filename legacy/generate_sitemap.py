@@ -1,61 +1,110 @@
 #!/usr/bin/env python3
 # -*- coding: utf-8 -*-
-import csv
 from datetime import datetime
 from pathlib import Path
+from page_spec import iter_page_specs
 
-def generate_sitemap():
-    """Generate sitemap.xml from CSV"""
-    base_url = "https://www.superfan.com"
-    current_date = datetime.now().strftime('%Y-%m-%d')
-    
-    sitemap = f'''<?xml version="1.0" encoding="UTF-8"?>
+BASE_URL = "https://www.superfan.com"
+# Límite del protocolo sitemaps.org por archivo
+MAX_URLS_PER_SITEMAP = 50000
+
+URLSET_OPEN = '''<?xml version="1.0" encoding="UTF-8"?>
 <urlset xmlns="http://www.sitemaps.org/schemas/sitemap/0.9"
         xmlns:xsi="http://www.w3.org/2001/XMLSchema-instance"
         xsi:schemaLocation="http://www.sitemaps.org/schemas/sitemap/0.9
         http://www.sitemaps.org/schemas/sitemap/0.9/sitemap.xsd">
-    <url>
-        <loc>{base_url}/</loc>
-        <lastmod>{current_date}</lastmod>
-        <changefreq>weekly</changefreq>
-        <priority>1.0</priority>
-    </url>
 '''
-    
-    with open('seo_world_cup_structure.csv', 'r', encoding='utf-8') as f:
-        reader = csv.DictReader(f)
-        for row in reader:
-            url = row['URL sugerida'].strip('/')
-            if not url or url.startswith('['):
-                continue
-            
-            nivel = row['Nivel']
-            # Priority based on level
-            if nivel == 'L1':
-                priority = '0.9'
-                changefreq = 'weekly'
-            elif nivel == 'L2':
-                priority = '0.8'
-                changefreq = 'monthly'
-            else:
-                priority = '0.7'
-                changefreq = 'monthly'
-            
-            sitemap += f'''    <url>
-        <loc>{base_url}/{url}/</loc>
-        <lastmod>{current_date}</lastmod>
+
+def url_entry(loc, lastmod, changefreq, priority):
+    """Render a single <url> entry"""
+    return f'''    <url>
+        <loc>{loc}</loc>
+        <lastmod>{lastmod}</lastmod>
         <changefreq>{changefreq}</changefreq>
         <priority>{priority}</priority>
     </url>
 '''
-    
-    sitemap += '</urlset>'
-    return sitemap
 
-if __name__ == '__main__':
-    sitemap_xml = generate_sitemap()
-    with open('sitemap.xml', 'w', encoding='utf-8') as f:
-        f.write(sitemap_xml)
-    print("Sitemap.xml generated successfully!")
+def iter_url_entries(specs, base_url=BASE_URL, current_date=None, home=True):
+    """Yield one <url> entry per page, home page first (unless home=False)"""
+    current_date = current_date or datetime.now().strftime('%Y-%m-%d')
+    if home:
+        yield url_entry(f"{base_url}/", current_date, 'weekly', '1.0')
+
+    for spec in specs:
+        nivel = spec.level
+        # Priority based on level
+        if nivel == 'L1':
+            priority = '0.9'
+            changefreq = 'weekly'
+        elif nivel == 'L2':
+            priority = '0.8'
+            changefreq = 'monthly'
+        else:
+            priority = '0.7'
+            changefreq = 'monthly'
 
+        yield url_entry(spec.canonical_url(base_url), current_date, changefreq, priority)
 
+def iter_page_entries(paths, base_url=BASE_URL, current_date=None):
+    """Yield one <url> entry per generated page path (matches, teams, /en/...)"""
+    current_date = current_date or datetime.now().strftime('%Y-%m-%d')
+    for path in paths:
+        yield url_entry(f"{base_url}/{path}/", current_date, 'monthly', '0.6')
+
+def write_sitemaps(out_dir, entries, base_url=BASE_URL, max_urls=MAX_URLS_PER_SITEMAP):
+    """
+    Write entries to sitemap.xml as they arrive.
+    Past max_urls entries the output is split into sitemap-N.xml files and
+    sitemap.xml becomes a sitemap index. Returns the list of written files.
+    """
+    out_dir = Path(out_dir)
+    written = []
+    f = None
+    count = 0
+    try:
+        for entry in entries:
+            if f is None or count == max_urls:
+                if f is not None:
+                    f.write('</urlset>')
+                    f.close()
+                    if len(written) == 1:
+                        # More than one file needed: the first chunk is renamed
+                        first = out_dir / 'sitemap-1.xml'
+                        written[0].replace(first)
+                        written[0] = first
+                part = out_dir / ('sitemap.xml' if not written else f'sitemap-{len(written) + 1}.xml')
+                f = open(part, 'w', encoding='utf-8')
+                f.write(URLSET_OPEN)
+                written.append(part)
+                count = 0
+            f.write(entry)
+            count += 1
+    finally:
+        if f is not None:
+            f.write('</urlset>')
+            f.close()
+
+    if len(written) > 1:
+        current_date = datetime.now().strftime('%Y-%m-%d')
+        with open(out_dir / 'sitemap.xml', 'w', encoding='utf-8') as index:
+            index.write('<?xml version="1.0" encoding="UTF-8"?>\n')
+            index.write('<sitemapindex xmlns="http://www.sitemaps.org/schemas/sitemap/0.9">\n')
+            for part in written:
+                index.write(f'''    <sitemap>
+        <loc>{base_url}/{part.name}</loc>
+        <lastmod>{current_date}</lastmod>
+    </sitemap>
+''')
+            index.write('</sitemapindex>')
+        written.append(out_dir / 'sitemap.xml')
+    return written
+
+def generate_sitemap():
+    """Generate sitemap.xml content from CSV (single file, in memory)"""
+    entries = iter_url_entries(iter_page_specs(skip_placeholders=True))
+    return URLSET_OPEN + ''.join(entries) + '</urlset>'
+
+if __name__ == '__main__':
+    files = write_sitemaps('.', iter_url_entries(iter_page_specs(skip_placeholders=True)))
+    print(f"Sitemap generated successfully! ({', '.join(p.name for p in files)})")
@@ -0,0 +1,530 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+llms.txt (índice) y llms-full.txt (texto completo) a partir de content/ y
+de las páginas legacy ya generadas.
+
+Las entradas se recorren una a una (cada colección de content/ y después
+cada .html de la carpeta de salida) y se escriben en los dos archivos en
+la misma pasada, sin juntar el texto completo en memoria. Cuando un
+archivo llega a --max-bytes se sigue en llms-full-2.txt, llms-full-3.txt...
+(y llms-2.txt para el índice); el último archivo del índice enlaza todas
+las partes del texto completo.
+
+La regeneración es incremental: el estado guarda por entrada su
+lastUpdated (o un hash del contenido para las páginas legacy y las
+entidades sin fecha) y la posición de su bloque en el texto
+completo. Si ninguna entrada cambió no se reescribe nada; si alguna
+cambió, los bloques de las demás se copian del archivo anterior sin
+volver a renderizarlas.
+
+Todas las URLs usan un único host, SITE_URL: el de la app (SITE_URL de
+src/lib/i18n.ts), que es donde se publica el sitio y adonde redirigen las
+rutas legacy (vercel.json).
+
+Uso:
+    python3 llms_txt.py [--out DIR] [--max-bytes 500000] [--full]
+"""
+
+import argparse
+import hashlib
+import json
+import os
+import re
+import sys
+from collections import namedtuple
+from functools import lru_cache, partial
+from html.parser import HTMLParser
+from pathlib import Path
+
+from content_store import CONTENT_DIR, by_id, load_collection, load_json
+from match_pages import SCHEDULE_FILE, match_title
+
+SITE_URL = 'https://www.superfaninfo.com'
+INDEX_FILE = 'llms.txt'
+FULL_FILE = 'llms-full.txt'
+STATE_FILE = '.build-state/llms.json'
+MAX_BYTES = 500_000
+DATE = re.compile(r'\d{4}-\d{2}-\d{2}$')
+
+TITLE = '# SuperFan Mundial 2026'
+SUMMARY = ('> La guia independiente mas completa en espanol para el Mundial de Futbol 2026. / '
+           'The most complete independent Spanish-language guide to the 2026 FIFA World Cup.')
+
+# Entrada del índice: clave estable, sección, versión (lastUpdated o hash), URL,
+# título, resumen y una función que devuelve el texto completo (solo se llama si
+# la versión cambió)
+Entry = namedtuple('Entry', 'key section version url title summary render')
+
+
+def app_url(path):
+    return f"{SITE_URL}/es/{path}"
+
+
+def content_hash(data):
+    """Versión de una entidad sin lastUpdated (o de una página) a partir de su contenido"""
+    if not isinstance(data, bytes):
+        data = json.dumps(data, ensure_ascii=False, sort_keys=True).encode('utf-8')
+    return hashlib.sha1(data).hexdigest()[:12]
+
+
+def one_line(text):
+    return ' '.join(str(text).split())
+
+
+def faq_lines(faq):
+    return [f"- P: {one_line(item['question']['es'])} R: {one_line(item['answer']['es'])}" for item in faq]
+
+
+def source_lines(sources):
+    return [f"- {source['name']}: {source['url']}" for source in sources]
+
+
+def sections_text(content):
+    """Bloques {title, content} de un content por idioma, en el orden del JSON"""
+    lines = []
+    for value in content.values():
+        if isinstance(value, dict) and 'title' in value and isinstance(value.get('content'), dict):
+            lines += ['', f"#### {value['title']['es']}", value['content']['es']]
+    return lines
+
+
+# Entradas desde content/ -----------------------------------------------------
+
+def city_entries(content_dir):
+    stadiums = by_id(load_collection('stadiums.json', 'stadiums', content_dir))
+    for city in load_collection('cities.json', 'cities', content_dir):
+        def render(city=city):
+            content = city['content']
+            stadium = stadiums.get(city['stadium'])
+            lines = [f"Estadio: {stadium['name']['es'] if stadium else city['stadium']}",
+                     f"Resumen: {content['overview']['es']}"]
+            lines += sections_text(content)
+            lines += ['', 'Preguntas frecuentes:', *faq_lines(content.get('faq', []))]
+            lines += ['', 'Fuentes:', *source_lines(content.get('sources', []))]
+            return '\n'.join(lines)
+        yield Entry(f"city:{city['id']}", 'Ciudades sede', city['lastUpdated'],
+                    app_url(f"ciudades/{city['slugs']['es']}"), city['name']['es'],
+                    city['description']['es'], render)
+
+
+def stadium_entries(content_dir):
+    cities = by_id(load_collection('cities.json', 'cities', content_dir))
+    for stadium in load_collection('stadiums.json', 'stadiums', content_dir):
+        def render(stadium=stadium):
+            content = stadium['content']
+            city = cities.get(stadium['city'])
+            lines = [f"Ciudad: {city['name']['es'] if city else stadium['city']}",
+                     f"Capacidad: {stadium['capacity']}",
+                     f"Resumen: {content['overview']['es']}"]
+            lines += sections_text(content)
+            lines += ['', 'Preguntas frecuentes:', *faq_lines(content.get('faq', []))]
+            lines += ['', 'Fuentes:', *source_lines(content.get('sources', []))]
+            return '\n'.join(lines)
+        yield Entry(f"stadium:{stadium['id']}", 'Estadios', stadium['lastUpdated'],
+                    app_url(f"estadios/{stadium['slugs']['es']}"), stadium['name']['es'],
+                    stadium['description']['es'], render)
+
+
+def team_entries(content_dir):
+    for team in load_collection('teams.json', 'teams', content_dir):
+        def render(team=team):
+            content = team['content']
+            lines = [f"Confederación: {team['confederation']}", f"Resumen: {content['overview']['es']}"]
+            lines += sections_text(content)
+            players = content.get('keyPlayers', {}).get('players', [])
+            if players:
+                lines += ['', f"#### {content['keyPlayers']['title']['es']}"]
+                lines += [f"- {player['name']} ({player['position']['es']}, {player['club']})" for player in players]
+            lines += ['', 'Preguntas frecuentes:', *faq_lines(content.get('faq', []))]
+            lines += ['', 'Fuentes:', *source_lines(content.get('sources', []))]
+            return '\n'.join(lines)
+        yield Entry(f"team:{team['id']}", 'Selecciones', team['lastUpdated'],
+                    app_url(f"equipos/{team['slugs']['es']}"), team['name']['es'],
+                    team['description']['es'], render)
+
+
+def guide_entries(content_dir):
+    for rel_path, section, base in (('guides/travel.json', 'Guías de viaje', 'viajes'),
+                                    ('guides/fan.json', 'Guías para aficionados', 'fan')):
+        for guide in load_collection(rel_path, 'guides', content_dir):
+            def render(guide=guide):
+                lines = [guide['overview']['es']]
+                for block in guide.get('sections', []):
+                    lines += ['', f"#### {block['title']['es']}", block['content']['es']]
+                lines += ['', 'Preguntas frecuentes:', *faq_lines(guide.get('faq', []))]
+                lines += ['', 'Fuentes:', *source_lines(guide.get('sources', []))]
+                return '\n'.join(lines)
+            yield Entry(f"guide:{guide['id']}", section, guide['lastUpdated'],
+                        app_url(f"{base}/{guide['slugs']['es']}"), guide['title']['es'],
+                        guide['description']['es'], render)
+
+
+def answer_entries(content_dir):
+    for page in load_collection('faq-pages.json', 'pages', content_dir):
+        def render(page=page):
+            lines = [page['shortAnswer']]
+            for block in page.get('sections', []):
+                lines += ['', f"#### {block['title']}", block['body']]
+            return '\n'.join(lines)
+        yield Entry(f"answer:{page['slug']}", 'Respuestas', page.get('lastUpdated') or content_hash(page),
+                    app_url(f"respuestas/{page['slug']}"), page['question'], one_line(page['shortAnswer']), render)
+
+
+def match_entries(content_dir):
+    data = load_json(SCHEDULE_FILE, content_dir)
+    for match in data['matches']:
+        def render(match=match):
+            lines = [f"Fecha: {match['date']} {match['time']}", f"Sede: {match['venue']} ({match['city']})"]
+            if match.get('group'):
+                lines.append(f"Grupo: {match['group']}")
+            return '\n'.join(lines)
+        yield Entry(f"match:{match['id']}", 'Partidos', data['lastUpdated'],
+                    app_url(f"partidos/{match['id']}"), match_title(match),
+                    f"{match['date']}, {match['venue']}", render)
+
+
+def programmatic_entries(content_dir):
+    cities = by_id(load_collection('cities.json', 'cities', content_dir))
+
+    def name(city_id):
+        return cities[city_id]['name']['es'] if city_id in cities else city_id
+
+    for route in load_collection('programmatic/routes.json', 'routes', content_dir):
+        def render(route=route):
+            return '\n'.join([
+                f"Vuelo: {route['flightDuration']} min, US${route['flightCostMin']}-{route['flightCostMax']}"
+                f" ({', '.join(route.get('airlines', []))})",
+                f"Autobús: {route['busOperator']}, {route['busDuration']} min, US${route['busCostMin']}-{route['busCostMax']}",
+                f"Auto: {route['driveDistance']} km, {route['driveDuration']} min",
+                f"Recomendado: {route['recommendedMode']}",
+                route['travelTip']['es'],
+            ])
+        title = f"{name(route['from'])} a {name(route['to'])}"
+        yield Entry(f"route:{route['id']}", 'Cómo llegar entre sedes', route['lastUpdated'],
+                    app_url(f"como-llegar/{route['slugs']['es']}"), title, one_line(route['travelTip']['es']), render)
+
+    for comparison in load_collection('programmatic/city-comparisons.json', 'comparisons', content_dir):
+        def render(comparison=comparison):
+            lines = [f"- {metric}: {values['city1']} / {values['city2']}"
+                     for metric, values in comparison['metrics'].items()]
+            lines += ['', 'Recomendación:']
+            lines += [f"- {reason}: {name(winner)}" for reason, winner in comparison['recommendation'].items()]
+            return '\n'.join(lines)
+        title = f"{name(comparison['city1'])} vs {name(comparison['city2'])}"
+        yield Entry(f"compare:{comparison['id']}", 'Comparativas', comparison['lastUpdated'],
+                    app_url(f"comparar/{comparison['slugs']['es']}"), title,
+                    'Costos, transporte, clima y seguridad lado a lado', render)
+
+    for listicle in load_collection('programmatic/listicles.json', 'listicles', content_dir):
+        def render(listicle=listicle):
+            return '\n'.join(f"{item['rank']}. {item['entityId']}: {item.get('value', '')} {item.get('unit', '')}".rstrip()
+                             for item in listicle['items'])
+        yield Entry(f"listicle:{listicle['id']}", 'Rankings', listicle['lastUpdated'],
+                    app_url(f"mejores/{listicle['slug']}"), listicle['title']['es'],
+                    listicle['description']['es'], render)
+
+    for guide in load_collection('programmatic/match-day-guides.json', 'guides', content_dir):
+        def render(guide=guide):
+            lines = [f"Llega {guide['arriveHours']} horas antes al estadio."]
+            for field, label in (('fanZones', 'Fan zones'), ('food', 'Comida'), ('transport', 'Transporte'),
+                                 ('whatToBring', 'Qué llevar'), ('weatherWarning', 'Clima')):
+                if guide.get(field):
+                    lines.append(f"{label}: {guide[field]['es']}")
+            return '\n'.join(lines)
+        yield Entry(f"match-day:{guide['id']}", 'Día de partido', guide['lastUpdated'],
+                    app_url(f"dia-de-partido/{guide['slug']}"), f"Día de partido en {name(guide['cityId'])}",
+                    one_line(guide['transport']['es']), render)
+
+
+CONTENT_SOURCES = (
+    city_entries,
+    stadium_entries,
+    team_entries,
+    guide_entries,
+    answer_entries,
+    match_entries,
+    programmatic_entries,
+)
+
+
+# Entradas desde las páginas legacy -------------------------------------------
+
+class PageText(HTMLParser):
+    """Título, meta description y texto visible del <main> de una página generada"""
+    SKIP = {'script', 'style', 'nav', 'header', 'footer'}
+    SKIP_CLASSES = {'breadcrumb'}
+    BLOCKS = {'p', 'li', 'h1', 'h2', 'h3', 'h4', 'tr', 'div'}
+
+    def __init__(self):
+        super().__init__(convert_charrefs=True)
+        self.title = ''
+        self.description = ''
+        self.chunks = []
+        # Etiqueta que se está saltando y cuántas del mismo tipo hay abiertas dentro
+        self._skip_tag = None
+        self._skip_depth = 0
+        self._in_main = False
+        self._in_title = False
+
+    def handle_starttag(self, tag, attrs):
+        if tag == 'meta':
+            attrs = dict(attrs)
+            if attrs.get('name') == 'description':
+                self.description = attrs.get('content') or ''
+        elif tag == 'title':
+            self._in_title = True
+        elif tag == 'main':
+            self._in_main = True
+        if self._skip_tag == tag:
+            self._skip_depth += 1
+        elif self._skip_tag is None and (
+                tag in self.SKIP or self.SKIP_CLASSES & set((dict(attrs).get('class') or '').split())):
+            self._skip_tag, self._skip_depth = tag, 1
+        if not self._in_main or self._skip_tag is not None:
+            return
+        if tag in self.BLOCKS and self.chunks and self.chunks[-1] != '\n':
+            self.chunks.append('\n')
+        if tag in ('h2', 'h3'):
+            self.chunks.append('#### ')
+        elif tag in ('td', 'th') and self.chunks and self.chunks[-1] != '\n':
+            self.chunks.append(' | ')
+
+    def handle_endtag(self, tag):
+        if tag == 'title':
+            self._in_title = False
+        elif tag == 'main':
+            self._in_main = False
+        if tag == self._skip_tag:
+            self._skip_depth -= 1
+            if not self._skip_depth:
+                self._skip_tag = None
+        if tag in self.BLOCKS:
+            self.chunks.append('\n')
+
+    def handle_data(self, data):
+        if self._in_title:
+            self.title += data
+        elif self._in_main and self._skip_tag is None:
+            self.chunks.append(' '.join(data.split()) + (' ' if data[-1:].isspace() else ''))
+
+    def text(self):
+        lines = (line.strip() for line in ''.join(self.chunks).splitlines())
+        return '\n'.join(line for line in lines if line and line != '####')
+
+
+def page_url(rel_path):
+    """'travel/visa/index.html' -> SITE_URL/travel/visa/"""
+    path = rel_path.as_posix()
+    path = path[:-len('index.html')] if path.endswith('index.html') else path[:-len('.html')] + '/'
+    return f"{SITE_URL}/{path}".rstrip('/') + '/'
+
+
+def parse_page(path):
+    parser = PageText()
+    parser.feed(path.read_text(encoding='utf-8'))
+    parser.close()
+    return parser
+
+
+def page_entries(out_dir):
+    """
+    Cada .html de la carpeta de salida. Las páginas se reescriben en cada
+    build, así que la versión es el hash del archivo y no su fecha; el texto
+    solo se extrae si la página cambió.
+    """
+    out_dir = Path(out_dir)
+    for path in sorted(out_dir.rglob('*.html')):
+        rel_path = path.relative_to(out_dir)
+        if rel_path.parts[0].startswith('.'):
+            continue
+        parsed = lru_cache(maxsize=1)(partial(parse_page, path))
+        # El título y el resumen del índice también salen del HTML: se guardan en el estado
+        yield Entry(f"page:{rel_path.as_posix()}", 'Páginas del sitio legacy', content_hash(path.read_bytes()),
+                    page_url(rel_path),
+                    lambda: one_line(parsed().title), lambda: one_line(parsed().description),
+                    lambda: parsed().text())
+
+
+def iter_entries(out_dir, content_dir=CONTENT_DIR):
+    for source in CONTENT_SOURCES:
+        yield from source(content_dir)
+    yield from page_entries(out_dir)
+
+
+# Escritura -------------------------------------------------------------------
+
+def part_name(name, part):
+    """llms-full.txt, llms-full-2.txt, ..."""
+    if part == 1:
+        return name
+    stem, ext = os.path.splitext(name)
+    return f"{stem}-{part}{ext}"
+
+
+class SplitWriter:
+    """
+    Archivo de texto que se parte al llegar a max_bytes. Escribe en .tmp y
+    los renombra al cerrar, así los archivos anteriores siguen legibles
+    durante la pasada (de ahí se copian los bloques sin cambios).
+    """
+
+    def __init__(self, out_dir, name, max_bytes, header):
+        self.out_dir = Path(out_dir)
+        self.name = name
+        self.max_bytes = max_bytes
+        self.header = header
+        self.part = 0
+        self.size = 0
+        self.bytes_written = 0
+        self._file = None
+        self._open_next()
+
+    def _open_next(self):
+        if self._file:
+            self._file.close()
+        self.part += 1
+        self._file = open(self.out_dir / (part_name(self.name, self.part) + '.tmp'), 'wb')
+        self.size = 0
+        self.write(self.header(self.part).encode('utf-8'), split=False)
+
+    def write(self, data, split=True):
+        """Escribe data y devuelve (parte, posición); un bloque nunca se parte entre dos archivos"""
+        if split and self.size + len(data) > self.max_bytes and self.size > len(self.header(self.part)):
+            self._open_next()
+        position = (self.part, self.size)
+        self._file.write(data)
+        self.size += len(data)
+        self.bytes_written += len(data)
+        return position
+
+    def close(self):
+        """Renombra las partes y borra las que sobran de la regeneración anterior"""
+        self._file.close()
+        for part in range(1, self.part + 1):
+            name = part_name(self.name, part)
+            os.replace(self.out_dir / (name + '.tmp'), self.out_dir / name)
+        part = self.part + 1
+        while (self.out_dir / part_name(self.name, part)).exists():
+            (self.out_dir / part_name(self.name, part)).unlink()
+            part += 1
+
+    @property
+    def files(self):
+        return [part_name(self.name, part) for part in range(1, self.part + 1)]
+
+
+class PreviousParts:
+    """Lectura de bloques del texto completo anterior por (parte, posición, longitud)"""
+
+    def __init__(self, out_dir, name):
+        self.out_dir = Path(out_dir)
+        self.name = name
+        self._files = {}
+
+    def read(self, part, offset, length):
+        f = self._files.get(part)
+        if f is None:
+            f = self._files[part] = open(self.out_dir / part_name(self.name, part), 'rb')
+        f.seek(offset)
+        data = f.read(length)
+        return data if len(data) == length else None
+
+    def close(self):
+        for f in self._files.values():
+            f.close()
+
+
+def full_block(entry, title, body):
+    header = f"### {title}\nURL: {entry.url}\n"
+    if DATE.match(entry.version):
+        header += f"Última actualización: {entry.version}\n"
+    return f"{header}\n{body.strip()}\n\n"
+
+
+def generate(out_dir, max_bytes=MAX_BYTES, full=False, content_dir=CONTENT_DIR):
+    """
+    Regenera llms.txt y llms-full.txt en out_dir.
+    Devuelve (entradas renderizadas, entradas copiadas); (0, 0) si no hubo cambios.
+    """
+    out_dir = Path(out_dir)
+    state_path = out_dir / STATE_FILE
+    state = {}
+    if not full and state_path.exists():
+        state = json.loads(state_path.read_text(encoding='utf-8'))
+    # Los bloques guardados llevan la URL: con otro host o tamaño no sirven
+    same = state.get('maxBytes') == max_bytes and state.get('siteUrl') == SITE_URL
+    old = state.get('entries', {}) if same else {}
+
+    # Primera pasada, solo claves y fechas: ¿cambió algo?
+    current = {entry.key: entry.version for entry in iter_entries(out_dir, content_dir)}
+    outputs_exist = all((out_dir / name).exists() for name in state.get('files', [INDEX_FILE, FULL_FILE]))
+    if outputs_exist and old and current == {key: value['version'] for key, value in old.items()}:
+        return 0, 0
+
+    index = SplitWriter(out_dir, INDEX_FILE, max_bytes,
+                        lambda part: f"{TITLE}\n\n{SUMMARY}\n\n" if part == 1 else f"{TITLE} (parte {part})\n\n")
+    full_text = SplitWriter(out_dir, FULL_FILE, max_bytes,
+                            lambda part: f"{TITLE} - texto completo (parte {part})\n\n")
+    previous = PreviousParts(out_dir, FULL_FILE)
+    entries, rendered, copied = {}, 0, 0
+    section = None
+    try:
+        for entry in iter_entries(out_dir, content_dir):
+            if entry.section != section:
+                section = entry.section
+                index.write(f"\n## {section}\n\n".encode('utf-8'))
+                full_text.write(f"## {section}\n\n".encode('utf-8'))
+
+            cached = old.get(entry.key)
+            block = None
+            if cached and cached['version'] == entry.version:
+                block = previous.read(cached['part'], cached['offset'], cached['length'])
+            if block is not None:
+                title, summary = cached['title'], cached['summary']
+                copied += 1
+            else:
+                title = entry.title() if callable(entry.title) else entry.title
+                summary = entry.summary() if callable(entry.summary) else entry.summary
+                block = full_block(entry, title, entry.render()).encode('utf-8')
+                rendered += 1
+
+            index.write(f"- [{title}]({entry.url}): {summary}\n".encode('utf-8'))
+            part, offset = full_text.write(block)
+            entries[entry.key] = {'version': entry.version, 'part': part, 'offset': offset,
+                                  'length': len(block), 'title': title, 'summary': summary}
+
+        links = '\n'.join(f"- [{name}]({SITE_URL}/{name})" for name in full_text.files)
+        index.write(f"\n## Texto completo\n\n{links}\n".encode('utf-8'), split=False)
+    finally:
+        previous.close()
+    index.close()
+    full_text.close()
+
+    state_path.parent.mkdir(parents=True, exist_ok=True)
+    state_path.write_text(json.dumps({
+        'maxBytes': max_bytes,
+        'siteUrl': SITE_URL,
+        'files': index.files + full_text.files,
+        'entries': entries,
+    }, ensure_ascii=False, indent=1), encoding='utf-8')
+    return rendered, copied
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description='llms.txt y llms-full.txt del sitio')
+    parser.add_argument('--out', default=str(Path(__file__).parent), help='carpeta de salida')
+    parser.add_argument('--max-bytes', type=int, default=MAX_BYTES, help='tamaño máximo de cada archivo')
+    parser.add_argument('--full', action='store_true', help='regenerar aunque nada haya cambiado')
+    args = parser.parse_args(argv)
+
+    rendered, copied = generate(args.out, args.max_bytes, args.full)
+    if not rendered and not copied:
+        print("llms.txt: sin cambios")
+    else:
+        print(f"llms.txt: {rendered} entradas regeneradas, {copied} sin cambios")
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
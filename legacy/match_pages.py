@@ -0,0 +1,498 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Páginas de partidos a partir de content/schedule/matches.json.
+
+Genera una página por partido, por fecha, por grupo y por sede, los
+índices de partidos (/world-cup-2026/matches/, fecha/, grupo/ y sede/),
+más calendarios iCalendar (.ics): uno general, uno por grupo y uno por
+sede. Los índices por fecha/grupo/sede se calculan una vez en MatchIndex,
+y claim_match_pages reserva todas las rutas en el trie del build.
+
+La regeneración es incremental: si el lastUpdated del archivo no cambió
+no se reescribe nada; si cambió, solo se regeneran las páginas y feeds de
+los partidos cuyo contenido es distinto al del build anterior.
+"""
+
+import hashlib
+import json
+import re
+from collections import defaultdict
+from datetime import datetime, timedelta, timezone
+from functools import partial
+from zoneinfo import ZoneInfo
+
+from content_store import CONTENT_DIR, load_json
+from page_shell import BASE_URL, render_page
+from url_trie import Route
+
+SCHEDULE_FILE = 'schedule/matches.json'
+MATCHES_PATH = 'world-cup-2026/matches'
+STATE_FILE = '.build-state/matches.json'
+STAGE = 'matches'
+
+# Claves que producen páginas HTML; el resto son feeds .ics
+PAGE_KINDS = ('index', 'match', 'date', 'group', 'venue')
+
+# Índices de los listados: tipo -> (segmento, título, introducción)
+LISTING_INDEXES = {
+    'date': ('fecha', 'Partidos por fecha', 'Todas las fechas del Mundial 2026 con los partidos de cada día.'),
+    'group': ('grupo', 'Partidos por grupo', 'Los grupos del Mundial 2026 con el calendario completo de cada uno.'),
+    'venue': ('sede', 'Partidos por sede', 'Los estadios del Mundial 2026 con los partidos que se juegan en cada uno.'),
+}
+
+PHASE_NAMES = {
+    'group_stage': 'Fase de grupos',
+    'round_of_32': 'Dieciseisavos de final',
+    'round_of_16': 'Octavos de final',
+    'quarter_final': 'Cuartos de final',
+    'semi_final': 'Semifinal',
+    'third_place': 'Tercer lugar',
+    'final': 'Final',
+}
+# Zona horaria de cada sede: la hora de matches.json es la hora local del estadio
+CITY_TIMEZONES = {
+    'atlanta': 'America/New_York',
+    'boston': 'America/New_York',
+    'ciudad-de-mexico': 'America/Mexico_City',
+    'dallas': 'America/Chicago',
+    'guadalajara': 'America/Mexico_City',
+    'houston': 'America/Chicago',
+    'kansas-city': 'America/Chicago',
+    'los-angeles': 'America/Los_Angeles',
+    'miami': 'America/New_York',
+    'monterrey': 'America/Monterrey',
+    'new-york': 'America/New_York',
+    'philadelphia': 'America/New_York',
+    'san-francisco': 'America/Los_Angeles',
+    'seattle': 'America/Los_Angeles',
+    'toronto': 'America/Toronto',
+    'vancouver': 'America/Vancouver',
+}
+# Duración reservada en el calendario para un partido con hora
+MATCH_DURATION = timedelta(hours=2)
+
+MONTHS = ('enero', 'febrero', 'marzo', 'abril', 'mayo', 'junio', 'julio',
+          'agosto', 'septiembre', 'octubre', 'noviembre', 'diciembre')
+
+
+def slugify(text):
+    """'AT&T Stadium' -> 'at-t-stadium'"""
+    return re.sub(r'[^a-z0-9]+', '-', text.lower()).strip('-')
+
+
+def format_date(iso_date):
+    """'2026-06-11' -> '11 de junio de 2026'"""
+    year, month, day = iso_date.split('-')
+    return f"{int(day)} de {MONTHS[int(month) - 1]} de {year}"
+
+
+def team_name(team):
+    """Nombre en español o 'Por definir' mientras el sorteo no lo fije"""
+    return 'Por definir' if team['es'] == 'TBD' else team['es']
+
+
+def match_fingerprint(match):
+    """Hash estable del contenido de un partido"""
+    data = json.dumps(match, sort_keys=True, ensure_ascii=False).encode('utf-8')
+    return hashlib.sha1(data).hexdigest()
+
+
+class MatchIndex:
+    """Partidos agrupados por fecha, grupo y sede, calculado una sola vez"""
+
+    def __init__(self, matches):
+        self.matches = matches
+        self.by_id = {}
+        self.by_date = defaultdict(list)
+        self.by_group = defaultdict(list)
+        self.by_venue = defaultdict(list)
+        for match in matches:
+            self.by_id[match['id']] = match
+            self.by_date[match['date']].append(match)
+            if match.get('group'):
+                self.by_group[match['group']].append(match)
+            self.by_venue[slugify(match['venue'])].append(match)
+
+    def keys_for(self, match):
+        """Páginas y feeds que muestran este partido"""
+        group, venue = match.get('group'), slugify(match['venue'])
+        keys = {('match', match['id']), ('date', match['date']),
+                ('venue', venue), ('feed', 'all'), ('venue-feed', venue),
+                ('index', 'all'), ('index', 'date'), ('index', 'venue')}
+        if group:
+            keys |= {('group', group), ('group-feed', group), ('index', 'group')}
+        return keys
+
+
+# Rutas de salida ------------------------------------------------------------
+
+def match_path(match_id):
+    return f"{MATCHES_PATH}/{match_id}"
+
+
+def date_path(date):
+    return f"{MATCHES_PATH}/fecha/{date}"
+
+
+def group_path(group):
+    return f"{MATCHES_PATH}/grupo/{group.lower()}"
+
+
+def venue_path(venue_slug):
+    return f"{MATCHES_PATH}/sede/{venue_slug}"
+
+
+def index_path(kind):
+    """Índice de partidos ('all') o de un tipo de listado ('date', 'group', 'venue')"""
+    return MATCHES_PATH if kind == 'all' else f"{MATCHES_PATH}/{LISTING_INDEXES[kind][0]}"
+
+
+def page_path(key):
+    """URL (sin barras exteriores) de una clave de página HTML"""
+    kind, value = key
+    return {'index': index_path, 'match': match_path, 'date': date_path,
+            'group': group_path, 'venue': venue_path}[kind](value)
+
+
+def output_file(key):
+    """Archivo de salida de una clave ('match', 'm001') -> ruta relativa"""
+    kind, value = key
+    if kind == 'index':
+        return f"{index_path(value)}/index.html"
+    if kind in PAGE_KINDS:
+        return f"{page_path(key)}.html"
+    if kind == 'feed':
+        return f"{MATCHES_PATH}/calendario.ics"
+    if kind == 'group-feed':
+        return f"{group_path(value)}.ics"
+    if kind == 'venue-feed':
+        return f"{venue_path(value)}.ics"
+    raise ValueError(f"clave desconocida {key!r}")
+
+
+def page_files(index):
+    """Archivos HTML de todas las páginas de partidos (sin los feeds .ics)"""
+    return sorted(route.file for route in match_routes(index, None))
+
+
+def match_routes(index, stamp):
+    """Route de cada página HTML de partidos; stamp es el lastUpdated del calendario"""
+    keys = {key for match in index.matches for key in index.keys_for(match)}
+    for key in sorted(key for key in keys if key[0] in PAGE_KINDS):
+        yield Route(page_path(key), output_file(key), partial(render_key, key, index, stamp))
+
+
+def claim_match_pages(trie, index):
+    """Reserva en el trie los índices y las páginas de partidos, fechas, grupos y sedes"""
+    trie.claim(MATCHES_PATH, STAGE, 'Partidos')
+    for kind, (_, title, _) in LISTING_INDEXES.items():
+        trie.claim(index_path(kind), STAGE, title)
+    for match in index.matches:
+        trie.claim(match_path(match['id']), STAGE, match_title(match))
+    for date in index.by_date:
+        trie.claim(date_path(date), STAGE, format_date(date))
+    for group in index.by_group:
+        trie.claim(group_path(group), STAGE, f"Grupo {group}")
+    for venue, matches in index.by_venue.items():
+        trie.claim(venue_path(venue), STAGE, matches[0]['venue'])
+
+
+# HTML -----------------------------------------------------------------------
+
+def _crumbs(*tail):
+    return [('world-cup-2026', 'Mundial 2026'), (MATCHES_PATH, 'Partidos'), *tail]
+
+
+def match_title(match):
+    return f"{team_name(match['homeTeam'])} vs {team_name(match['awayTeam'])}"
+
+
+def match_list_html(matches):
+    """Lista de partidos enlazados, usada en las páginas de fecha, grupo y sede"""
+    items = []
+    for match in matches:
+        hora = 'hora por confirmar' if match['time'] == 'TBD' else match['time']
+        items.append(
+            f'            <li><a href="/{match_path(match["id"])}/">{match_title(match)}</a>'
+            f' — {format_date(match["date"])}, {hora}, {match["venue"]} ({match["cityName"]["es"]})</li>'
+        )
+    return '        <ul>\n' + '\n'.join(items) + '\n        </ul>'
+
+
+def render_match(match):
+    """Página de un partido"""
+    title = match_title(match)
+    fase = PHASE_NAMES.get(match['phase'], match['phase'].replace('_', ' ').capitalize())
+    group = match.get('group')
+    venue = slugify(match['venue'])
+    hora = 'Por confirmar' if match['time'] == 'TBD' else match['time']
+    grupo_html = (f'            <li><strong>Grupo:</strong> <a href="/{group_path(group)}/">Grupo {group}</a>'
+                  f' (jornada {match["matchday"]})</li>\n') if group else ''
+    body = f'''<p>{title} se juega el {format_date(match["date"])} en el {match["venue"]} de {match["cityName"]["es"]}, dentro de la {fase.lower()} del Mundial 2026. Aquí tienes la fecha, la sede y los enlaces para planificar tu viaje.</p>
+
+        <h2>Datos del partido</h2>
+
+        <ul>
+            <li><strong>Fase:</strong> {fase}</li>
+{grupo_html}            <li><strong>Fecha:</strong> <a href="/{date_path(match["date"])}/">{format_date(match["date"])}</a></li>
+            <li><strong>Hora:</strong> {hora}</li>
+            <li><strong>Sede:</strong> <a href="/{venue_path(venue)}/">{match["venue"]}</a>, {match["cityName"]["es"]}</li>
+        </ul>
+
+        <p><a href="/{venue_path(venue)}.ics">Añadir los partidos de esta sede a tu calendario</a></p>'''
+    return render_page(
+        title=f"{title}: {format_date(match['date'])}",
+        description=f"{title} en el Mundial 2026: {format_date(match['date'])}, {match['venue']} ({match['cityName']['es']}). {fase}.",
+        keywords=f"{title.lower()}, partido {match['id']}, mundial 2026, world cup 2026",
+        path=match_path(match['id']),
+        crumbs=_crumbs((match_path(match['id']), match['id'].upper())),
+        body_html=body,
+        h1=f"{title} — Mundial 2026",
+        schema_type='SportsEvent',
+    )
+
+
+def render_listing(path, label, title, intro, matches, feed=None, kind=None):
+    """Página de listado (fecha, grupo o sede); kind añade su índice a los breadcrumbs"""
+    feed_html = f'\n\n        <p><a href="/{feed}">Suscribirte a este calendario (.ics)</a></p>' if feed else ''
+    body = f'''<p>{intro}</p>
+
+        <h2>Partidos</h2>
+
+{match_list_html(matches)}{feed_html}'''
+    parent = [(index_path(kind), LISTING_INDEXES[kind][1])] if kind else []
+    return render_page(
+        title=title,
+        description=f"{intro} {len(matches)} partidos del Mundial 2026.",
+        keywords=f"{title.lower()}, partidos mundial 2026, world cup 2026 matches",
+        path=path,
+        crumbs=_crumbs(*parent, (path, label)),
+        body_html=body,
+        schema_type='CollectionPage',
+    )
+
+
+def listing_links(kind, index):
+    """[(ruta, texto, partidos)] de las páginas de un tipo de listado, en orden"""
+    if kind == 'date':
+        return [(date_path(date), format_date(date), len(index.by_date[date])) for date in sorted(index.by_date)]
+    if kind == 'group':
+        return [(group_path(group), f"Grupo {group}", len(index.by_group[group])) for group in sorted(index.by_group)]
+    return [(venue_path(venue), f"{matches[0]['venue']} ({matches[0]['cityName']['es']})", len(matches))
+            for venue, matches in sorted(index.by_venue.items(), key=lambda item: item[1][0]['venue'])]
+
+
+def render_index(kind, index):
+    """Índice de partidos ('all': enlaces a los listados y todos los partidos) o de un tipo de listado"""
+    if kind == 'all':
+        links = '\n'.join(f'            <li><a href="/{index_path(k)}/">{title}</a></li>'
+                          for k, (_, title, _) in LISTING_INDEXES.items())
+        body = f'''<p>Los {len(index.matches)} partidos del Mundial 2026 con su fecha, hora y estadio. Consulta el calendario por fecha, por grupo o por sede, o entra en cada partido.</p>
+
+        <ul>
+{links}
+        </ul>
+
+        <h2>Todos los partidos</h2>
+
+{match_list_html(sorted(index.matches, key=lambda match: (match['date'], match['id'])))}
+
+        <p><a href="/{output_file(('feed', 'all'))}">Suscribirte al calendario completo (.ics)</a></p>'''
+        return render_page(
+            title='Partidos del Mundial 2026',
+            description=f"Calendario de los {len(index.matches)} partidos del Mundial 2026: fechas, horas y estadios, por fecha, grupo y sede.",
+            keywords='partidos mundial 2026, calendario mundial 2026, world cup 2026 matches',
+            path=MATCHES_PATH,
+            crumbs=_crumbs(),
+            body_html=body,
+            h1='Partidos del Mundial 2026',
+            schema_type='CollectionPage',
+        )
+    _, title, intro = LISTING_INDEXES[kind]
+    items = '\n'.join(f'            <li><a href="/{path}/">{label}</a> — {count} partidos</li>'
+                      for path, label, count in listing_links(kind, index))
+    return render_page(
+        title=title,
+        description=f"{intro} Calendario completo del torneo.",
+        keywords=f"{title.lower()}, partidos mundial 2026, world cup 2026 matches",
+        path=index_path(kind),
+        crumbs=_crumbs((index_path(kind), title)),
+        body_html=f"<p>{intro}</p>\n\n        <ul>\n{items}\n        </ul>",
+        schema_type='CollectionPage',
+    )
+
+
+def render_key(key, index, stamp):
+    """Contenido (str) de la salida asociada a una clave; stamp es el lastUpdated del calendario"""
+    kind, value = key
+    if kind == 'index':
+        return render_index(value, index)
+    if kind == 'match':
+        return render_match(index.by_id[value])
+    if kind == 'date':
+        return render_listing(
+            date_path(value), format_date(value), f"Partidos del {format_date(value)}",
+            f"Todos los partidos del Mundial 2026 que se juegan el {format_date(value)}.",
+            index.by_date[value], kind='date')
+    if kind == 'group':
+        return render_listing(
+            group_path(value), f"Grupo {value}", f"Grupo {value} del Mundial 2026",
+            f"Calendario completo del Grupo {value}: fechas, estadios y ciudades.",
+            index.by_group[value], feed=output_file(('group-feed', value)), kind='group')
+    if kind == 'venue':
+        matches = index.by_venue[value]
+        venue, city = matches[0]['venue'], matches[0]['cityName']['es']
+        return render_listing(
+            venue_path(value), venue, f"Partidos en el {venue}",
+            f"Partidos del Mundial 2026 en el {venue} de {city}.",
+            matches, feed=output_file(('venue-feed', value)), kind='venue')
+    if kind == 'feed':
+        return render_ics('Mundial 2026', index.matches, stamp)
+    if kind == 'group-feed':
+        return render_ics(f"Mundial 2026 - Grupo {value}", index.by_group[value], stamp)
+    if kind == 'venue-feed':
+        return render_ics(f"Mundial 2026 - {index.by_venue[value][0]['venue']}", index.by_venue[value], stamp)
+    raise ValueError(f"clave desconocida {key!r}")
+
+
+# iCalendar ------------------------------------------------------------------
+
+def ics_escape(text):
+    """Escapa texto según RFC 5545"""
+    return (text.replace('\\', '\\\\').replace(';', '\\;')
+            .replace(',', '\\,').replace('\n', '\\n'))
+
+
+def ics_fold(line):
+    """Corta líneas de más de 75 octetos (RFC 5545, 3.1)"""
+    data = line.encode('utf-8')
+    if len(data) <= 75:
+        return line
+    parts = []
+    while len(data) > 75:
+        cut = 75 if not parts else 74
+        # No cortar en medio de un carácter multibyte
+        while cut and (data[cut] & 0xC0) == 0x80:
+            cut -= 1
+        parts.append(data[:cut].decode('utf-8'))
+        data = data[cut:]
+    parts.append(data.decode('utf-8'))
+    return '\r\n '.join(parts)
+
+
+def ics_utc(moment):
+    return moment.astimezone(timezone.utc).strftime('%Y%m%dT%H%M%SZ')
+
+
+def event_times(match):
+    """
+    Líneas DTSTART/DTEND de un partido: día completo si no tiene hora; si
+    la tiene, en UTC a partir de la hora local de su sede.
+    """
+    if match['time'] == 'TBD':
+        return [f"DTSTART;VALUE=DATE:{match['date'].replace('-', '')}"]
+    local = datetime.fromisoformat(f"{match['date']}T{match['time'][:5]}")
+    start = local.replace(tzinfo=ZoneInfo(CITY_TIMEZONES[match['city']]))
+    return [f"DTSTART:{ics_utc(start)}", f"DTEND:{ics_utc(start + MATCH_DURATION)}"]
+
+
+def render_ics(name, matches, stamp):
+    """Calendario .ics; los partidos sin hora son eventos de día completo"""
+    dtstamp = stamp.replace('-', '') + 'T000000Z'
+    lines = [
+        'BEGIN:VCALENDAR',
+        'VERSION:2.0',
+        'PRODID:-//SuperFan Mundial 2026//Calendario//ES',
+        'CALSCALE:GREGORIAN',
+        f'X-WR-CALNAME:{ics_escape(name)}',
+    ]
+    for match in matches:
+        lines += [
+            'BEGIN:VEVENT',
+            f"UID:{match['id']}@superfan.com",
+            f"DTSTAMP:{dtstamp}",
+            *event_times(match),
+            f"SUMMARY:{ics_escape(match_title(match))}",
+            f"LOCATION:{ics_escape(match['venue'] + ', ' + match['cityName']['es'])}",
+            f"URL:{BASE_URL}/{match_path(match['id'])}/",
+            'END:VEVENT',
+        ]
+    lines.append('END:VCALENDAR')
+    return '\r\n'.join(ics_fold(line) for line in lines) + '\r\n'
+
+
+# Build incremental ----------------------------------------------------------
+
+def dirty_keys(data, index, state):
+    """
+    Claves a regenerar comparando con el estado del build anterior.
+    Devuelve (claves, claves_a_borrar).
+    """
+    fingerprints = {m['id']: match_fingerprint(m) for m in data['matches']}
+    current = set()
+    for match in data['matches']:
+        current |= index.keys_for(match)
+    if not state or state.get('lastUpdated') is None:
+        return current, set()
+
+    old = state.get('matches', {})
+    # Salidas que el build anterior no conocía (p. ej. páginas nuevas de esta versión)
+    known = {tuple(key) for previous in old.values() for key in previous['keys']}
+    if state['lastUpdated'] == data['lastUpdated']:
+        return current - known, set()
+
+    keys, removed = current - known, set()
+    for match in data['matches']:
+        if old.get(match['id'], {}).get('hash') != fingerprints[match['id']]:
+            keys |= index.keys_for(match)
+    for match_id, previous in old.items():
+        if fingerprints.get(match_id) != previous['hash']:
+            # Páginas donde estaba el partido antes del cambio (fecha o sede vieja)
+            keys |= {tuple(key) for key in previous['keys']}
+    for key in list(keys):
+        kind, value = key
+        empty = ((kind == 'match' and value not in index.by_id)
+                 or (kind == 'date' and value not in index.by_date)
+                 or (kind in ('group', 'group-feed') and value not in index.by_group)
+                 or (kind in ('venue', 'venue-feed') and value not in index.by_venue))
+        if empty:
+            keys.discard(key)
+            removed.add(key)
+    return keys, removed
+
+
+def build_state(data, index):
+    return {
+        'lastUpdated': data['lastUpdated'],
+        'matches': {
+            m['id']: {'hash': match_fingerprint(m), 'keys': sorted(index.keys_for(m))}
+            for m in data['matches']
+        },
+    }
+
+
+def build_match_pages(out_dir, write, full=False, content_dir=CONTENT_DIR):
+    """
+    Genera las páginas y feeds de partidos con write(ruta_relativa, texto).
+    Devuelve (archivos escritos, archivos sin cambios).
+    """
+    data = load_json(SCHEDULE_FILE, content_dir)
+    index = MatchIndex(data['matches'])
+
+    state_path = out_dir / STATE_FILE
+    state = None
+    if not full and state_path.exists():
+        state = json.loads(state_path.read_text(encoding='utf-8'))
+
+    keys, removed = dirty_keys(data, index, state)
+    for key in sorted(keys):
+        write(output_file(key), render_key(key, index, data['lastUpdated']))
+    for key in removed:
+        (out_dir / output_file(key)).unlink(missing_ok=True)
+
+    state_path.parent.mkdir(parents=True, exist_ok=True)
+    state_path.write_text(json.dumps(build_state(data, index), indent=1), encoding='utf-8')
+
+    total = len({key for match in data['matches'] for key in index.keys_for(match)})
+    return len(keys), total - len(keys)
@@ -0,0 +1,120 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Presupuestos de peso por plantilla de página.
+
+page_budgets.json declara, para cada plantilla, las rutas que cubre
+(patrones fnmatch sobre la ruta de salida, o "csvPages" para las páginas
+del CSV) y el máximo de cada métrica de page_metrics.py:
+- html_bytes, gzip_bytes: peso del HTML sin comprimir y en gzip
+- images, image_bytes: imágenes de la página y peso de las locales
+- blocking_resources: hojas de estilo y scripts síncronos del <head>
+- dom_nodes: elementos del documento
+
+Cada página usa la primera plantilla que la cubre. Se reportan solo las
+métricas que superan el presupuesto, con el exceso. El build lo revisa en
+la etapa budgets y con --fail-on-budget termina con código 1 si hay
+excesos.
+
+Las imágenes remotas (Pexels) cuentan en images pero no en image_bytes:
+su peso no se conoce sin descargarlas.
+
+Uso:
+    python3 page_budgets.py [--out DIR] [--config page_budgets.json] [--fail]
+"""
+
+import argparse
+import json
+import sys
+from collections import Counter, namedtuple
+from fnmatch import fnmatchcase
+from pathlib import Path
+
+from page_metrics import COLUMNS, collect, keyword_targets
+from page_spec import CSV_PATH, load_page_specs
+from url_trie import UrlTrie
+
+BUDGETS_FILE = Path(__file__).parent / 'page_budgets.json'
+
+Template = namedtuple('Template', 'name paths csv_pages budgets')
+# Métrica de una página por encima de su presupuesto
+Violation = namedtuple('Violation', 'path template metric value limit')
+
+
+class BudgetConfigError(ValueError):
+    """page_budgets.json con una métrica o plantilla no válida"""
+
+
+def load_templates(path=BUDGETS_FILE):
+    """Plantillas de page_budgets.json, en orden"""
+    config = json.loads(Path(path).read_text(encoding='utf-8'))
+    known = {name for name, _ in COLUMNS}
+    templates = []
+    for entry in config['templates']:
+        unknown = set(entry['budgets']) - known
+        if unknown:
+            raise BudgetConfigError(f"plantilla {entry['name']}: métricas desconocidas {', '.join(sorted(unknown))}")
+        if not entry.get('paths') and not entry.get('csvPages'):
+            raise BudgetConfigError(f"plantilla {entry['name']}: sin paths ni csvPages")
+        templates.append(Template(entry['name'], tuple(entry.get('paths', ())),
+                                  bool(entry.get('csvPages')), entry['budgets']))
+    return templates
+
+
+def template_for(templates, path, csv_page):
+    for template in templates:
+        if (template.csv_pages and csv_page) or any(fnmatchcase(path, pattern) for pattern in template.paths):
+            return template
+    return None
+
+
+def check(metrics, templates):
+    """[Violation] de todas las páginas medidas"""
+    violations = []
+    columns = metrics.columns
+    for i, path in enumerate(metrics.paths):
+        template = template_for(templates, path, bool(metrics.keywords[i]))
+        if template is None:
+            continue
+        for metric, limit in template.budgets.items():
+            value = columns[metric][i]
+            if value > limit:
+                violations.append(Violation(path, template.name, metric, value, limit))
+    return violations
+
+
+def format_violations(violations):
+    lines = []
+    for v in violations:
+        lines.append(f"{v.path} [{v.template}]: {v.metric} {v.value:g} > {v.limit:g} "
+                     f"(+{v.value - v.limit:g}, +{(v.value / v.limit - 1) if v.limit else 0:.0%})")
+    by_metric = Counter((v.template, v.metric) for v in violations)
+    for (template, metric), count in sorted(by_metric.items()):
+        lines.append(f"  {template}/{metric}: {count} páginas")
+    return '\n'.join(lines)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description='Presupuestos de peso por plantilla de página')
+    parser.add_argument('--out', default=str(Path(__file__).parent), help='carpeta de salida del build')
+    parser.add_argument('--csv', default=CSV_PATH, help='CSV de estructura')
+    parser.add_argument('--config', default=str(BUDGETS_FILE), help='presupuestos por plantilla')
+    parser.add_argument('--workers', type=int, help='procesos (por defecto, uno por CPU)')
+    parser.add_argument('--fail', action='store_true', help='código 1 si alguna página supera su presupuesto')
+    args = parser.parse_args(argv)
+
+    try:
+        templates = load_templates(args.config)
+    except BudgetConfigError as e:
+        print(f"{args.config}: {e}", file=sys.stderr)
+        return 1
+    metrics = collect(Path(args.out), keyword_targets(UrlTrie.from_specs(load_page_specs(args.csv))), args.workers)
+    violations = check(metrics, templates)
+    if violations:
+        print(format_violations(violations))
+    print(f"{len(metrics)} páginas, {len({v.path for v in violations})} fuera de presupuesto")
+    return 1 if args.fail and violations else 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
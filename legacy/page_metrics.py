@@ -0,0 +1,268 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Métricas de contenido de cada página generada.
+
+Para cada .html de la carpeta de salida calcula palabras, frases,
+legibilidad Fernández-Huerta, número de <h2> y <h3>, apariciones y
+densidad de la keyword del CSV (en las páginas del CSV), imágenes, peso
+del HTML (sin comprimir y en gzip) y de las imágenes locales, recursos
+que bloquean el render y nodos del DOM. Las páginas se procesan por lotes en
+un pool de procesos y cada métrica se acumula en una columna (array de la
+biblioteca estándar); el resultado es un único CSV en
+.build-state/page-metrics.csv, una fila por página.
+
+El resumen muestra la distribución de palabras y legibilidad y las
+páginas por debajo de MIN_WORDS, para comprobar las "300+ palabras" del
+README sin abrir las páginas una a una.
+
+Uso:
+    python3 page_metrics.py [--out DIR] [--csv RUTA] [--workers N] [--min-words 300]
+"""
+
+import argparse
+import csv
+import gzip
+import os
+import re
+import sys
+from array import array
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+from statistics import median, quantiles
+
+from page_spec import CSV_PATH, load_page_specs
+from url_trie import UrlTrie
+from validate_output import output_files
+
+METRICS_FILE = '.build-state/page-metrics.csv'
+MIN_WORDS = 300
+# Páginas por tarea del pool
+BATCH = 64
+
+# (columna, tipo del array)
+COLUMNS = (
+    ('words', 'l'),
+    ('sentences', 'l'),
+    ('readability', 'd'),
+    ('h2', 'l'),
+    ('h3', 'l'),
+    ('keyword_count', 'l'),
+    ('keyword_density', 'd'),
+    ('images', 'l'),
+    ('image_bytes', 'l'),
+    ('html_bytes', 'l'),
+    ('gzip_bytes', 'l'),
+    ('blocking_resources', 'l'),
+    ('dom_nodes', 'l'),
+)
+
+SKIP_RE = re.compile(r'<(script|style|noscript|nav|header|footer)\b[^>]*>.*?</\1\s*>|<!--.*?-->', re.S | re.I)
+BODY_RE = re.compile(r'<body\b[^>]*>(.*)</body\s*>', re.S | re.I)
+# El final de un bloque termina la frase aunque el texto no lleve punto
+BLOCK_END_RE = re.compile(r'</(?:p|li|h[1-6]|td|th|dt|dd|figcaption|blockquote)\s*>', re.I)
+TAG_RE = re.compile(r'<[^>]+>')
+ENTITY_RE = re.compile(r'&[#\w]+;')
+H2_RE = re.compile(r'<h2\b', re.I)
+H3_RE = re.compile(r'<h3\b', re.I)
+HEAD_RE = re.compile(r'<head\b[^>]*>(.*?)</head\s*>', re.S | re.I)
+# Hojas de estilo y scripts externos síncronos del <head>
+STYLESHEET_RE = re.compile(r'<link\b(?=[^>]*\brel\s*=\s*["\']?stylesheet)(?![^>]*\bmedia\s*=\s*["\']?print)[^>]*>', re.I)
+SCRIPT_RE = re.compile(r'<script\b(?=[^>]*\bsrc\s*=)(?![^>]*\b(?:async|defer)\b)(?![^>]*type\s*=\s*["\']?module)[^>]*>', re.I)
+# Etiquetas de apertura, sin comentarios ni doctype
+ELEMENT_RE = re.compile(r'<[a-zA-Z]')
+COMMENT_RE = re.compile(r'<!--.*?-->', re.S)
+IMG_SRC_RE = re.compile(r'<img\b[^>]*?\bsrc\s*=\s*["\']([^"\']+)', re.I)
+WORD_RE = re.compile(r'[^\W\d_]+')
+EXTERNAL_RE = re.compile(r'^(?:[a-z][a-z0-9+.-]*:|//)', re.I)
+SENTENCE_RE = re.compile(r'[.!?…]+')
+VOWELS_RE = re.compile(r'[aeiouáéíóúü]+')
+STRONG = frozenset('aeoáéó')
+STRESSED_WEAK = frozenset('íú')
+
+# Carpeta de salida y keyword por página, cargadas una vez por proceso
+_root = '.'
+_keywords = {}
+
+
+def _init_worker(root, keywords):
+    global _root, _keywords
+    _root = root
+    _keywords = keywords
+
+
+def syllables(word):
+    """Sílabas aproximadas de una palabra en español (grupos vocálicos separando hiatos)"""
+    count = 0
+    for group in VOWELS_RE.findall(word):
+        count += 1
+        for a, b in zip(group, group[1:]):
+            if (a in STRONG and b in STRONG) or a in STRESSED_WEAK or b in STRESSED_WEAK:
+                count += 1
+    return count or 1
+
+
+def fernandez_huerta(words, sentences, syllable_count):
+    """Legibilidad Fernández-Huerta: 206,84 - 0,60·P - 1,02·F (por cada 100 palabras)"""
+    if not words:
+        return 0.0
+    per_100_syllables = 100 * syllable_count / words
+    per_100_sentences = 100 * max(sentences, 1) / words
+    return 206.84 - 0.60 * per_100_syllables - 1.02 * per_100_sentences
+
+
+def count_phrase(words, keyword):
+    """Apariciones de la keyword como secuencia de palabras"""
+    phrase = WORD_RE.findall(keyword.lower())
+    if not phrase:
+        return 0, 0
+    text = f" {' '.join(words)} "
+    return text.count(f" {' '.join(phrase)} "), len(phrase)
+
+
+def image_bytes(src, page):
+    """Tamaño de una imagen local del árbol de salida (las remotas cuentan 0)"""
+    if EXTERNAL_RE.match(src):
+        return 0
+    path = src.split('?')[0].split('#')[0]
+    path = path.lstrip('/') if path.startswith('/') else os.path.join(os.path.dirname(page), path)
+    try:
+        return os.path.getsize(os.path.join(_root, path))
+    except OSError:
+        return 0
+
+
+def measure(rel_path):
+    """(ruta, keyword, valores de COLUMNS) de una página"""
+    with open(os.path.join(_root, rel_path), 'rb') as f:
+        data = f.read()
+    html = data.decode('utf-8', errors='replace')
+    head = HEAD_RE.search(html)
+    head = head.group(1) if head else ''
+    body = BODY_RE.search(html)
+    body = body.group(1) if body else html
+    # Las imágenes de cabecera y pie también pesan; el texto solo cuenta el contenido
+    images = IMG_SRC_RE.findall(body)
+    body = SKIP_RE.sub(' ', body)
+    text = ENTITY_RE.sub(' ', TAG_RE.sub(' ', BLOCK_END_RE.sub('. ', body)))
+    words = WORD_RE.findall(text.lower())
+    sentences = len([s for s in SENTENCE_RE.split(text) if WORD_RE.search(s)])
+    keyword = _keywords.get(rel_path, '')
+    occurrences, length = count_phrase(words, keyword) if keyword else (0, 0)
+    values = (
+        len(words),
+        sentences,
+        round(fernandez_huerta(len(words), sentences, sum(map(syllables, words))), 2),
+        len(H2_RE.findall(body)),
+        len(H3_RE.findall(body)),
+        occurrences,
+        round(100 * occurrences * length / len(words), 3) if words else 0.0,
+        len(images),
+        sum(image_bytes(src, rel_path) for src in images),
+        len(data),
+        len(gzip.compress(data, 6)),
+        len(STYLESHEET_RE.findall(head)) + len(SCRIPT_RE.findall(head)),
+        len(ELEMENT_RE.findall(COMMENT_RE.sub('', html))),
+    )
+    return rel_path, keyword, values
+
+
+def measure_batch(paths):
+    return [measure(path) for path in paths]
+
+
+def keyword_targets(trie):
+    """{archivo de salida: keyword en español} de las páginas del CSV"""
+    return {node.output_path: node.spec.keywords_es for node in trie.page_nodes()}
+
+
+class Metrics:
+    """Métricas por columnas: paths, keywords y un array por métrica"""
+
+    def __init__(self):
+        self.paths = []
+        self.keywords = []
+        self.columns = {name: array(typecode) for name, typecode in COLUMNS}
+
+    def __len__(self):
+        return len(self.paths)
+
+    def add(self, path, keyword, values):
+        self.paths.append(path)
+        self.keywords.append(keyword)
+        for (name, _), value in zip(COLUMNS, values):
+            self.columns[name].append(value)
+
+    def extend(self, rows):
+        for row in rows:
+            self.add(*row)
+
+    def write_csv(self, path):
+        path = Path(path)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        names = [name for name, _ in COLUMNS]
+        with open(path, 'w', encoding='utf-8', newline='') as f:
+            writer = csv.writer(f)
+            writer.writerow(['path', 'keyword', *names])
+            writer.writerows(zip(self.paths, self.keywords, *(self.columns[name] for name in names)))
+
+    def below(self, column, minimum):
+        """[(ruta, valor)] de las páginas con la métrica por debajo del mínimo"""
+        return [(self.paths[i], value) for i, value in enumerate(self.columns[column]) if value < minimum]
+
+    def summary(self, min_words=MIN_WORDS):
+        lines = []
+        for name in ('words', 'readability', 'keyword_density', 'html_bytes'):
+            values = self.columns[name]
+            if name == 'keyword_density':
+                # Solo las páginas del CSV tienen keyword
+                values = [value for value, keyword in zip(values, self.keywords) if keyword]
+            if len(values) < 2:
+                continue
+            deciles = quantiles(values, n=10, method='inclusive')
+            lines.append(f"  {name:<16} mín. {min(values):>9g}  p10 {deciles[0]:>9.4g}  "
+                         f"mediana {median(values):>9.4g}  p90 {deciles[-1]:>9.4g}  máx. {max(values):>9g}")
+        short = self.below('words', min_words)
+        lines.append(f"  {len(short)} páginas con menos de {min_words} palabras")
+        return '\n'.join(lines)
+
+
+def collect(out_dir, keywords, workers=None):
+    """Métricas de todas las páginas de out_dir"""
+    pages = sorted(path for path in output_files(out_dir) if path.endswith('.html'))
+    batches = [pages[i:i + BATCH] for i in range(0, len(pages), BATCH)]
+    metrics = Metrics()
+    initargs = (str(out_dir), keywords)
+    workers = workers or os.cpu_count() or 1
+    if workers == 1 or len(pages) < 200:
+        # Pocas páginas: arrancar el pool cuesta más que medirlas
+        _init_worker(*initargs)
+        for batch in map(measure_batch, batches):
+            metrics.extend(batch)
+        return metrics
+    with ProcessPoolExecutor(workers, initializer=_init_worker, initargs=initargs) as pool:
+        for batch in pool.map(measure_batch, batches):
+            metrics.extend(batch)
+    return metrics
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description='Métricas de contenido de las páginas generadas')
+    parser.add_argument('--out', default=str(Path(__file__).parent), help='carpeta de salida del build')
+    parser.add_argument('--csv', default=CSV_PATH, help='CSV de estructura (keywords)')
+    parser.add_argument('--workers', type=int, help='procesos (por defecto, uno por CPU)')
+    parser.add_argument('--min-words', type=int, default=MIN_WORDS, help='mínimo de palabras por página')
+    args = parser.parse_args(argv)
+
+    out_dir = Path(args.out)
+    metrics = collect(out_dir, keyword_targets(UrlTrie.from_specs(load_page_specs(args.csv))), args.workers)
+    metrics.write_csv(out_dir / METRICS_FILE)
+    for path, words in metrics.below('words', args.min_words):
+        print(f"{path}: {words} palabras")
+    print(f"{len(metrics)} páginas -> {out_dir / METRICS_FILE}")
+    print(metrics.summary(args.min_words))
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
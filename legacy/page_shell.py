@@ -0,0 +1,188 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Estructura HTML común (head, nav, footer) para las páginas que no salen
+directamente de los generadores del CSV: índices de sección, partidos,
+equipos, etc. Produce el mismo marcado que create_html_page.
+"""
+
+import re
+from html import escape
+
+from structured_data import BASE_URL, json_ld
+from validate_output import DESCRIPTION_MAX
+
+# Títulos que ya nombran el evento no repiten el sufijo del sitio
+EVENT_RE = re.compile(r'\b(?:mundial|world cup) 2026\b|\b2026 world cup\b', re.I)
+
+# Idiomas del sitio; el primero es el de las rutas sin prefijo
+LOCALES = ('es', 'en')
+DEFAULT_LOCALE = LOCALES[0]
+
+# Textos de la plantilla por idioma
+UI = {
+    'es': {
+        'home': 'Inicio',
+        'site': 'Mundial 2026',
+        'nav': (
+            ('/world-cup-2026/', 'Mundial 2026'),
+            ('/world-cup-2026/teams/', 'Selecciones'),
+            ('/travel/flights/', 'Viajes'),
+            ('/fan/tickets/', 'Entradas'),
+        ),
+        'footer': 'Proyecto independiente no afiliado con FIFA.',
+        'about': 'Sobre el Proyecto',
+    },
+    'en': {
+        'home': 'Home',
+        'site': 'World Cup 2026',
+        'nav': (
+            ('/world-cup-2026/', 'World Cup 2026'),
+            ('/en/world-cup-2026/teams/', 'Teams'),
+            # Las secciones del CSV solo existen en español: las guías equivalentes en inglés
+            ('/en/travel/guides/flights/', 'Travel'),
+            ('/en/fan/guides/tickets/', 'Tickets'),
+        ),
+        'footer': 'Independent project not affiliated with FIFA.',
+        'about': 'About the Project',
+    },
+}
+
+
+def locale_path(path, lang):
+    """Ruta de una página en un idioma: 'travel/x' -> 'en/travel/x'"""
+    if lang == DEFAULT_LOCALE:
+        return path
+    return f"{lang}/{path}" if path else lang
+
+
+def format_number(value, lang='es'):
+    """87523 -> '87.523' (es) / '87,523' (en)"""
+    text = f"{value:,}"
+    return text.replace(',', '.') if lang == 'es' else text
+
+
+def esc(text):
+    """Escapa texto para el cuerpo HTML (las comillas pueden quedar tal cual)"""
+    return escape(text, quote=False)
+
+
+def paragraphs(text):
+    """Texto con párrafos separados por línea en blanco -> <p>...</p>"""
+    return '\n\n        '.join(f'<p>{esc(p.strip())}</p>' for p in text.split('\n\n') if p.strip())
+
+
+def page_description(*sentences, limit=DESCRIPTION_MAX):
+    """
+    Meta description: las frases que caben en limit, en orden y siempre al
+    menos la primera. Ninguna frase se corta, así que el texto es el mismo
+    en la meta description y en el JSON-LD.
+    """
+    text = sentences[0]
+    for sentence in sentences[1:]:
+        if len(text) + 1 + len(sentence) > limit:
+            break
+        text = f"{text} {sentence}"
+    return text
+
+
+def page_title(title, lang='es'):
+    """Texto del <title>: 'Selecciones | Mundial 2026', sin sufijo si el título ya nombra el evento"""
+    return title if EVENT_RE.search(title) else f"{title} | {UI[lang]['site']}"
+
+
+def hreflang_links(alternates, base_url=BASE_URL):
+    """<link rel="alternate"> para {idioma: ruta}, con x-default en el idioma principal"""
+    links = list(alternates.items())
+    if DEFAULT_LOCALE in alternates:
+        links.append(('x-default', alternates[DEFAULT_LOCALE]))
+    return '\n'.join(
+        f'    <link rel="alternate" hreflang="{lang}" href="{base_url}/{path}/">' for lang, path in links)
+
+
+def render_breadcrumb(crumbs, lang='es'):
+    """
+    Bloque de breadcrumbs a partir de [(ruta, etiqueta)] desde la raíz.
+    El último elemento es la página actual y no lleva enlace. Las
+    etiquetas son texto sin escapar ('AT&T Stadium').
+    """
+    html = f'<div class="breadcrumb">\n            <a href="/">{UI[lang]["home"]}</a>'
+    for path, label in crumbs[:-1]:
+        html += f' > <a href="/{path}/">{esc(label)}</a>'
+    if crumbs:
+        html += f' > <span>{esc(crumbs[-1][1])}</span>'
+    html += '\n        </div>'
+    return html
+
+
+def render_page(title, description, keywords, path, crumbs, body_html,
+                h1=None, schema_type='Article', lang='es', base_url=BASE_URL, alternates=None,
+                faqs=(), date_published=None):
+    """
+    Envuelve body_html en la página completa.
+    path es la ruta sin barras exteriores (e.g. 'travel/flights').
+    crumbs es [(ruta, etiqueta)] desde la raíz hasta la página: de ahí salen
+    los breadcrumbs del HTML y el BreadcrumbList de los datos estructurados.
+    alternates es {idioma: ruta} de las versiones de la misma página.
+    faqs es [(pregunta, respuesta)] para el FAQPage de los datos estructurados.
+    """
+    ui = UI[lang]
+    h1 = h1 or title
+    canonical = f"{base_url}/{path}/" if path else f"{base_url}/"
+    nav = '\n'.join(f'                <a href="{href}">{label}</a>' for href, label in ui['nav'])
+    # Valores que van dentro de atributos HTML; la descripción va completa
+    # para que validate_output vea su longitud real
+    title_attr = escape(h1)
+    description_attr = escape(description)
+    alternate_links = f"\n{hreflang_links(alternates, base_url)}" if alternates and len(alternates) > 1 else ''
+
+    return f'''<!DOCTYPE html>
+<html lang="{lang}">
+<head>
+    <meta charset="UTF-8">
+    <meta name="viewport" content="width=device-width, initial-scale=1.0">
+    <title>{esc(page_title(title, lang))}</title>
+    <meta name="description" content="{description_attr}">
+    <meta name="keywords" content="{escape(keywords)}">
+    <meta name="robots" content="index, follow">
+    <link rel="canonical" href="{canonical}">{alternate_links}
+
+    <meta property="og:title" content="{title_attr}">
+    <meta property="og:description" content="{description_attr}">
+    <meta property="og:type" content="website">
+    <meta property="og:url" content="{canonical}">
+
+    <meta name="twitter:card" content="summary_large_image">
+    <meta name="twitter:title" content="{title_attr}">
+    <meta name="twitter:description" content="{description_attr}">
+
+    <link rel="stylesheet" href="/styles.css">
+
+    {json_ld(path, h1, description, schema_type, faqs, lang, base_url, date_published, ui['home'], crumbs)}
+</head>
+<body>
+    <header>
+        <nav class="container">
+            <div><a href="/">🏆 SuperFan Mundial 2026</a></div>
+            <div>
+{nav}
+            </div>
+        </nav>
+    </header>
+
+    <main class="container">
+        {render_breadcrumb(crumbs, lang)}
+
+        <h1>{esc(h1)}</h1>
+
+        {body_html}
+    </main>
+
+    <footer>
+        <div class="container">
+            <p>&copy; 2024 SuperFan Mundial 2026. {ui['footer']}</p>
+            <p><a href="/about/" style="color: #fff;">{ui['about']}</a></p>
+        </div>
+    </footer>
+</body>
+</html>'''
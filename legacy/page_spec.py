@@ -0,0 +1,181 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Representación compacta de cada fila del CSV de estructura.
+
+Cada fila se normaliza una sola vez en un PageSpec inmutable (URL limpia,
+partes de la ruta, keywords EN/ES, intención, nivel y pilar) y ese objeto
+es el que reciben todos los generadores.
+
+La lectura es un generador: las filas se validan y se entregan una a una,
+así que un CSV de millones de filas se procesa con memoria constante.
+Uso para validar el CSV sin generar nada:
+
+    python3 page_spec.py [ruta.csv]
+"""
+
+import csv
+import re
+import sys
+from dataclasses import dataclass
+
+CSV_PATH = 'seo_world_cup_structure.csv'
+BASE_URL = "https://www.superfan.com"
+
+REQUIRED_COLUMNS = (
+    'Nivel', 'Pilar', 'Cluster', 'Página / Tema', 'Intención',
+    'H1 ejemplo', 'Keywords objetivo (EN/ES)', 'URL sugerida',
+    'Monetización / Notas',
+)
+INTENTS = ('Informacional', 'Comercial', 'Transaccional suave')
+LEVEL_RE = re.compile(r'^L[1-9]$')
+# /segmento/segmento/ con slugs en minúsculas o placeholders tipo [city]
+URL_RE = re.compile(r'^/(?:(?:[a-z0-9]+(?:-[a-z0-9]+)*|\[[a-zñ]+\])/)*$')
+
+
+class CSVSchemaError(ValueError):
+    """Fila del CSV que no cumple el esquema esperado"""
+
+    def __init__(self, line, message):
+        super().__init__(f"línea {line}: {message}")
+        self.line = line
+        self.message = message
+
+
+@dataclass(frozen=True, slots=True)
+class PageSpec:
+    """Página del sitio derivada de una fila del CSV"""
+    url: str
+    path_parts: tuple
+    tema: str
+    h1: str
+    keywords_en: str
+    keywords_es: str
+    intent: str
+    level: str
+    pillar: str
+    cluster: str
+    notes: str
+
+    @classmethod
+    def from_row(cls, row):
+        """Construye el PageSpec a partir de un dict de csv.DictReader"""
+        url = row['URL sugerida'].strip('/')
+        keywords_en, keywords_es = row['Keywords objetivo (EN/ES)'].split(' / ')
+        return cls(
+            url=url,
+            path_parts=tuple(part for part in url.split('/') if part),
+            tema=row['Página / Tema'],
+            h1=row['H1 ejemplo'],
+            keywords_en=keywords_en,
+            keywords_es=keywords_es,
+            # Valores con muy pocas variantes: se comparten entre filas
+            intent=sys.intern(row['Intención']),
+            level=sys.intern(row['Nivel']),
+            pillar=sys.intern(row['Pilar']),
+            cluster=sys.intern(row['Cluster']),
+            notes=row['Monetización / Notas'],
+        )
+
+    @property
+    def is_placeholder(self):
+        """True si la URL está vacía o es una plantilla con algún segmento [param] (/travel/stay/[city]/)"""
+        return not self.url or any(part.startswith('[') for part in self.path_parts)
+
+    @property
+    def slug(self):
+        """Último segmento de la ruta (e.g. 'mexico-city')"""
+        return self.path_parts[-1] if self.path_parts else ''
+
+    @property
+    def file_path(self):
+        """Ruta relativa del archivo HTML generado"""
+        return f"{self.url}.html"
+
+    def canonical_url(self, base_url=BASE_URL):
+        """URL canónica absoluta con barra final"""
+        return f"{base_url}/{self.url}/"
+
+
+def check_row(row):
+    """Devuelve la lista de problemas de esquema de una fila (vacía si es válida)"""
+    if None in row:
+        return [f"{len(row[None])} columna(s) de más; ¿coma sin comillas?"]
+    missing = [name for name in REQUIRED_COLUMNS if row.get(name) is None]
+    if missing:
+        return [f"faltan columnas: {', '.join(missing)}"]
+
+    problems = []
+    if not LEVEL_RE.match(row['Nivel']):
+        problems.append(f"nivel inválido {row['Nivel']!r}")
+    if row['Intención'] not in INTENTS:
+        problems.append(f"intención desconocida {row['Intención']!r}")
+    if not row['H1 ejemplo'].strip() or not row['Página / Tema'].strip():
+        problems.append("H1 o tema vacío")
+    if len(row['Keywords objetivo (EN/ES)'].split(' / ')) != 2:
+        problems.append(f"keywords sin formato 'EN / ES': {row['Keywords objetivo (EN/ES)']!r}")
+    if not URL_RE.match(row['URL sugerida']):
+        problems.append(f"URL inválida {row['URL sugerida']!r}")
+    return problems
+
+
+def _iter_rows(csv_path):
+    """Itera (línea, fila) leyendo el CSV de forma perezosa"""
+    with open(csv_path, 'r', encoding='utf-8', newline='') as f:
+        reader = csv.DictReader(f, strict=True)
+        try:
+            header = reader.fieldnames or []
+            missing = [name for name in REQUIRED_COLUMNS if name not in header]
+            if missing:
+                raise CSVSchemaError(1, f"faltan columnas: {', '.join(missing)}")
+            for row in reader:
+                yield reader.line_num, row
+        except csv.Error as e:
+            raise CSVSchemaError(reader.line_num, str(e)) from e
+
+
+def iter_page_specs(csv_path=CSV_PATH, skip_placeholders=False):
+    """
+    Genera los PageSpec del CSV uno a uno.
+    Se detiene con CSVSchemaError en la primera fila que no cumple el esquema.
+    """
+    for line, row in _iter_rows(csv_path):
+        problems = check_row(row)
+        if problems:
+            raise CSVSchemaError(line, '; '.join(problems))
+        spec = PageSpec.from_row(row)
+        if skip_placeholders and spec.is_placeholder:
+            continue
+        yield spec
+
+
+def load_page_specs(csv_path=CSV_PATH):
+    """Lee el CSV completo y devuelve la lista de PageSpec en orden"""
+    return list(iter_page_specs(csv_path))
+
+
+def validate_csv(csv_path=CSV_PATH):
+    """Recorre todo el CSV y devuelve [(línea, problema)] sin detenerse"""
+    errors = []
+    try:
+        for line, row in _iter_rows(csv_path):
+            errors.extend((line, problem) for problem in check_row(row))
+    except CSVSchemaError as e:
+        errors.append((e.line, e.message))
+    return errors
+
+
+def crumbs(spec):
+    """Breadcrumbs [(ruta, etiqueta)] de una página sin trie: cada segmento de la URL en formato título"""
+    return [('/'.join(spec.path_parts[:i]), part.replace('-', ' ').title())
+            for i, part in enumerate(spec.path_parts, 1)]
+
+
+if __name__ == '__main__':
+    path = sys.argv[1] if len(sys.argv) > 1 else CSV_PATH
+    errors = validate_csv(path)
+    for line, problem in errors:
+        print(f"{path}:{line}: {problem}")
+    if errors:
+        sys.exit(1)
+    print(f"{path}: OK")
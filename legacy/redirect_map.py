@@ -0,0 +1,261 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Tabla de redirecciones del sitio legacy a las rutas de la app Next.js.
+
+Recorre todas las URLs legacy (filas del CSV, índices de sección del trie
+y páginas generadas desde content/: selecciones, partidos, transporte,
+comparativas, colecciones) y calcula su destino en la app (/es/ciudades/<slug>,
+/es/equipos/<slug>...). Los destinos se resuelven contra las
+redirecciones que ya hay en vercel.json, de modo que cada URL legacy llega
+a su página final en un solo salto; si dos reglas forman un ciclo el
+script se detiene sin escribir nada.
+
+Escribe las reglas en la clave "redirects" de vercel.json (conservando
+las que no vienen de aquí) y un JSON compacto {origen: destino}. Las
+reglas del JSON anterior se consideran propias: al volver a ejecutarlo se
+regeneran (o se quitan de vercel.json si la URL ya no existe).
+
+Uso:
+    python3 redirect_map.py [--vercel ../vercel.json] [--lookup redirects.json] [--check]
+"""
+
+import argparse
+import json
+import sys
+from pathlib import Path
+
+from build import PLANS, SOURCE_DIR, Build
+from collection_pages import load_collections
+from comparison_pages import comparison_path, load_comparisons
+from comparison_pages import index_path as compare_index_path
+from content_store import CONTENT_DIR, load_collection, load_json
+from match_pages import LISTING_INDEXES, SCHEDULE_FILE, date_path, group_path, index_path, match_path, slugify, venue_path
+from page_shell import DEFAULT_LOCALE, LOCALES
+from page_spec import CSV_PATH, CSVSchemaError, iter_page_specs
+from team_pages import index_path as team_index_path
+from team_pages import team_path
+from travel_matrix import between_cities_path, city_transport_path
+
+VERCEL_JSON = Path(__file__).resolve().parent.parent / 'vercel.json'
+LOOKUP_FILE = 'redirects.json'
+
+# Secciones legacy -> ruta de la app (sin idioma). Las URLs sin regla
+# propia usan la de su ancestro más cercano; la raíz va al inicio.
+SECTIONS = {
+    '': '',
+    'world-cup-2026': '',
+    'world-cup-2026/format': 'calendario',
+    'world-cup-2026/schedule': 'calendario',
+    'world-cup-2026/matches': 'calendario',
+    'world-cup-2026/matches/sede': 'estadios',
+    'world-cup-2026/cities': 'ciudades',
+    'world-cup-2026/stadiums': 'estadios',
+    'world-cup-2026/teams': 'equipos',
+    'travel': 'viajes',
+    'travel/flights': 'viajes/vuelos',
+    'travel/flights/from-mexico': 'viajes/vuelos/desde-mexico',
+    'travel/flights/from-usa': 'viajes/vuelos/desde-usa',
+    'travel/flights/from-europe': 'viajes/vuelos/desde-europa',
+    'travel/stay': 'viajes/hospedaje',
+    'travel/transport': 'viajes/transporte',
+    'travel/compare': 'ciudades',
+    'travel/visa': 'viajes/visa',
+    'fan': 'fan',
+    'fan/tickets': 'fan/entradas',
+    'fan/safety': 'fan/seguridad',
+    'tools': 'herramientas',
+    'tools/trip-planner': 'herramientas/itinerario',
+    'tools/budget-calculator': 'herramientas/presupuesto',
+    'about': 'acerca',
+}
+
+# Colecciones de collection_pages -> ruta de la app ({slug} es el slug de
+# la entrada, el mismo en todos los idiomas); las guías no tienen página propia
+COLLECTION_ROUTES = {
+    'travel-guides': 'viajes',
+    'fan-guides': 'fan',
+    'listicles': 'mejores/{slug}',
+    'answers': 'respuestas/{slug}',
+    'match-day': 'dia-de-partido/{slug}',
+}
+
+
+class RedirectCycleError(ValueError):
+    """Reglas que se redirigen entre sí sin llegar nunca a una página"""
+
+
+def app_path(path, lang=DEFAULT_LOCALE):
+    """'ciudades/x' -> '/es/ciudades/x'"""
+    return f"/{lang}/{path}" if path else f"/{lang}"
+
+
+def section_target(url, lang=DEFAULT_LOCALE):
+    """Destino por sección: la regla de la URL o la de su ancestro más cercano"""
+    path = url.strip('/')
+    while path not in SECTIONS:
+        path = path.rpartition('/')[0]
+    return app_path(SECTIONS[path], lang)
+
+
+class RedirectMap:
+    """Reglas origen -> destino, con los destinos ya resueltos a un solo salto"""
+
+    def __init__(self, existing=(), generated=()):
+        # Redirecciones exactas ya presentes en vercel.json (sin comodines ni
+        # condiciones), salvo las generadas por una ejecución anterior
+        self.existing = {
+            rule['source']: rule['destination'] for rule in existing
+            if 'has' not in rule and ':' not in rule['source'] and '(' not in rule['source']
+            and rule['source'] not in generated
+        }
+        self.rules = {}
+
+    def add(self, legacy_url, destination):
+        """Primera regla para una URL; las que ya están en vercel.json se respetan"""
+        source = '/' + legacy_url.strip('/')
+        if source != destination and source not in self.existing:
+            self.rules.setdefault(source, destination)
+
+    def resolve(self, source):
+        """Destino final de source siguiendo todas las reglas; detecta ciclos"""
+        seen = [source]
+        target = self.rules.get(source) or self.existing.get(source)
+        while True:
+            following = self.rules.get(target) or self.existing.get(target)
+            if following is None:
+                return target
+            if following in seen or following == target:
+                cycle = ' -> '.join(seen + [target, following])
+                raise RedirectCycleError(f"ciclo de redirecciones: {cycle}")
+            seen.append(target)
+            target = following
+
+    def flatten(self):
+        """{origen: destino final} para todas las reglas generadas"""
+        return {source: self.resolve(source) for source in sorted(self.rules)}
+
+
+def planned_trie(specs):
+    """Trie de un build con todas sus rutas reservadas (filas del CSV y etapas)"""
+    build = Build(SOURCE_DIR, specs, renderer=None)
+    for plan in PLANS:
+        plan(build)
+    return build.trie
+
+
+def collect(redirects, specs, trie=None, content_dir=CONTENT_DIR, langs=LOCALES):
+    """Añade las reglas de todas las URLs legacy"""
+    cities = load_collection('cities.json', 'cities', content_dir)
+    stadiums = load_collection('stadiums.json', 'stadiums', content_dir)
+    teams = load_collection('teams.json', 'teams', content_dir)
+    matches = load_json(SCHEDULE_FILE, content_dir)['matches']
+    comparisons = load_collection('programmatic/city-comparisons.json', 'comparisons', content_dir)
+    _, pairs = load_comparisons(content_dir, all_pairs=True)
+
+    def entity(section, item, lang=DEFAULT_LOCALE):
+        return app_path(f"{section}/{item['slugs'][lang]}", lang)
+
+    # Páginas generadas en todos los idiomas
+    for lang in langs:
+        redirects.add(team_index_path(lang), app_path('equipos', lang))
+        for team in teams:
+            redirects.add(team_path(team, lang), entity('equipos', team, lang))
+        redirects.add(between_cities_path(lang), app_path('viajes/transporte', lang))
+        for city in cities:
+            redirects.add(city_transport_path(city, lang), entity('ciudades', city, lang))
+        redirects.add(compare_index_path(lang), app_path('ciudades', lang))
+        # La app publica cada par de city-comparisons.json con el slug de su idioma, incluidos
+        # los que el JSON repite en el otro sentido (el legacy ya solo genera uno)
+        for comparison in comparisons:
+            slug = comparison['slugs'][lang]
+            redirects.add(comparison_path(slug, lang), app_path(f"comparar/{slug}", lang))
+        for _, _, slugs, comparison in pairs:
+            if comparison is None:
+                redirects.add(comparison_path(slugs[lang], lang), app_path('ciudades', lang))
+    for plan, entries in load_collections(content_dir=content_dir):
+        route = COLLECTION_ROUTES[plan.collection.name]
+        for lang in plan.locales:
+            if lang not in langs:
+                continue
+            for entry in entries:
+                redirects.add(plan.page_path(entry, lang), app_path(route.format(slug=entry.get('slug')), lang))
+
+    # Páginas solo en español: ciudades y estadios por cualquiera de sus slugs, y partidos
+    for city in cities:
+        for slug in set(city['slugs'].values()):
+            redirects.add(f"world-cup-2026/cities/{slug}", entity('ciudades', city))
+    stadium_by_name = {}
+    for stadium in stadiums:
+        stadium_by_name[slugify(stadium['name']['es'])] = stadium
+        for slug in {stadium['id'], *stadium['slugs'].values()}:
+            redirects.add(f"world-cup-2026/stadiums/{slug}", entity('estadios', stadium))
+    for kind in ('all', *LISTING_INDEXES):
+        redirects.add(index_path(kind), section_target(index_path(kind)))
+    for match in matches:
+        redirects.add(match_path(match['id']), app_path(f"partidos/{match['id']}"))
+        redirects.add(date_path(match['date']), app_path('calendario'))
+        if match.get('group'):
+            redirects.add(group_path(match['group']), app_path(f"grupos/{match['group']}"))
+        stadium = stadium_by_name.get(slugify(match['venue']))
+        venue = venue_path(slugify(match['venue']))
+        redirects.add(venue, entity('estadios', stadium) if stadium else section_target(venue))
+
+    # Resto de filas del CSV e índices de sección sin fila: por sección
+    for spec in specs:
+        if not spec.is_placeholder:
+            redirects.add(spec.url, section_target(spec.url))
+        elif spec.url:
+            # Las plantillas [param] no son páginas, pero las secciones que las contenían
+            # (/how-to-watch/[country]/) ya se publicaron
+            parts = spec.path_parts[:next(i for i, part in enumerate(spec.path_parts) if part.startswith('['))]
+            for i in range(1, len(parts) + 1):
+                redirects.add('/'.join(parts[:i]), section_target('/'.join(parts[:i])))
+    for node in trie.section_nodes() if trie is not None else ():
+        redirects.add(node.path, section_target(node.path))
+
+
+def vercel_redirects(flat, existing, generated=()):
+    """Lista "redirects" de vercel.json: las reglas ajenas primero y después las generadas"""
+    kept = [rule for rule in existing if rule['source'] not in flat and rule['source'] not in generated]
+    generated = [{'source': source, 'destination': destination, 'permanent': True}
+                 for source, destination in flat.items()]
+    return kept + generated
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description='Redirecciones legacy -> app')
+    parser.add_argument('--vercel', default=str(VERCEL_JSON), help='vercel.json a actualizar')
+    parser.add_argument('--lookup', default=LOOKUP_FILE, help='JSON compacto {origen: destino}')
+    parser.add_argument('--csv', default=CSV_PATH, help='CSV de estructura')
+    parser.add_argument('--check', action='store_true', help='solo comprobar, sin escribir')
+    args = parser.parse_args(argv)
+
+    vercel_path = Path(args.vercel)
+    config = json.loads(vercel_path.read_text(encoding='utf-8'))
+    existing = config.get('redirects', [])
+    lookup_path = Path(args.lookup)
+    generated = json.loads(lookup_path.read_text(encoding='utf-8')) if lookup_path.exists() else {}
+    redirects = RedirectMap(existing, generated)
+    try:
+        specs = list(iter_page_specs(args.csv))
+        collect(redirects, specs, planned_trie(specs))
+        flat = redirects.flatten()
+    except (CSVSchemaError, RedirectCycleError) as e:
+        print(e, file=sys.stderr)
+        return 1
+
+    chains = sum(1 for source, destination in flat.items() if redirects.rules[source] != destination)
+    print(f"{len(flat)} redirecciones ({chains} cadenas aplanadas)")
+    if args.check:
+        return 0
+
+    config['redirects'] = vercel_redirects(flat, existing, generated)
+    vercel_path.write_text(json.dumps(config, indent=2, ensure_ascii=False) + '\n', encoding='utf-8')
+    lookup_path.write_text(json.dumps(flat, separators=(',', ':')), encoding='utf-8')
+    print(f"Actualizado {vercel_path} y {args.lookup}")
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
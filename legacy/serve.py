@@ -0,0 +1,367 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Servidor de desarrollo del sitio legacy (http.server de la biblioteca estándar).
+
+No genera nada al arrancar: el CSV se lee y el trie se construye con la
+primera petición, y cada página (fila del CSV, índice de sección o página
+de una etapa de content/: partidos, selecciones, transporte, comparativas
+y colecciones, en todos los idiomas) se renderiza la primera vez que se
+pide. El HTML queda en una caché LRU indexada por el hash de sus entradas
+(fila del CSV, breadcrumbs, versión del generador y de los JSON de
+content/ que usa la página), y se sirve con ETag/304 y gzip.
+
+Un hilo revisa cada segundo la fecha de modificación del CSV, del
+generador, de templates/*.md y de content/*.json e invalida solo lo
+afectado:
+- CSV: se vuelve a leer y se descartan las páginas cuya fila o
+  breadcrumbs cambiaron; el resto sigue en caché
+- generador: se recarga el módulo y se descartan las páginas del CSV
+- plantillas: se vuelven a compilar y se descartan las páginas del CSV
+- content/: se vuelven a cargar las etapas y se descartan las páginas que
+  dependen de ese archivo
+
+Solo los archivos estáticos (styles.css, imágenes, feeds .ics, JSON de
+las herramientas) se sirven desde la carpeta de salida del último build.
+
+Uso:
+    python3 serve.py [--port 8000] [--renderer seo|basic|enhanced] [--out DIR]
+"""
+
+import argparse
+import gzip
+import hashlib
+import importlib
+import mimetypes
+import sys
+import threading
+import time
+from collections import OrderedDict, namedtuple
+from http import HTTPStatus
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+from urllib.parse import unquote, urlsplit
+
+from affiliate_links import cta_kind, insert_cta
+from build import DEFAULT_RENDERER, PLANS, RENDERERS, STAGE_ROUTES, Build, load_renderer
+from collection_pages import COLLECTIONS, REFS
+from content_store import CONTENT_DIR, load_json
+from page_spec import CSV_PATH, CSVSchemaError, load_page_specs
+from slot_template import TEMPLATES_DIR, load_template
+from url_trie import render_section_index
+
+CACHE_SIZE = 1000
+POLL_SECONDS = 1.0
+# Respuestas más pequeñas no compensan el gzip
+GZIP_MIN_BYTES = 1024
+COMPRESSIBLE = ('text/', 'application/json', 'application/javascript', 'image/svg+xml')
+
+# JSON de content/ que usan las páginas comerciales (bloque de afiliados)
+AFFILIATE_SOURCES = ('affiliates.json', 'schedule/matches.json', 'cities.json', 'programmatic/routes.json')
+# JSON de content/ que usa cada etapa de STAGE_ROUTES
+STAGE_SOURCES = {
+    'matches': ('schedule/matches.json',),
+    'teams': ('teams.json', 'schedule/matches.json'),
+    'transport': ('cities.json', 'programmatic/routes.json'),
+    'compare': ('cities.json', 'stadiums.json', 'programmatic/city-comparisons.json'),
+    'collections': (*(collection.file for collection in COLLECTIONS), *(file for file, _ in REFS.values())),
+}
+
+# Página renderizada: ETag, cuerpo, cuerpo en gzip (o None) y archivos de los que depende
+Rendered = namedtuple('Rendered', 'etag body gzipped deps')
+
+
+def compressible(content_type):
+    return content_type.startswith(COMPRESSIBLE)
+
+
+def input_key(parts):
+    """Hash de las entradas de una página: la clave de la caché"""
+    return hashlib.sha1(repr(parts).encode('utf-8')).hexdigest()
+
+
+def make_response(body, content_type, deps=frozenset()):
+    etag = f'"{hashlib.sha1(body).hexdigest()[:16]}"'
+    gzipped = gzip.compress(body, 6) if len(body) >= GZIP_MIN_BYTES and compressible(content_type) else None
+    return Rendered(etag, body, gzipped, deps)
+
+
+class PageCache:
+    """LRU {hash de entradas: Rendered} con su clave vigente por ruta"""
+
+    def __init__(self, size=CACHE_SIZE):
+        self.size = size
+        self.entries = OrderedDict()
+        self.keys = {}
+        self.hits = 0
+        self.misses = 0
+
+    def get(self, key):
+        entry = self.entries.get(key)
+        if entry is None:
+            self.misses += 1
+            return None
+        self.entries.move_to_end(key)
+        self.hits += 1
+        return entry
+
+    def put(self, path, key, entry):
+        self.entries[key] = entry
+        self.keys[path] = key
+        while len(self.entries) > self.size:
+            self.entries.popitem(last=False)
+
+    def drop(self, paths):
+        for path in paths:
+            self.entries.pop(self.keys.pop(path, None), None)
+
+    def drop_deps(self, changed):
+        """Descarta las páginas que dependen de alguno de los archivos cambiados"""
+        stale = [path for path, key in self.keys.items()
+                 if key in self.entries and self.entries[key].deps & changed]
+        self.drop(stale)
+        return len(stale)
+
+
+class Site:
+    """Specs, trie y renderer del sitio, cargados con la primera petición"""
+
+    def __init__(self, out_dir, csv_path, renderer_name, content_dir=CONTENT_DIR, cache_size=CACHE_SIZE):
+        self.out_dir = Path(out_dir)
+        self.csv_path = Path(csv_path)
+        self.renderer_name = renderer_name
+        self.content_dir = Path(content_dir)
+        self.module_path = Path(__file__).parent / f"{RENDERERS[renderer_name]}.py"
+        self.cache = PageCache(cache_size)
+        self.lock = threading.RLock()
+        self.build = None
+        self.renderer = None
+        # {url: (etapa, Route)} de las páginas de las etapas de content/
+        self.routes = {}
+        self.versions = {}
+
+    # Estado ------------------------------------------------------------------
+
+    def watched(self):
+        """{archivo: mtime} de todo lo que puede cambiar una página"""
+        files = [self.csv_path, self.module_path, *self.templates(), *self.content_dir.rglob('*.json')]
+        mtimes = {}
+        for path in files:
+            try:
+                mtimes[str(path)] = path.stat().st_mtime_ns
+            except FileNotFoundError:
+                mtimes[str(path)] = None
+        return mtimes
+
+    @staticmethod
+    def templates():
+        return sorted(TEMPLATES_DIR.glob('*.md'))
+
+    def _load(self):
+        if self.renderer is None:
+            self.renderer = load_renderer(self.renderer_name)
+        build = Build(self.out_dir, load_page_specs(self.csv_path), self.renderer)
+        for plan in PLANS:
+            plan(build)
+        self.routes = {route.path: (stage, route) for stage, routes in STAGE_ROUTES.items()
+                       for route in routes(build)}
+        self.build = build
+
+    def ensure_loaded(self):
+        with self.lock:
+            if self.build is None:
+                self.versions = self.watched()
+                self._load()
+            return self.build
+
+    def refresh(self):
+        """Compara las fechas de modificación e invalida lo afectado; devuelve los archivos cambiados"""
+        with self.lock:
+            if self.build is None:
+                return set()
+            current = self.watched()
+            changed = {path for path in current.keys() | self.versions.keys()
+                       if current.get(path) != self.versions.get(path)}
+            if not changed:
+                return changed
+            self.versions = current
+
+            if str(self.module_path) in changed:
+                importlib.reload(sys.modules[RENDERERS[self.renderer_name]])
+                self.renderer = None
+            if any(Path(path).suffix == '.md' for path in changed):
+                load_template.cache_clear()
+            content = {path for path in changed if Path(path).suffix == '.json'}
+            if content:
+                load_json.cache_clear()
+            try:
+                old_keys = dict(self.cache.keys)
+                self._load()
+            except CSVSchemaError as e:
+                print(f"{self.csv_path}: {e} (se mantiene la versión anterior)", file=sys.stderr)
+                return changed
+            # Páginas cuyas entradas cambiaron (fila, breadcrumbs, generador) o que ya no existen
+            stale = [path for path, key in old_keys.items() if self.page_key(path) != key]
+            self.cache.drop(stale)
+            dropped = self.cache.drop_deps(frozenset(changed))
+            print(f"Cambios en {', '.join(sorted(Path(p).name for p in changed))}: "
+                  f"{len(stale) + dropped} páginas invalidadas")
+            return changed
+
+    # Páginas -----------------------------------------------------------------
+
+    def _inputs(self, path):
+        """(partes de la clave, dependencias, render() -> html) de una página renderizable, o None"""
+        path = path.strip('/')
+        node = self.build.trie.find(path)
+        if path in self.routes:
+            stage, route = self.routes[path]
+            sources = [str(self.content_dir / rel) for rel in STAGE_SOURCES[stage]]
+            crumbs = node.breadcrumb_html() if node is not None else None
+            parts = [stage, path, route.file, [self.versions.get(source) for source in sources], crumbs]
+            return parts, frozenset(sources), route.render
+        # La raíz es la portada estática, no un índice de sección
+        if node is None or node.parent is None or node.stage is not None:
+            return None
+        if node.spec is not None:
+            templates = [str(path) for path in self.templates()]
+            parts = [self.renderer_name, self.versions.get(str(self.module_path)),
+                     [self.versions.get(path) for path in templates], repr(node.spec), node.breadcrumb_html()]
+            deps = {str(self.module_path), *templates}
+            if cta_kind(node.spec):
+                sources = [str(self.content_dir / rel) for rel in AFFILIATE_SOURCES]
+                parts += [self.versions.get(path) for path in sources]
+                deps.update(sources)
+            return parts, frozenset(deps), lambda: self._render(node)
+        if node.children:
+            children = [(child.path, child.title) for child in node.children.values()]
+            return [node.path, repr(children)], frozenset(), lambda: render_section_index(node)
+        return None
+
+    def page_key(self, path):
+        inputs = self._inputs(path)
+        return input_key(inputs[0]) if inputs else None
+
+    def _render(self, node):
+        """Página de una fila del CSV, con el bloque de afiliados en las comerciales"""
+        html = self.build.renderer(node.spec, node.crumbs())
+        kind = cta_kind(node.spec)
+        if kind:
+            html = insert_cta(html, self.build.affiliates.cta_html('es', kind))
+        return html
+
+    def page(self, path):
+        """Rendered de una página del CSV, índice de sección o página de etapa; None si no la genera este servidor"""
+        with self.lock:
+            self.ensure_loaded()
+            inputs = self._inputs(path)
+            if inputs is None:
+                return None
+            parts, deps, render = inputs
+            key = input_key(parts)
+            entry = self.cache.get(key)
+            if entry is None:
+                entry = make_response(render().encode('utf-8'), 'text/html', deps)
+                self.cache.put(path.strip('/'), key, entry)
+            return entry
+
+    def static_file(self, path):
+        """(archivo, tipo) de la carpeta de salida para una URL, o None"""
+        rel = path.strip('/')
+        # carpeta/index.html primero: es lo que escriben los nodos con hijos
+        candidates = [rel] if Path(rel).suffix else [f"{rel}/index.html", f"{rel}.html"] if rel else ['index.html']
+        root = self.out_dir.resolve()
+        for candidate in candidates:
+            file_path = (root / candidate).resolve()
+            if file_path.is_file() and file_path.is_relative_to(root):
+                content_type = mimetypes.guess_type(file_path.name)[0] or 'application/octet-stream'
+                return file_path, content_type
+        return None
+
+
+def watch(site, interval=POLL_SECONDS):
+    """Bucle del hilo de vigilancia"""
+    while True:
+        time.sleep(interval)
+        try:
+            site.refresh()
+        except Exception as e:  # el servidor sigue con la versión anterior
+            print(f"Error al recargar: {e}", file=sys.stderr)
+
+
+class Handler(BaseHTTPRequestHandler):
+    site = None
+
+    def do_GET(self):
+        self.respond(head=False)
+
+    def do_HEAD(self):
+        self.respond(head=True)
+
+    def respond(self, head):
+        path = unquote(urlsplit(self.path).path)
+        entry, content_type = self.site.page(path), 'text/html; charset=utf-8'
+        if entry is None:
+            found = self.site.static_file(path)
+            if found is None:
+                self.send_error(HTTPStatus.NOT_FOUND)
+                return
+            file_path, content_type = found
+            if content_type.startswith('text/'):
+                content_type += '; charset=utf-8'
+            entry = make_response(file_path.read_bytes(), content_type)
+
+        if entry.etag in self.headers.get('If-None-Match', ''):
+            self.send_response(HTTPStatus.NOT_MODIFIED)
+            self.send_header('ETag', entry.etag)
+            self.end_headers()
+            return
+
+        body = entry.body
+        self.send_response(HTTPStatus.OK)
+        self.send_header('Content-Type', content_type)
+        self.send_header('ETag', entry.etag)
+        self.send_header('Cache-Control', 'no-cache')
+        if entry.gzipped is not None:
+            self.send_header('Vary', 'Accept-Encoding')
+            if 'gzip' in self.headers.get('Accept-Encoding', ''):
+                body = entry.gzipped
+                self.send_header('Content-Encoding', 'gzip')
+        self.send_header('Content-Length', str(len(body)))
+        self.end_headers()
+        if not head:
+            self.wfile.write(body)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description='Servidor de desarrollo del sitio legacy')
+    parser.add_argument('--port', type=int, default=8000)
+    parser.add_argument('--bind', default='127.0.0.1')
+    parser.add_argument('--out', default=str(Path(__file__).parent),
+                        help='carpeta del último build (estáticos, feeds y datos de las herramientas)')
+    parser.add_argument('--csv', default=CSV_PATH, help='CSV de estructura')
+    parser.add_argument('--renderer', choices=sorted(RENDERERS), default=DEFAULT_RENDERER,
+                        help='generador para las páginas del CSV')
+    parser.add_argument('--cache-size', type=int, default=CACHE_SIZE, help='páginas en caché')
+    args = parser.parse_args(argv)
+    try:
+        load_renderer(args.renderer)
+    except ModuleNotFoundError as e:
+        parser.error(f"el generador {args.renderer} necesita el módulo {e.name}, que no está instalado")
+
+    site = Site(args.out, args.csv, args.renderer, cache_size=args.cache_size)
+    Handler.site = site
+    threading.Thread(target=watch, args=(site,), daemon=True).start()
+    server = ThreadingHTTPServer((args.bind, args.port), Handler)
+    print(f"Sirviendo en http://{args.bind}:{args.port}/ (Ctrl+C para salir)")
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.server_close()
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,260 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Builds repartidos en N shards y unión de sus resultados.
+
+build.py --shard i/N genera solo las páginas cuyo hash estable de la URL
+(sha1, no el hash() de Python, que cambia entre procesos) cae en el shard
+i, en su propia carpeta (.shards/i-of-N/ dentro de --out). Todos los
+shards construyen el trie completo, así que breadcrumbs e índices de
+sección son los mismos que en un build normal. Las etapas de todo el
+sitio que no dependen del CSV (partidos, selecciones, transporte...)
+corren solo en el shard 1; llms y validate necesitan todas las páginas y
+se ejecutan sobre el resultado unido.
+
+Cada shard termina con su manifiesto parcial (etapa package), su sitemap
+y .build-state/shard.json. Este script los une en --out:
+- comprueba que estén todos los shards de 1 a N, del mismo CSV y
+  generador
+- comprueba que ningún archivo lo escriban dos shards, ni un x.html en
+  uno junto a una carpeta x/ en otro
+- copia los blobs de cada shard al almacén principal y escribe el
+  manifiesto unido y el delta respecto a la unión anterior
+- une los sitemaps de los shards (dividiendo cada 50.000 URLs)
+- genera llms.txt y llms-full.txt sobre el sitio unido y los añade al
+  manifiesto, y valida todas sus páginas
+- con --checkout escribe el sitio unido en --out desde los blobs (sin
+  --checkout, llms y la validación trabajan en una carpeta temporal)
+
+Con --spawn N lanza los N shards como procesos locales (cada uno hace de
+un nodo) y después los une; el resto de argumentos pasa a build.py.
+
+Uso:
+    python3 shards.py [--out DIR] [--count N] [--checkout]
+    python3 shards.py --spawn 4 [--out DIR] [--checkout] [argumentos de build.py]
+"""
+
+import argparse
+import hashlib
+import json
+import re
+import subprocess
+import sys
+import tempfile
+from pathlib import Path
+
+from deploy_bundle import BLOBS_DIR, MANIFEST_FILE, BlobStore, checkout, file_hash, load_manifest, save_manifest
+from generate_sitemap import write_sitemaps
+from llms_txt import STATE_FILE as LLMS_STATE_FILE, generate as generate_llms_txt
+from validate_output import format_report, validate
+
+SHARDS_DIR = '.shards'
+SHARD_FILE = '.build-state/shard.json'
+SITEMAP_RE = re.compile(r'^sitemap(?:-(\d+))?\.xml$')
+URL_ENTRY_RE = re.compile(r'[ \t]*<url>.*?</url>\n?', re.S)
+
+
+class ShardError(ValueError):
+    """Shards incompletos, de entradas distintas o que escriben el mismo archivo"""
+
+
+def parse_shard(text):
+    """'i/N' -> (i, N), con 1 <= i <= N"""
+    match = re.fullmatch(r'(\d+)/(\d+)', text.strip())
+    if not match or not 1 <= int(match.group(1)) <= int(match.group(2)):
+        raise ValueError(f"shard no válido: {text} (formato i/N, 1 <= i <= N)")
+    return int(match.group(1)), int(match.group(2))
+
+
+def shard_of(key, count):
+    """Shard (1..count) de una URL; el mismo en cualquier máquina y proceso"""
+    digest = hashlib.sha1(key.strip('/').encode('utf-8')).digest()
+    return int.from_bytes(digest[:8], 'big') % count + 1
+
+
+def shard_dir(out_dir, shard):
+    index, count = shard
+    return Path(out_dir) / SHARDS_DIR / f"{index}-of-{count}"
+
+
+def input_hash(csv_path):
+    with open(csv_path, 'rb') as f:
+        return hashlib.sha1(f.read()).hexdigest()
+
+
+def write_shard_info(out_dir, shard, csv_path, renderer, pages):
+    path = Path(out_dir) / SHARD_FILE
+    path.parent.mkdir(parents=True, exist_ok=True)
+    index, count = shard
+    info = {'shard': index, 'count': count, 'input': input_hash(csv_path), 'renderer': renderer, 'pages': pages}
+    path.write_text(json.dumps(info, indent=1), encoding='utf-8')
+
+
+def load_shards(out_dir, count=None):
+    """[(carpeta, info)] de los shards de out_dir, ordenados; ShardError si no se pueden unir"""
+    shards = []
+    for info_path in sorted((Path(out_dir) / SHARDS_DIR).glob(f"*/{SHARD_FILE}")):
+        info = json.loads(info_path.read_text(encoding='utf-8'))
+        if count is None or info['count'] == count:
+            shards.append((info_path.parent.parent, info))
+    if not shards:
+        raise ShardError(f"no hay shards en {Path(out_dir) / SHARDS_DIR}")
+    counts = {info['count'] for _, info in shards}
+    if len(counts) > 1:
+        raise ShardError(f"hay shards de varias particiones ({', '.join(map(str, sorted(counts)))}): usar --count")
+    count = counts.pop()
+    missing = sorted(set(range(1, count + 1)) - {info['shard'] for _, info in shards})
+    if missing:
+        raise ShardError(f"faltan los shards {', '.join(map(str, missing))} de {count}")
+    inputs = {(info['input'], info['renderer']) for _, info in shards}
+    if len(inputs) > 1:
+        raise ShardError("los shards se generaron con CSV o generador distintos")
+    return sorted(shards, key=lambda shard: shard[1]['shard'])
+
+
+def is_sitemap(rel_path):
+    return SITEMAP_RE.match(rel_path) is not None
+
+
+def collisions(manifests):
+    """Conflictos entre los manifiestos {shard: {ruta: entrada}} de los shards"""
+    problems = []
+    owners = {}
+    for shard, manifest in manifests.items():
+        for rel_path in manifest:
+            if is_sitemap(rel_path):
+                continue
+            if rel_path in owners:
+                problems.append(f"{rel_path}: escrito por los shards {owners[rel_path]} y {shard}")
+            else:
+                owners[rel_path] = shard
+    dirs = {}
+    for rel_path, shard in owners.items():
+        parent = rel_path.rpartition('/')[0]
+        while parent and parent not in dirs:
+            dirs[parent] = shard
+            parent = parent.rpartition('/')[0]
+    for rel_path, shard in owners.items():
+        stem = rel_path[:-len('.html')] if rel_path.endswith('.html') else None
+        if stem in dirs:
+            problems.append(f"{rel_path} (shard {shard}) choca con la carpeta {stem}/ (shard {dirs[stem]})")
+    return problems
+
+
+def sitemap_entries(shard_dirs):
+    """Entradas <url> de los sitemaps de los shards, en orden de shard y de archivo"""
+    for directory in shard_dirs:
+        parts = sorted((path for path in directory.glob('sitemap*.xml') if is_sitemap(path.name)),
+                       key=lambda path: int(SITEMAP_RE.match(path.name).group(1) or 0))
+        for part in parts:
+            # El índice de un shard con varios archivos no tiene entradas <url>
+            yield from URL_ENTRY_RE.findall(part.read_text(encoding='utf-8'))
+
+
+def add_file(store, manifest, path, rel_path):
+    digest = file_hash(path)
+    store.add(digest, path)
+    stat = path.stat()
+    manifest[rel_path] = {'hash': digest, 'size': stat.st_size, 'mtime': stat.st_mtime_ns}
+
+
+def finish_site(out_dir, store, merged, write_files):
+    """
+    Etapas que necesitan el sitio entero (las MERGED_STAGES de build.py):
+    llms.txt sobre el sitio unido, que se añade al manifiesto, y la
+    validación. Devuelve (archivos de llms, páginas revisadas, fallos).
+    """
+    with tempfile.TemporaryDirectory(prefix='shards-') as tmp:
+        site_dir = out_dir if write_files else Path(tmp)
+        checkout(out_dir, merged, site_dir)
+        # Sin --checkout no hay estado anterior de llms en la carpeta temporal
+        generate_llms_txt(site_dir, full=not write_files)
+        state = json.loads((site_dir / LLMS_STATE_FILE).read_text(encoding='utf-8'))
+        for name in state['files']:
+            add_file(store, merged, site_dir / name, name)
+        checked, failures = validate(site_dir)
+    return state['files'], checked, failures
+
+
+def merge(out_dir, count=None, write_files=False):
+    """
+    Une los shards de out_dir. Devuelve (manifiesto unido, delta, archivos
+    de sitemap, archivos de llms, páginas validadas, fallos de validación).
+    ShardError si faltan shards o dos escriben el mismo archivo.
+    """
+    out_dir = Path(out_dir)
+    shards = load_shards(out_dir, count)
+    manifests = {}
+    for directory, info in shards:
+        if not (directory / MANIFEST_FILE).exists():
+            raise ShardError(f"el shard {info['shard']} no tiene manifiesto (¿terminó su build?)")
+        manifests[info['shard']] = load_manifest(directory / MANIFEST_FILE)
+    problems = collisions(manifests)
+    if problems:
+        raise ShardError('\n'.join(problems))
+
+    store = BlobStore(out_dir / BLOBS_DIR)
+    merged = {}
+    for directory, info in shards:
+        shard_store = BlobStore(directory / BLOBS_DIR)
+        for rel_path, entry in manifests[info['shard']].items():
+            if is_sitemap(rel_path):
+                continue
+            store.add(entry['hash'], shard_store.path(entry['hash']))
+            merged[rel_path] = entry
+
+    sitemaps = write_sitemaps(out_dir, sitemap_entries([directory for directory, _ in shards]))
+    for path in sitemaps:
+        add_file(store, merged, path, path.name)
+
+    llms_files, checked, failures = finish_site(out_dir, store, merged, write_files)
+    merged = dict(sorted(merged.items()))
+    delta = save_manifest(out_dir, merged)
+    return merged, delta, sitemaps, llms_files, checked, failures
+
+
+def spawn(count, out_dir, build_args):
+    """Lanza los N shards como procesos locales; devuelve los shards que fallaron"""
+    build = Path(__file__).parent / 'build.py'
+    processes = {
+        index: subprocess.Popen([sys.executable, str(build), '--out', str(out_dir),
+                                 '--shard', f"{index}/{count}", *build_args],
+                                stdout=subprocess.DEVNULL)
+        for index in range(1, count + 1)
+    }
+    return [index for index, process in processes.items() if process.wait() != 0]
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description='Unión de los shards de un build repartido')
+    parser.add_argument('--out', default=str(Path(__file__).parent), help='carpeta de salida del build')
+    parser.add_argument('--count', type=int, help='número de shards a unir (si hay varias particiones)')
+    parser.add_argument('--spawn', type=int, metavar='N', help='lanzar antes N shards como procesos locales')
+    parser.add_argument('--checkout', action='store_true', help='escribir el sitio unido en --out')
+    args, build_args = parser.parse_known_args(argv)
+
+    count = args.count
+    if args.spawn:
+        failed = spawn(args.spawn, args.out, build_args)
+        if failed:
+            print(f"Fallaron los shards {', '.join(map(str, failed))}", file=sys.stderr)
+            return 1
+        count = args.spawn
+    elif build_args:
+        parser.error(f"argumentos no reconocidos: {' '.join(build_args)}")
+
+    try:
+        manifest, delta, sitemaps, llms_files, checked, failures = merge(args.out, count, args.checkout)
+    except ShardError as e:
+        print(f"No se pudieron unir los shards:\n{e}", file=sys.stderr)
+        return 1
+    if failures:
+        print(format_report(failures))
+    print(f"Validate: {checked} páginas, {len(failures)} con fallos; LLMs: {', '.join(llms_files)}")
+    print(f"{len(manifest)} archivos unidos: {len(delta['added'])} nuevos, {len(delta['changed'])} cambiados, "
+          f"{len(delta['removed'])} borrados; sitemap: {', '.join(path.name for path in sitemaps)}")
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,157 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Plantillas de texto con huecos y variantes (templates/*.md).
+
+Formato:
+- {nombre}: hueco que se rellena con el valor del mismo nombre
+  ({tema}, {h1}, {keyword}...); un hueco sin valor es un error
+- bloques de variantes, con los marcadores en su propia línea:
+
+      @variantes
+      primera versión del párrafo
+      @o
+      segunda versión
+      @fin
+
+  Cada página usa una de las versiones, elegida con un hash (crc32) de su
+  URL y la posición del bloque, así que la misma URL da siempre el mismo
+  texto byte a byte y páginas distintas no repiten todas el mismo párrafo.
+
+Cada plantilla se compila una vez a trozos: listas de texto fijo con los
+huecos en las posiciones impares y un itemgetter con los nombres de esos
+huecos. Renderizar una página es copiar la lista, asignar los valores
+por slice y un join; no se vuelve a analizar el texto.
+
+Uso:
+    python3 slot_template.py [--bench N]
+"""
+
+import argparse
+import re
+import sys
+import time
+import zlib
+from functools import lru_cache
+from operator import itemgetter
+from pathlib import Path
+
+TEMPLATES_DIR = Path(__file__).parent / 'templates'
+SLOT_RE = re.compile(r'\{([a-z_][a-z0-9_]*)\}')
+VARIANTS, OR, END = '@variantes', '@o', '@fin'
+
+
+class TemplateError(ValueError):
+    """Plantilla mal formada o hueco sin valor"""
+
+
+def compile_segment(text):
+    """(partes, getter): texto fijo y huecos alternados, y los valores en ese orden"""
+    parts = SLOT_RE.split(text)
+    names = parts[1::2]
+    if not names:
+        return tuple(parts), None
+    getter = itemgetter(*names) if len(names) > 1 else (lambda values, name=names[0]: (values[name],))
+    return tuple(parts), getter
+
+
+def fill(segment, values):
+    parts, getter = segment
+    if getter is None:
+        return parts[0]
+    filled = list(parts)
+    filled[1::2] = getter(values)
+    return ''.join(filled)
+
+
+class SlotTemplate:
+    """Plantilla compilada: [(clave del bloque o None, (trozos...))]"""
+    __slots__ = ('name', 'chunks', 'slots')
+
+    def __init__(self, name, chunks, slots):
+        self.name = name
+        self.chunks = chunks
+        self.slots = slots
+
+    @classmethod
+    def compile(cls, text, name='plantilla'):
+        chunks = []
+        slots = set()
+        literal = []
+        variants = None
+
+        def segment(lines):
+            text = ''.join(lines)
+            slots.update(SLOT_RE.findall(text))
+            return compile_segment(text)
+
+        for number, line in enumerate(text.splitlines(keepends=True), 1):
+            marker = line.strip()
+            if marker == VARIANTS:
+                if variants is not None:
+                    raise TemplateError(f"{name}:{number}: {VARIANTS} dentro de otro bloque")
+                if literal:
+                    chunks.append((None, (segment(literal),)))
+                literal, variants = [], []
+            elif marker == OR:
+                if variants is None:
+                    raise TemplateError(f"{name}:{number}: {OR} fuera de un bloque")
+                variants.append(segment(literal))
+                literal = []
+            elif marker == END:
+                if variants is None:
+                    raise TemplateError(f"{name}:{number}: {END} sin {VARIANTS}")
+                variants.append(segment(literal))
+                chunks.append((f"{name}:{len(chunks)}".encode('utf-8'), tuple(variants)))
+                literal, variants = [], None
+            else:
+                literal.append(line)
+        if variants is not None:
+            raise TemplateError(f"{name}: falta {END}")
+        if literal:
+            chunks.append((None, (segment(literal),)))
+        return cls(name, tuple(chunks), frozenset(slots))
+
+    def render(self, key, values):
+        """Texto para una página; key (la URL) elige las variantes"""
+        seed = zlib.crc32(key.encode('utf-8'))
+        try:
+            return ''.join(
+                fill(segments[0] if block is None else segments[zlib.crc32(block, seed) % len(segments)], values)
+                for block, segments in self.chunks
+            )
+        except KeyError as e:
+            raise TemplateError(f"{self.name}: falta el valor de {e.args[0]}") from None
+
+
+@lru_cache(maxsize=None)
+def load_template(name):
+    """Plantilla compilada de templates/<name>.md, una vez por proceso"""
+    path = TEMPLATES_DIR / f"{name}.md"
+    return SlotTemplate.compile(path.read_text(encoding='utf-8'), path.name)
+
+
+def render_template(name, key, **values):
+    return load_template(name).render(key, values)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description='Compila las plantillas y mide el renderizado')
+    parser.add_argument('--bench', type=int, default=100_000, help='páginas a renderizar por plantilla')
+    args = parser.parse_args(argv)
+
+    for path in sorted(TEMPLATES_DIR.glob('*.md')):
+        template = load_template(path.stem)
+        values = {slot: f"valor de {slot}" for slot in template.slots}
+        keys = [f"world-cup-2026/pagina-{i}" for i in range(args.bench)]
+        start = time.perf_counter()
+        for key in keys:
+            template.render(key, values)
+        seconds = time.perf_counter() - start
+        blocks = sum(1 for block, _ in template.chunks if block is not None)
+        print(f"{path.stem:<24} {blocks} bloques de variantes  {args.bench / seconds:>10,.0f} páginas/s")
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,203 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Índice espacial de las sedes y estadios para los bloques "cerca de aquí"
+de las páginas.
+
+Cada lugar se guarda como vector unitario (x, y, z) sobre la esfera: la
+distancia en línea recta entre dos vectores crece con la distancia sobre
+la superficie, así que un KD-tree de 3 dimensiones responde exactamente
+los k más cercanos y los que están a menos de X km, en O(log n) por
+consulta. Hay un árbol por tipo de lugar ('city', 'stadium') y las
+respuestas se guardan por entidad y consulta: cada bloque se calcula
+una vez por build aunque lo muestren muchas páginas.
+
+Las zonas de fans de content/programmatic/match-day-guides.json no se
+indexan: son solo texto, sin coordenadas propias, así que cualquier
+distancia a ellas sería la del centro de su ciudad.
+
+Uso:
+    python3 spatial_index.py --near ciudad-de-mexico [--kind city] [--target city] [-k 3] [--radius KM]
+"""
+
+import argparse
+import math
+import sys
+from collections import namedtuple
+from heapq import heappush, heapreplace
+
+from content_store import CONTENT_DIR, load_collection
+from page_shell import LOCALES
+from travel_matrix import EARTH_RADIUS_KM
+
+# name y slugs son {idioma: texto}; slugs vacío si el lugar no tiene página
+Place = namedtuple('Place', 'kind id name slugs coordinates')
+
+KINDS = ('city', 'stadium')
+
+
+def unit_vector(coordinates):
+    lat, lng = math.radians(coordinates['lat']), math.radians(coordinates['lng'])
+    return (math.cos(lat) * math.cos(lng), math.cos(lat) * math.sin(lng), math.sin(lat))
+
+
+def chord_to_km(chord):
+    """Cuerda entre dos vectores unitarios -> distancia sobre la esfera en km"""
+    return 2 * EARTH_RADIUS_KM * math.asin(min(1.0, chord / 2))
+
+
+def km_to_chord(km):
+    return 2 * math.sin(min(km / EARTH_RADIUS_KM, math.pi) / 2)
+
+
+def squared(a, b):
+    return (a[0] - b[0]) ** 2 + (a[1] - b[1]) ** 2 + (a[2] - b[2]) ** 2
+
+
+class KDTree:
+    """
+    KD-tree implícito: los puntos se reordenan una vez de modo que el nodo
+    de cada rango [lo, hi) es su elemento central, partido por el eje
+    profundidad % 3.
+    """
+
+    def __init__(self, places):
+        items = [(unit_vector(place.coordinates), place) for place in places]
+        self._build(items, 0, len(items), 0)
+        self.points = [point for point, _ in items]
+        self.places = [place for _, place in items]
+        self.positions = {(place.kind, place.id): i for i, place in enumerate(self.places)}
+
+    def _build(self, items, lo, hi, depth):
+        if hi - lo <= 1:
+            return
+        axis = depth % 3
+        items[lo:hi] = sorted(items[lo:hi], key=lambda item: item[0][axis])
+        mid = (lo + hi) // 2
+        self._build(items, lo, mid, depth + 1)
+        self._build(items, mid + 1, hi, depth + 1)
+
+    def __len__(self):
+        return len(self.points)
+
+    def nearest(self, point, k, skip=None):
+        """[(distancia², índice)] de los k puntos más cercanos, del más cercano al más lejano"""
+        heap = []  # (-distancia², índice), el peor arriba
+        points = self.points
+
+        def visit(lo, hi, depth):
+            if lo >= hi:
+                return
+            mid = (lo + hi) // 2
+            node = points[mid]
+            if mid != skip:
+                d = squared(point, node)
+                if len(heap) < k:
+                    heappush(heap, (-d, mid))
+                elif d < -heap[0][0]:
+                    heapreplace(heap, (-d, mid))
+            diff = point[depth % 3] - node[depth % 3]
+            near, far = ((lo, mid), (mid + 1, hi)) if diff < 0 else ((mid + 1, hi), (lo, mid))
+            visit(*near, depth + 1)
+            if len(heap) < k or diff * diff < -heap[0][0]:
+                visit(*far, depth + 1)
+
+        visit(0, len(points), 0)
+        return sorted((-d, i) for d, i in heap)
+
+    def within(self, point, radius, skip=None):
+        """[(distancia², índice)] de los puntos a menos de radius (cuerda), ordenados"""
+        found = []
+        limit = radius * radius
+        points = self.points
+
+        def visit(lo, hi, depth):
+            if lo >= hi:
+                return
+            mid = (lo + hi) // 2
+            node = points[mid]
+            d = squared(point, node)
+            if d <= limit and mid != skip:
+                found.append((d, mid))
+            diff = point[depth % 3] - node[depth % 3]
+            if diff < 0 or diff * diff <= limit:
+                visit(lo, mid, depth + 1)
+            if diff >= 0 or diff * diff <= limit:
+                visit(mid + 1, hi, depth + 1)
+
+        visit(0, len(points), 0)
+        return sorted(found)
+
+
+class SpatialIndex:
+    """Árboles por tipo de lugar y respuestas ya calculadas por entidad"""
+
+    def __init__(self, places):
+        by_kind = {}
+        for place in places:
+            by_kind.setdefault(place.kind, []).append(place)
+        self.trees = {kind: KDTree(group) for kind, group in by_kind.items()}
+        self.places = {(place.kind, place.id): place for place in places}
+        self._cache = {}
+
+    @classmethod
+    def from_content(cls, content_dir=CONTENT_DIR):
+        cities = load_collection('cities.json', 'cities', content_dir)
+        places = [Place('city', city['id'], city['name'], city['slugs'], city['coordinates']) for city in cities]
+        places += [Place('stadium', stadium['id'], stadium['name'], stadium['slugs'], stadium['coordinates'])
+                   for stadium in load_collection('stadiums.json', 'stadiums', content_dir)]
+        return cls(places)
+
+    def place(self, kind, entity_id):
+        return self.places[kind, entity_id]
+
+    def _query(self, key, kind, entity_id, target, search):
+        result = self._cache.get(key)
+        if result is None:
+            tree = self.trees.get(target)
+            if tree is None:
+                result = ()
+            else:
+                point = unit_vector(self.places[kind, entity_id].coordinates)
+                # La propia entidad no cuenta como vecina de sí misma
+                skip = tree.positions.get((kind, entity_id))
+                result = tuple((tree.places[i], chord_to_km(math.sqrt(d))) for d, i in search(tree, point, skip))
+            self._cache[key] = result
+        return result
+
+    def nearest(self, kind, entity_id, target, k):
+        """((lugar, km), ...) de los k lugares de tipo target más cercanos"""
+        return self._query(('nearest', kind, entity_id, target, k), kind, entity_id, target,
+                           lambda tree, point, skip: tree.nearest(point, k, skip))
+
+    def within(self, kind, entity_id, target, km):
+        """((lugar, km), ...) de los lugares de tipo target a menos de km"""
+        radius = km_to_chord(km)
+        return self._query(('within', kind, entity_id, target, km), kind, entity_id, target,
+                           lambda tree, point, skip: tree.within(point, radius, skip))
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description='Lugares cercanos a una sede o estadio')
+    parser.add_argument('--near', required=True, help='id de la entidad (e.g. ciudad-de-mexico)')
+    parser.add_argument('--kind', choices=KINDS, default='city', help='tipo de la entidad')
+    parser.add_argument('--target', choices=KINDS, default='city', help='tipo de los lugares a buscar')
+    parser.add_argument('-k', type=int, default=3, help='número de lugares más cercanos')
+    parser.add_argument('--radius', type=float, metavar='KM', help='lugares a menos de KM en lugar de los k más cercanos')
+    args = parser.parse_args(argv)
+
+    index = SpatialIndex.from_content()
+    if (args.kind, args.near) not in index.places:
+        print(f"no hay ningún {args.kind} con id {args.near}", file=sys.stderr)
+        return 1
+    if args.radius is not None:
+        results = index.within(args.kind, args.near, args.target, args.radius)
+    else:
+        results = index.nearest(args.kind, args.near, args.target, args.k)
+    for place, km in results:
+        print(f"{km:>8.1f} km  {place.name[LOCALES[0]]} ({place.id})")
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
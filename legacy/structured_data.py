@@ -0,0 +1,152 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Datos estructurados (JSON-LD) de las páginas como un grafo schema.org.
+
+Los nodos comunes a todo el sitio, Organization y WebSite, se construyen y
+serializan una sola vez por proceso e idioma. Cada página añade los suyos y los
+enlaza con esos nodos por @id:
+- el nodo principal (Article por defecto, o el schema_type de la página)
+- BreadcrumbList con los mismos breadcrumbs [(ruta, etiqueta)] que el HTML
+- FAQPage con las preguntas de la sección de preguntas frecuentes en
+  markdown (### pregunta + respuesta), como la que escribe generate_faqs
+
+Todo se serializa con json (escapa comillas, barras y saltos de línea del
+CSV) y '<' se escribe como \\u003c para que ningún texto pueda cerrar el
+<script>.
+"""
+
+import json
+import re
+from functools import lru_cache
+
+BASE_URL = "https://www.superfan.com"
+SITE_NAME = 'SuperFan Mundial 2026'
+# Tipos que admiten author/publisher (CreativeWork)
+CREATIVE_WORKS = frozenset({'Article', 'CollectionPage', 'WebPage'})
+
+_encoder = json.JSONEncoder(ensure_ascii=False, separators=(',', ':'))
+
+FAQ_SECTION_RE = re.compile(r'^## Preguntas Frecuentes[^\n]*\n(.*?)(?=^## |\Z)', re.M | re.S)
+QUESTION_RE = re.compile(r'^### (.+?)\n(.*?)(?=^### |\Z)', re.M | re.S)
+MARKDOWN_RE = re.compile(r'\*\*(.+?)\*\*')
+
+
+def to_json(value):
+    """JSON compacto que se puede incrustar en un <script>"""
+    return _encoder.encode(value).replace('<', '\\u003c')
+
+
+def organization_id(base_url=BASE_URL):
+    return f"{base_url}/#organization"
+
+
+def website_id(base_url=BASE_URL):
+    return f"{base_url}/#website"
+
+
+@lru_cache(maxsize=None)
+def site_graph(base_url=BASE_URL, lang='es'):
+    """Organization y WebSite serializados, compartidos por todas las páginas de un idioma"""
+    organization = {
+        '@type': 'Organization',
+        '@id': organization_id(base_url),
+        'name': SITE_NAME,
+        'url': f"{base_url}/",
+    }
+    website = {
+        '@type': 'WebSite',
+        '@id': website_id(base_url),
+        'name': SITE_NAME,
+        'url': f"{base_url}/",
+        'publisher': {'@id': organization_id(base_url)},
+        'inLanguage': lang,
+    }
+    return f"{to_json(organization)},{to_json(website)}"
+
+
+def path_crumbs(path, headline):
+    """Breadcrumbs de una ruta sin página que los defina: los segmentos en formato título"""
+    segments = [segment for segment in path.split('/') if segment]
+    return [('/'.join(segments[:i]), headline if i == len(segments) else segment.replace('-', ' ').title())
+            for i, segment in enumerate(segments, 1)]
+
+
+def breadcrumb_list(path, headline, base_url=BASE_URL, home='Inicio', crumbs=None):
+    """
+    BreadcrumbList de la portada a la página. crumbs es la misma lista
+    [(ruta, etiqueta)] con la que se pintan los breadcrumbs del HTML.
+    """
+    if crumbs is None:
+        crumbs = path_crumbs(path, headline)
+    items = [{'@type': 'ListItem', 'position': 1, 'name': home, 'item': f"{base_url}/"}]
+    for i, (crumb_path, label) in enumerate(crumbs, 2):
+        items.append({'@type': 'ListItem', 'position': i, 'name': label, 'item': f"{base_url}/{crumb_path}/"})
+    return {'@type': 'BreadcrumbList', '@id': f"{base_url}/{path}/#breadcrumb" if path else f"{base_url}/#breadcrumb",
+            'itemListElement': items}
+
+
+def faq_pairs(markdown):
+    """[(pregunta, respuesta en texto plano)] de la sección de preguntas frecuentes en markdown"""
+    section = FAQ_SECTION_RE.search(markdown)
+    if not section:
+        return []
+    pairs = []
+    for question, answer in QUESTION_RE.findall(section.group(1)):
+        lines = [line.strip().removeprefix('- ') for line in answer.strip().splitlines() if line.strip()]
+        # Cada elemento de una lista termina en punto para que la respuesta se lea de corrido
+        lines = [line if line[-1] in '.:;!?' else f"{line}." for line in lines]
+        text = MARKDOWN_RE.sub(r'\1', ' '.join(lines))
+        if text:
+            pairs.append((MARKDOWN_RE.sub(r'\1', question.strip()), text))
+    return pairs
+
+
+def page_graph(path, headline, description, schema_type='Article', faqs=(), lang='es',
+               base_url=BASE_URL, date_published=None, home='Inicio', crumbs=None):
+    """
+    Nodos de una página (sin los del sitio). path es la ruta sin barras
+    exteriores; faqs es [(pregunta, respuesta)]; crumbs, los breadcrumbs
+    del HTML (sin ellos se deducen de la ruta).
+    """
+    canonical = f"{base_url}/{path}/" if path else f"{base_url}/"
+    main = {
+        '@type': schema_type,
+        '@id': f"{canonical}#main",
+        'headline' if schema_type == 'Article' else 'name': headline,
+        'description': description,
+        'url': canonical,
+        'inLanguage': lang,
+    }
+    if schema_type in CREATIVE_WORKS:
+        main['author'] = {'@id': organization_id(base_url)}
+        main['publisher'] = {'@id': organization_id(base_url)}
+        main['isPartOf'] = {'@id': website_id(base_url)}
+        main['mainEntityOfPage'] = {'@type': 'WebPage', '@id': canonical}
+        main['breadcrumb'] = {'@id': f"{canonical}#breadcrumb"}
+    if date_published:
+        main['datePublished'] = main['dateModified'] = date_published
+    nodes = [main, breadcrumb_list(path, headline, base_url, home, crumbs)]
+    if faqs:
+        nodes.append({
+            '@type': 'FAQPage',
+            '@id': f"{canonical}#faq",
+            'isPartOf': {'@id': website_id(base_url)},
+            'mainEntity': [
+                {'@type': 'Question', 'name': question,
+                 'acceptedAnswer': {'@type': 'Answer', 'text': answer}}
+                for question, answer in faqs
+            ],
+        })
+    return nodes
+
+
+def json_ld(path, headline, description, schema_type='Article', faqs=(), lang='es',
+            base_url=BASE_URL, date_published=None, home='Inicio', crumbs=None):
+    """<script type="application/ld+json"> con el grafo completo de una página"""
+    nodes = page_graph(path, headline, description, schema_type, faqs, lang, base_url, date_published, home,
+                       crumbs)
+    page_nodes = ','.join(to_json(node) for node in nodes)
+    return (f'<script type="application/ld+json">'
+            f'{{"@context":"https://schema.org","@graph":[{site_graph(base_url, lang)},{page_nodes}]}}'
+            f'</script>')
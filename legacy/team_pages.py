@@ -0,0 +1,242 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Fichas de las 48 selecciones a partir de content/teams.json, en español
+(/world-cup-2026/teams/<slug>/) e inglés (/en/world-cup-2026/teams/<slug>/).
+
+teams.json se lee una sola vez a través de TeamStore, que lo indexa por id
+y por confederación. Los bloques que se repiten entre selecciones (nav de
+la confederación, partidos relacionados) se renderizan una vez por
+(clave, idioma) y se reutilizan en todas las fichas.
+"""
+
+from collections import defaultdict
+from functools import partial
+from html import escape
+
+from content_store import CONTENT_DIR, load_collection
+from page_shell import LOCALES, esc, locale_path, paragraphs, render_page
+from url_trie import stage_route, write_routes
+
+TEAMS_PATH = 'world-cup-2026/teams'
+STAGE = 'teams'
+
+TEXT = {
+    'es': {
+        'index_title': 'Selecciones del Mundial 2026',
+        'index_intro': 'Las 48 selecciones del Mundial 2026 agrupadas por confederación. Entra en cada ficha para ver su historia, jugadores clave y calendario.',
+        'conf_nav': 'Otras selecciones de {conf}',
+        'matches_title': 'Partidos y calendario',
+        'matches_group': 'Partidos del Grupo {group}',
+        'matches_pending': 'Los grupos se conocerán tras el sorteo oficial. Mientras tanto puedes consultar el calendario completo por fecha y por sede.',
+        'calendar': 'Calendario completo de partidos',
+        'ics': 'Descargar el calendario (.ics)',
+        'faq': 'Preguntas frecuentes',
+        'sources': 'Fuentes',
+        'club': 'Club',
+        'title_suffix': 'en el Mundial 2026',
+    },
+    'en': {
+        'index_title': 'World Cup 2026 Teams',
+        'index_intro': 'All 48 World Cup 2026 teams grouped by confederation. Open each profile for history, key players and schedule.',
+        'conf_nav': 'Other {conf} teams',
+        'matches_title': 'Matches and schedule',
+        'matches_group': 'Group {group} matches',
+        'matches_pending': 'Groups will be known after the official draw. In the meantime you can browse the full schedule by date and venue.',
+        'calendar': 'Full match schedule',
+        'ics': 'Download the calendar (.ics)',
+        'faq': 'Frequently asked questions',
+        'sources': 'Sources',
+        'club': 'Club',
+        'title_suffix': 'at the 2026 World Cup',
+    },
+}
+
+
+def team_path(team, lang):
+    """Ruta de la ficha sin barras exteriores"""
+    return locale_path(f"{TEAMS_PATH}/{team['slugs'][lang]}", lang)
+
+
+def index_path(lang):
+    return locale_path(TEAMS_PATH, lang)
+
+
+class TeamStore:
+    """
+    Acceso indexado a teams.json. El archivo se parsea la primera vez que
+    se pide una selección y los índices se construyen en esa misma pasada.
+    """
+
+    def __init__(self, content_dir=CONTENT_DIR):
+        self.content_dir = content_dir
+        self._teams = None
+
+    def _load(self):
+        if self._teams is None:
+            self._teams = load_collection('teams.json', 'teams', self.content_dir)
+            self._by_id = {team['id']: team for team in self._teams}
+            self._by_confederation = defaultdict(list)
+            for team in self._teams:
+                self._by_confederation[team['confederation']].append(team)
+        return self._teams
+
+    def __iter__(self):
+        return iter(self._load())
+
+    def __len__(self):
+        return len(self._load())
+
+    def get(self, team_id):
+        self._load()
+        return self._by_id[team_id]
+
+    def confederations(self):
+        """{confederación: [selecciones]} en el orden del archivo"""
+        self._load()
+        return self._by_confederation
+
+
+class TeamRenderer:
+    """Renderiza fichas reutilizando los fragmentos compartidos"""
+
+    def __init__(self, store, match_index=None):
+        self.store = store
+        self.match_index = match_index
+        self._fragments = {}
+
+    def _fragment(self, key, build):
+        fragment = self._fragments.get(key)
+        if fragment is None:
+            fragment = self._fragments[key] = build()
+        return fragment
+
+    def confederation_nav(self, confederation, lang):
+        """Lista de selecciones de la confederación (igual para todas sus fichas)"""
+        def build():
+            links = '\n'.join(
+                f'            <li><a href="/{team_path(team, lang)}/">{esc(team["name"][lang])}</a></li>'
+                for team in self.store.confederations()[confederation]
+            )
+            heading = TEXT[lang]['conf_nav'].format(conf=confederation)
+            return f'<h2>{heading}</h2>\n\n        <ul>\n{links}\n        </ul>'
+        return self._fragment(('conf', confederation, lang), build)
+
+    def related_matches(self, group, lang):
+        """Partidos del grupo de la selección, o enlaces al calendario si aún no hay sorteo"""
+        def build():
+            text = TEXT[lang]
+            calendar = (f'<p><a href="/world-cup-2026/matches/">{text["calendar"]}</a> · '
+                        f'<a href="/world-cup-2026/matches/calendario.ics">{text["ics"]}</a></p>')
+            matches = self.match_index.by_group.get(group, []) if (group and self.match_index) else []
+            if not matches:
+                return f'<h2>{text["matches_title"]}</h2>\n\n        <p>{text["matches_pending"]}</p>\n\n        {calendar}'
+            items = '\n'.join(
+                f'            <li><a href="/world-cup-2026/matches/{m["id"]}/">{m["date"]} · {esc(m["venue"])}, '
+                f'{esc(m["cityName"][lang])}</a></li>'
+                for m in matches
+            )
+            heading = text['matches_group'].format(group=group)
+            return f'<h2>{heading}</h2>\n\n        <ul>\n{items}\n        </ul>\n\n        {calendar}'
+        return self._fragment(('matches', group, lang), build)
+
+    def body(self, team, lang):
+        """Contenido principal de la ficha"""
+        text = TEXT[lang]
+        content = team['content']
+        parts = [paragraphs(content['overview'][lang])]
+        for section in ('worldCupHistory', 'qualifyingPath'):
+            parts.append(f"<h2>{esc(content[section]['title'][lang])}</h2>")
+            parts.append(paragraphs(content[section]['content'][lang]))
+
+        players = content['keyPlayers']
+        items = '\n'.join(
+            f'            <li><strong>{esc(p["name"])}</strong> ({esc(p["position"][lang])}, '
+            f'{text["club"]}: {esc(p["club"])}): {esc(p["note"][lang])}</li>'
+            for p in players['players']
+        )
+        parts.append(f"<h2>{esc(players['title'][lang])}</h2>")
+        parts.append(f'<ul>\n{items}\n        </ul>')
+
+        parts.append(f"<h2>{esc(content['matchSchedule']['title'][lang])}</h2>")
+        parts.append(paragraphs(content['matchSchedule']['content'][lang]))
+        parts.append(self.related_matches(team.get('group'), lang))
+
+        parts.append(f"<h2>{text['faq']}</h2>")
+        for item in content['faq']:
+            parts.append(f"<h3>{esc(item['question'][lang])}</h3>")
+            parts.append(f"<p>{esc(item['answer'][lang])}</p>")
+
+        parts.append(self.confederation_nav(team['confederation'], lang))
+
+        sources = '\n'.join(
+            f'            <li><a href="{escape(s["url"])}" rel="nofollow noopener" target="_blank">{esc(s["name"])}</a></li>'
+            for s in content['sources']
+        )
+        parts.append(f"<h2>{text['sources']}</h2>\n\n        <ul>\n{sources}\n        </ul>")
+        return '\n\n        '.join(parts)
+
+    def render_team(self, team, lang, crumbs=None, langs=LOCALES):
+        """Página completa de una selección"""
+        name = team['name'][lang]
+        path = team_path(team, lang)
+        if crumbs is None:
+            crumbs = [(index_path(lang), TEXT[lang]['index_title']), (path, name)]
+        title = f"{name} {TEXT[lang]['title_suffix']}"
+        return render_page(
+            title=title,
+            description=team['description'][lang],
+            keywords=f"{name.lower()}, {team['confederation'].lower()}, mundial 2026, world cup 2026",
+            path=path,
+            crumbs=crumbs,
+            body_html=self.body(team, lang),
+            h1=title,
+            schema_type='SportsTeam',
+            lang=lang,
+            alternates={alt: team_path(team, alt) for alt in langs},
+        )
+
+    def render_index(self, lang, crumbs=None, langs=LOCALES):
+        """Índice de selecciones agrupado por confederación"""
+        text = TEXT[lang]
+        parts = [f"<p>{text['index_intro']}</p>"]
+        for confederation, teams in self.store.confederations().items():
+            links = '\n'.join(
+                f'            <li><a href="/{team_path(team, lang)}/">{esc(team["name"][lang])}</a></li>'
+                for team in teams
+            )
+            parts.append(f'<h2>{confederation}</h2>\n\n        <ul>\n{links}\n        </ul>')
+        if crumbs is None:
+            crumbs = [(index_path(lang), text['index_title'])]
+        return render_page(
+            title=text['index_title'],
+            description=text['index_intro'],
+            keywords='selecciones mundial 2026, world cup 2026 teams',
+            path=index_path(lang),
+            crumbs=crumbs,
+            body_html='\n\n        '.join(parts),
+            schema_type='CollectionPage',
+            lang=lang,
+            alternates={alt: index_path(alt) for alt in langs},
+        )
+
+
+def claim_team_pages(trie, store):
+    """Reserva en el trie las rutas en español (índice y fichas)"""
+    trie.claim(TEAMS_PATH, STAGE, TEXT['es']['index_title'])
+    for team in store:
+        trie.claim(team_path(team, 'es'), STAGE, team['name']['es'])
+
+
+def team_routes(trie, store, match_index=None, langs=LOCALES):
+    """Route del índice y de cada ficha en todos los idiomas"""
+    renderer = TeamRenderer(store, match_index)
+    for lang in langs:
+        yield stage_route(trie, index_path(lang), partial(renderer.render_index, lang, langs=langs), index=True)
+        for team in store:
+            yield stage_route(trie, team_path(team, lang), partial(renderer.render_team, team, lang, langs=langs))
+
+
+def build_team_pages(trie, store, write, match_index=None, langs=LOCALES):
+    """Escribe índice y fichas en todos los idiomas; devuelve el número de archivos"""
+    return write_routes(team_routes(trie, store, match_index, langs), write)
@@ -0,0 +1,404 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Matriz de viaje entre las 16 sedes, calculada en el build.
+
+- km: distancia en línea recta (haversine) desde content/cities.json
+- minutos y costo (bajo y alto): las 23 rutas de content/programmatic/routes.json son
+  las aristas de un grafo; Floyd–Warshall completa los pares sin ruta
+  directa con el trayecto más rápido y el más barato (con escalas).
+
+El costo de las matrices es el del trayecto más barato (lo usan el
+presupuesto y el planificador); las tablas de las páginas describen el
+trayecto más rápido (modo y escalas) y muestran el precio de ese mismo
+trayecto: la suma de la tarifa del modo más rápido de cada ruta.
+
+Las matrices se guardan en listas planas fila a fila (i * n + j), así que
+cualquier par se consulta en O(1) tanto aquí como desde el JSON que se
+publica junto a /travel/transport/between-cities/.
+
+Las páginas se generan en cada idioma de LOCALES (/travel/transport/<ciudad>/
+y /en/travel/transport/<city>/) a partir de la misma matriz.
+"""
+
+import json
+import math
+from collections import namedtuple
+from functools import partial
+
+from content_store import CONTENT_DIR, load_collection
+from page_shell import LOCALES, format_number, locale_path, render_page
+from url_trie import stage_route, write_routes
+
+TRANSPORT_PATH = 'travel/transport'
+BETWEEN_CITIES_PATH = f'{TRANSPORT_PATH}/between-cities'
+MATRIX_FILE = f'{TRANSPORT_PATH}/travel-matrix.json'
+STAGE = 'transport'
+
+EARTH_RADIUS_KM = 6371.0
+# Tiempo extra por cada escala (traslado, espera, control de seguridad)
+TRANSFER_MINUTES = 120
+# Estimación para pares que no conecta ninguna ruta: vuelo directo
+FLIGHT_KMH = 750
+FLIGHT_OVERHEAD_MINUTES = 45
+
+# cost y cost_high: precio del trayecto más rápido (None si no lo conecta ninguna ruta)
+Leg = namedtuple('Leg', 'km minutes cost cost_high route via')
+
+
+def haversine_km(a, b):
+    """Distancia en km entre dos {'lat', 'lng'}"""
+    lat1, lat2 = math.radians(a['lat']), math.radians(b['lat'])
+    dlat = lat2 - lat1
+    dlng = math.radians(b['lng'] - a['lng'])
+    h = math.sin(dlat / 2) ** 2 + math.cos(lat1) * math.cos(lat2) * math.sin(dlng / 2) ** 2
+    return 2 * EARTH_RADIUS_KM * math.asin(math.sqrt(h))
+
+
+def route_minutes(route):
+    """Trayecto más rápido de una ruta entre los modos que tiene"""
+    options = [route[f] for f in ('flightDuration', 'busDuration', 'driveDuration') if route.get(f)]
+    return min(options)
+
+
+def route_mode(route):
+    """Modo del trayecto más rápido de una ruta ('flight', 'bus' o 'drive')"""
+    return min((mode for mode in ('flight', 'bus', 'drive') if route.get(f"{mode}Duration")),
+               key=lambda mode: route[f"{mode}Duration"])
+
+
+def route_fare(route):
+    """(mínimo, máximo) en USD del modo más rápido de una ruta; math.inf si ese modo no tiene precio"""
+    mode = route_mode(route)
+    return route.get(f"{mode}CostMin") or math.inf, route.get(f"{mode}CostMax") or math.inf
+
+
+def route_cost(route):
+    """Precio mínimo (USD) entre vuelo y autobús"""
+    options = [route[f] for f in ('flightCostMin', 'busCostMin') if route.get(f)]
+    return min(options)
+
+
+def route_cost_high(route):
+    """Precio alto (USD): el máximo publicado entre vuelo y autobús"""
+    options = [route[f] for f in ('flightCostMax', 'busCostMax') if route.get(f)]
+    return max(options)
+
+
+def floyd_warshall(n, weights, transfer=0):
+    """
+    Caminos mínimos entre todos los pares sobre una lista plana n*n
+    (math.inf donde no hay arista). transfer se suma por cada escala.
+    Devuelve (distancias, siguiente salto), ambas planas.
+    """
+    dist = list(weights)
+    nxt = [j if weights[i * n + j] < math.inf else -1 for i in range(n) for j in range(n)]
+    for i in range(n):
+        dist[i * n + i] = 0
+        nxt[i * n + i] = i
+    for k in range(n):
+        row_k = k * n
+        for i in range(n):
+            row_i = i * n
+            d_ik = dist[row_i + k]
+            if d_ik == math.inf:
+                continue
+            d_ik += transfer
+            for j in range(n):
+                candidate = d_ik + dist[row_k + j]
+                if candidate < dist[row_i + j]:
+                    dist[row_i + j] = candidate
+                    nxt[row_i + j] = nxt[row_i + k]
+    return dist, nxt
+
+
+class TravelMatrix:
+    """Distancia, tiempo y costo entre cada par de sedes"""
+
+    def __init__(self, cities, routes):
+        self.cities = cities
+        self.ids = [city['id'] for city in cities]
+        self.index = {city_id: i for i, city_id in enumerate(self.ids)}
+        # Otros nombres con los que content/ se refiere a una sede (slugs es/en)
+        self.aliases = dict(self.index)
+        for i, city in enumerate(cities):
+            for slug in city['slugs'].values():
+                self.aliases.setdefault(slug, i)
+        n = self.n = len(cities)
+
+        self.km = [0] * (n * n)
+        for i, a in enumerate(cities):
+            for j in range(i + 1, n):
+                km = round(haversine_km(a['coordinates'], cities[j]['coordinates']))
+                self.km[i * n + j] = self.km[j * n + i] = km
+
+        minutes = [math.inf] * (n * n)
+        cost = [math.inf] * (n * n)
+        cost_high = [math.inf] * (n * n)
+        # Precio del modo más rápido de la ruta directa, para sumar el del trayecto más rápido
+        self.fare, self.fare_high = [math.inf] * (n * n), [math.inf] * (n * n)
+        # Ruta directa de cada par (las rutas valen en ambos sentidos)
+        self.routes = {}
+        for route in routes:
+            i, j = self.index[route['from']], self.index[route['to']]
+            for a, b in ((i, j), (j, i)):
+                if route_minutes(route) < minutes[a * n + b]:
+                    self.fare[a * n + b], self.fare_high[a * n + b] = route_fare(route)
+                minutes[a * n + b] = min(minutes[a * n + b], route_minutes(route))
+                cost[a * n + b] = min(cost[a * n + b], route_cost(route))
+                cost_high[a * n + b] = min(cost_high[a * n + b], route_cost_high(route))
+                self.routes.setdefault(a * n + b, route)
+
+        self.minutes, self.next_hop = floyd_warshall(n, minutes, TRANSFER_MINUTES)
+        self.cost, _ = floyd_warshall(n, cost)
+        self.cost_high, _ = floyd_warshall(n, cost_high)
+
+        # Pares sin ninguna conexión: vuelo estimado por distancia
+        for p in range(n * n):
+            if self.minutes[p] == math.inf:
+                self.minutes[p] = FLIGHT_OVERHEAD_MINUTES + self.km[p] * 60 / FLIGHT_KMH
+                self.next_hop[p] = p % n
+        self.minutes = [round(m) for m in self.minutes]
+        self.cost = [None if c == math.inf else round(c) for c in self.cost]
+        self.cost_high = [None if c == math.inf else round(c) for c in self.cost_high]
+
+    @classmethod
+    def from_content(cls, content_dir=CONTENT_DIR):
+        return cls(load_collection('cities.json', 'cities', content_dir),
+                   load_collection('programmatic/routes.json', 'routes', content_dir))
+
+    def city_index(self, key):
+        """
+        Índice de una sede por id, slug o prefijo de slug (matches.json usa
+        'new-york' y 'philadelphia' en lugar de los ids de cities.json).
+        """
+        i = self.aliases.get(key)
+        if i is None:
+            found = {i for alias, i in self.aliases.items() if alias.startswith(f"{key}-")}
+            if len(found) != 1:
+                raise KeyError(key)
+            i = self.aliases[key] = found.pop()
+        return i
+
+    def path(self, origin, destination):
+        """Ids de las sedes del trayecto más rápido, extremos incluidos"""
+        i, j = self.index[origin], self.index[destination]
+        stops = [i]
+        while i != j:
+            i = self.next_hop[i * self.n + j]
+            stops.append(i)
+        return [self.ids[s] for s in stops]
+
+    def path_cost(self, stops, costs):
+        """Suma del precio de las rutas de un trayecto; None si algún tramo no tiene ruta"""
+        indexes = [self.index[stop] for stop in stops]
+        total = sum(costs[a * self.n + b] for a, b in zip(indexes, indexes[1:]))
+        return None if total == math.inf else round(total)
+
+    def leg(self, origin, destination):
+        """Datos de un par de sedes por el trayecto más rápido"""
+        p = self.index[origin] * self.n + self.index[destination]
+        stops = self.path(origin, destination)
+        return Leg(self.km[p], self.minutes[p], self.path_cost(stops, self.fare),
+                   self.path_cost(stops, self.fare_high), self.routes.get(p), stops[1:-1])
+
+    def to_json(self):
+        """Serialización compacta: listas planas fila a fila (i * n + j)"""
+        return json.dumps({
+            'cities': self.ids,
+            'km': self.km,
+            'minutes': self.minutes,
+            'costUsd': self.cost,
+            'costHighUsd': self.cost_high,
+            'next': self.next_hop,
+        }, separators=(',', ':'))
+
+
+# HTML -----------------------------------------------------------------------
+
+TEXT = {
+    'es': {
+        'modes': {'flight': 'avión', 'bus': 'autobús', 'drive': 'carro'},
+        'direct': 'Directo ({mode})',
+        'via': 'Con escala en {names}',
+        'estimated': 'Vuelo estimado',
+        'price': 'US${low}–{high}',
+        'head': ('Destino', 'Distancia', 'Tiempo más rápido', 'Precio', 'Cómo'),
+        'tips': 'Consejos por ruta',
+        'city_title': 'Transporte desde {name} a las sedes del Mundial 2026',
+        'city_crumb': 'Transporte desde {name}',
+        'city_intro': 'Cómo llegar desde {name} a las otras 15 sedes del Mundial 2026, ordenadas por tiempo de viaje. Los trayectos sin ruta directa se calculan con la combinación más rápida de rutas, sumando {hours} horas por escala.',
+        'city_heading': 'Conexiones desde {name}',
+        'city_description': 'Distancias, tiempos y precios para viajar desde {name} a las demás sedes del Mundial 2026, con rutas directas y escalas.',
+        'city_keywords': 'transporte {name}, cómo llegar desde {name}, mundial 2026, world cup 2026',
+        'all_link': 'Ver todas las conexiones entre sedes',
+        'between_title': 'Cómo moverse entre sedes',
+        'between_intro': 'Tiempo de viaje más rápido entre las 16 sedes del Mundial 2026. Los pares sin ruta directa combinan las rutas disponibles sumando {hours} horas por escala. Entra en cada ciudad para ver distancias, precios y consejos.',
+        'between_heading': 'Tiempos entre sedes',
+        'between_description': 'Tiempos de viaje, distancias y precios entre las 16 sedes del Mundial 2026: rutas directas en avión, autobús y carro, y combinaciones con escala.',
+        'between_keywords': 'travel between host cities, transporte entre sedes, mundial 2026, world cup 2026',
+        'json': 'Datos en formato JSON',
+    },
+    'en': {
+        'modes': {'flight': 'flight', 'bus': 'bus', 'drive': 'car'},
+        'direct': 'Direct ({mode})',
+        'via': 'Connecting in {names}',
+        'estimated': 'Estimated flight',
+        'price': 'US${low}–{high}',
+        'head': ('Destination', 'Distance', 'Fastest time', 'Price', 'How'),
+        'tips': 'Route tips',
+        'city_title': 'Getting from {name} to the 2026 World Cup host cities',
+        'city_crumb': 'Transport from {name}',
+        'city_intro': 'How to get from {name} to the other 15 host cities of the 2026 World Cup, sorted by travel time. Trips without a direct route use the fastest combination of routes, adding {hours} hours per connection.',
+        'city_heading': 'Connections from {name}',
+        'city_description': 'Distances, travel times and prices from {name} to the other 2026 World Cup host cities, with direct routes and connections.',
+        'city_keywords': '{name} transport, getting around from {name}, world cup 2026',
+        'all_link': 'See all connections between host cities',
+        'between_title': 'Travelling between host cities',
+        'between_intro': 'Fastest travel time between the 16 host cities of the 2026 World Cup. Pairs without a direct route combine the available routes, adding {hours} hours per connection. Open each city for distances, prices and tips.',
+        'between_heading': 'Travel times between host cities',
+        'between_description': 'Travel times, distances and prices between the 16 host cities of the 2026 World Cup: direct flights, buses and drives, plus connections.',
+        'between_keywords': 'travel between host cities, world cup 2026 transport, world cup 2026',
+        'json': 'Data in JSON format',
+    },
+}
+
+
+def format_minutes(minutes):
+    """95 -> '1 h 35 min'"""
+    hours, mins = divmod(minutes, 60)
+    if not hours:
+        return f"{mins} min"
+    return f"{hours} h {mins:02d} min" if mins else f"{hours} h"
+
+
+def city_transport_path(city, lang='es'):
+    return locale_path(f"{TRANSPORT_PATH}/{city['slugs'][lang]}", lang)
+
+
+def between_cities_path(lang='es'):
+    return locale_path(BETWEEN_CITIES_PATH, lang)
+
+
+def leg_row(matrix, city, other, lang):
+    """Fila de la tabla de conexiones de city hacia other"""
+    text = TEXT[lang]
+    leg = matrix.leg(city['id'], other['id'])
+    if leg.route and not leg.via:
+        how = text['direct'].format(mode=text['modes'][route_mode(leg.route)])
+    else:
+        names = ', '.join(matrix.cities[matrix.index[v]]['name'][lang] for v in leg.via)
+        how = text['via'].format(names=names) if names else text['estimated']
+    if leg.cost is None:
+        cost = '—'
+    elif leg.cost == leg.cost_high:
+        cost = f"US${leg.cost}"
+    else:
+        cost = text['price'].format(low=leg.cost, high=leg.cost_high)
+    return (f'                <tr><td><a href="/{city_transport_path(other, lang)}/">{other["name"][lang]}</a></td>'
+            f'<td>{format_number(leg.km, lang)} km</td><td>{format_minutes(leg.minutes)}</td>'
+            f'<td>{cost}</td><td>{how}</td></tr>')
+
+
+def render_city_transport(matrix, city, lang, crumbs=None, langs=LOCALES):
+    """Página de transporte desde una sede hacia las otras 15"""
+    text = TEXT[lang]
+    name = city['name'][lang]
+    others = sorted((c for c in matrix.cities if c is not city),
+                    key=lambda other: matrix.leg(city['id'], other['id']).minutes)
+    rows = '\n'.join(leg_row(matrix, city, other, lang) for other in others)
+    tips = []
+    for other in others:
+        route = matrix.leg(city['id'], other['id']).route
+        if route:
+            tips.append(f"            <li><strong>{other['name'][lang]}:</strong> {route['travelTip'][lang]}</li>")
+    tips_html = f"\n\n        <h2>{text['tips']}</h2>\n\n        <ul>\n{chr(10).join(tips)}\n        </ul>" if tips else ''
+    head = ''.join(f'<th>{label}</th>' for label in text['head'])
+    path = city_transport_path(city, lang)
+    if crumbs is None:
+        crumbs = [(between_cities_path(lang), text['between_title']), (path, text['city_crumb'].format(name=name))]
+    body = f'''<p>{text['city_intro'].format(name=name, hours=TRANSFER_MINUTES // 60)}</p>
+
+        <h2>{text['city_heading'].format(name=name)}</h2>
+
+        <table>
+            <thead>
+                <tr>{head}</tr>
+            </thead>
+            <tbody>
+{rows}
+            </tbody>
+        </table>{tips_html}
+
+        <p><a href="/{between_cities_path(lang)}/">{text['all_link']}</a></p>'''
+    return render_page(
+        title=text['city_title'].format(name=name),
+        description=text['city_description'].format(name=name),
+        keywords=text['city_keywords'].format(name=name.lower()),
+        path=path,
+        crumbs=crumbs,
+        body_html=body,
+        lang=lang,
+        alternates={alt: city_transport_path(city, alt) for alt in langs},
+    )
+
+
+def render_between_cities(matrix, lang, crumbs=None, langs=LOCALES):
+    """Matriz de tiempos entre todas las sedes"""
+    text = TEXT[lang]
+    head = ''.join(f'<th>{c["name"][lang]}</th>' for c in matrix.cities)
+    rows = []
+    for i, city in enumerate(matrix.cities):
+        cells = ''.join(
+            '<td>—</td>' if i == j else f'<td>{format_minutes(matrix.minutes[i * matrix.n + j])}</td>'
+            for j in range(matrix.n))
+        rows.append(f'                <tr><th><a href="/{city_transport_path(city, lang)}/">{city["name"][lang]}</a></th>{cells}</tr>')
+    path = between_cities_path(lang)
+    if crumbs is None:
+        crumbs = [(path, text['between_title'])]
+    body = f'''<p>{text['between_intro'].format(hours=TRANSFER_MINUTES // 60)}</p>
+
+        <h2>{text['between_heading']}</h2>
+
+        <table>
+            <thead>
+                <tr><th></th>{head}</tr>
+            </thead>
+            <tbody>
+{chr(10).join(rows)}
+            </tbody>
+        </table>
+
+        <p>{text['json']}: <a href="/{MATRIX_FILE}">{MATRIX_FILE.rpartition('/')[2]}</a></p>'''
+    return render_page(
+        title=text['between_title'],
+        description=text['between_description'],
+        keywords=text['between_keywords'],
+        path=path,
+        crumbs=crumbs,
+        body_html=body,
+        lang=lang,
+        alternates={alt: between_cities_path(alt) for alt in langs},
+    )
+
+
+def claim_transport_pages(trie, matrix):
+    """Reserva la página entre sedes y la de transporte de cada ciudad"""
+    trie.claim(BETWEEN_CITIES_PATH, STAGE, TEXT['es']['between_title'])
+    for city in matrix.cities:
+        trie.claim(city_transport_path(city), STAGE, TEXT['es']['city_crumb'].format(name=city['name']['es']))
+
+
+def transport_routes(trie, matrix, langs=LOCALES):
+    """Route de la página entre sedes y de la de cada ciudad en todos los idiomas"""
+    for lang in langs:
+        yield stage_route(trie, between_cities_path(lang), partial(render_between_cities, matrix, lang, langs=langs))
+        for city in matrix.cities:
+            yield stage_route(trie, city_transport_path(city, lang),
+                              partial(render_city_transport, matrix, city, lang, langs=langs))
+
+
+def build_transport_pages(trie, matrix, write, langs=LOCALES):
+    """Escribe la matriz JSON y las páginas de transporte; devuelve el número de archivos"""
+    write(MATRIX_FILE, matrix.to_json())
+    return 1 + write_routes(transport_routes(trie, matrix, langs), write)
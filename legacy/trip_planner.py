@@ -0,0 +1,188 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Motor de itinerarios del planificador de viaje (tools/trip-planner).
+
+Dado un rango de fechas, un presupuesto de transporte y preferencias de
+selecciones o ciudades, busca las rutas por sedes con el mayor número de
+partidos posible usando los tiempos y precios de TravelMatrix.
+
+Los partidos forman un grafo dirigido acíclico (ordenados por fecha): hay
+arista de A a B si da tiempo a viajar de la sede de A a la de B entre los
+dos días. Las aristas se calculan una vez; cada consulta es una
+programación dinámica sobre ese grafo que guarda, por partido y número de
+partidos vistos, los `limit` caminos más baratos. Eso basta para obtener
+los `limit` mejores itinerarios exactos y descarta el resto sin explorarlo.
+
+En el build se precalculan los itinerarios de PRESETS en
+tools/trip-planner.json para la página estática.
+
+Uso:
+    python3 trip_planner.py [--start 2026-06-11] [--end 2026-06-20] [--budget 500]
+                            [--city miami] [--team México] [--limit 3]
+"""
+
+import argparse
+import json
+import sys
+from bisect import insort
+from collections import namedtuple
+from datetime import date
+
+from content_store import CONTENT_DIR, load_json
+from match_pages import SCHEDULE_FILE, match_title
+from travel_matrix import TravelMatrix, format_minutes
+
+PLANNER_FILE = 'tools/trip-planner.json'
+# Horas de viaje que se aceptan por cada día entre dos partidos
+MAX_TRAVEL_MINUTES_PER_DAY = 600
+
+# Búsquedas frecuentes que se publican ya resueltas
+PRESETS = (
+    {'id': 'todo-el-torneo', 'label': 'Todo el torneo'},
+    {'id': 'primera-semana', 'label': 'Primera semana', 'start': '2026-06-11', 'end': '2026-06-17'},
+    {'id': 'segunda-semana', 'label': 'Segunda semana', 'start': '2026-06-18', 'end': '2026-06-24'},
+    {'id': 'presupuesto-300', 'label': 'Presupuesto de transporte de US$300', 'budget': 300},
+    {'id': 'mexico', 'label': 'Sedes de México',
+     'cities': ('ciudad-de-mexico', 'guadalajara', 'monterrey')},
+    {'id': 'costa-oeste', 'label': 'Costa oeste',
+     'cities': ('vancouver', 'seattle', 'san-francisco', 'los-angeles')},
+    {'id': 'costa-este', 'label': 'Costa este',
+     'cities': ('toronto', 'boston', 'nueva-york-nueva-jersey', 'filadelfia', 'atlanta', 'miami')},
+)
+
+# Camino parcial: costo y minutos acumulados, partido final y etiqueta anterior
+Label = namedtuple('Label', 'cost minutes match parent')
+
+
+class TripPlanner:
+    """Grafo de partidos alcanzables, listo para consultas repetidas"""
+
+    def __init__(self, matches, matrix):
+        self.matrix = matrix
+        self.matches = sorted(matches, key=lambda m: (m['date'], m['time'], m['id']))
+        self.days = [date.fromisoformat(m['date']).toordinal() for m in self.matches]
+        self.cities = [matrix.city_index(m['city']) for m in self.matches]
+
+        # predecessors[j] = [(i, costo, minutos)] para cada partido i desde el que se llega a j
+        n = matrix.n
+        self.predecessors = [[] for _ in self.matches]
+        for j in range(len(self.matches)):
+            for i in range(j):
+                gap = self.days[j] - self.days[i]
+                if gap < 1:
+                    continue
+                a, b = self.cities[i], self.cities[j]
+                if a == b:
+                    self.predecessors[j].append((i, 0, 0))
+                    continue
+                minutes, cost = matrix.minutes[a * n + b], matrix.cost[a * n + b]
+                if cost is not None and minutes <= gap * MAX_TRAVEL_MINUTES_PER_DAY:
+                    self.predecessors[j].append((i, cost, minutes))
+
+    @classmethod
+    def from_content(cls, matrix=None, content_dir=CONTENT_DIR):
+        matrix = matrix or TravelMatrix.from_content(content_dir)
+        return cls(load_json(SCHEDULE_FILE, content_dir)['matches'], matrix)
+
+    def _wanted(self, start, end, teams, cities):
+        """Índices de los partidos que cumplen los filtros de la consulta"""
+        teams = {team.lower() for team in teams}
+        cities = {self.matrix.city_index(city) for city in cities}
+        wanted = []
+        for k, match in enumerate(self.matches):
+            if (start and match['date'] < start) or (end and match['date'] > end):
+                continue
+            if cities and self.cities[k] not in cities:
+                continue
+            if teams:
+                names = {name.lower() for side in ('homeTeam', 'awayTeam') for name in match[side].values()}
+                if not teams & names:
+                    continue
+            wanted.append(k)
+        return wanted
+
+    def search(self, start=None, end=None, budget=None, teams=(), cities=(), limit=3):
+        """
+        Los `limit` itinerarios con más partidos (a igualdad, más baratos y
+        con menos horas de viaje). budget limita el gasto en transporte
+        entre sedes, en USD.
+        """
+        labels = {}
+        for j in self._wanted(start, end, teams, cities):
+            # {partidos vistos: [Label]} con los `limit` caminos más baratos
+            best = {1: [Label(0, 0, j, None)]}
+            for i, cost, minutes in self.predecessors[j]:
+                previous = labels.get(i)
+                if previous is None:
+                    continue
+                for count, paths in previous.items():
+                    kept = best.setdefault(count + 1, [])
+                    for label in paths:
+                        total = label.cost + cost
+                        if budget is not None and total > budget:
+                            break
+                        if len(kept) == limit and total >= kept[-1].cost:
+                            break
+                        insort(kept, Label(total, label.minutes + minutes, j, label),
+                               key=lambda l: (l.cost, l.minutes))
+                        del kept[limit:]
+            labels[j] = {count: paths for count, paths in best.items() if paths}
+
+        ranked = sorted(
+            ((count, label) for paths_by_count in labels.values()
+             for count, paths in paths_by_count.items() for label in paths),
+            key=lambda item: (-item[0], item[1].cost, item[1].minutes))
+        return [self.itinerary(label) for _, label in ranked[:limit]]
+
+    def itinerary(self, label):
+        """Itinerario serializable a partir de la última etiqueta del camino"""
+        result = {'matches': 0, 'transportUsd': label.cost, 'travelMinutes': label.minutes, 'legs': []}
+        while label is not None:
+            match = self.matches[label.match]
+            result['legs'].append({'match': match['id'], 'date': match['date'],
+                                   'city': self.matrix.ids[self.cities[label.match]],
+                                   'title': match_title(match)})
+            label = label.parent
+        result['legs'].reverse()
+        result['matches'] = len(result['legs'])
+        return result
+
+
+def build_planner_data(planner, presets=PRESETS, limit=3):
+    """JSON con los mejores itinerarios de cada preset"""
+    data = []
+    for preset in presets:
+        query = {k: v for k, v in preset.items() if k not in ('id', 'label')}
+        data.append({'id': preset['id'], 'label': preset['label'], **query,
+                     'itineraries': planner.search(limit=limit, **query)})
+    return json.dumps({'presets': data}, ensure_ascii=False, separators=(',', ':'))
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description='Itinerarios por sedes del Mundial 2026')
+    parser.add_argument('--start', help='primer día (AAAA-MM-DD)')
+    parser.add_argument('--end', help='último día (AAAA-MM-DD)')
+    parser.add_argument('--budget', type=int, help='presupuesto de transporte en USD')
+    parser.add_argument('--team', action='append', default=[], help='selección (se puede repetir)')
+    parser.add_argument('--city', action='append', default=[], help='sede (se puede repetir)')
+    parser.add_argument('--limit', type=int, default=3, help='número de itinerarios')
+    args = parser.parse_args(argv)
+
+    planner = TripPlanner.from_content()
+    unknown = [city for city in args.city if city not in planner.matrix.ids]
+    if unknown:
+        parser.error(f"sedes desconocidas: {', '.join(unknown)} (disponibles: {', '.join(planner.matrix.ids)})")
+    itineraries = planner.search(args.start, args.end, args.budget, args.team, args.city, args.limit)
+    if not itineraries:
+        print("Ningún itinerario cumple los filtros")
+    for n, itinerary in enumerate(itineraries, 1):
+        print(f"{n}. {itinerary['matches']} partidos, US${itinerary['transportUsd']} "
+              f"de transporte, {format_minutes(itinerary['travelMinutes'])} de viaje")
+        for leg in itinerary['legs']:
+            print(f"   {leg['date']}  {leg['match']}  {leg['city']}")
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,266 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Árbol de rutas (trie) construido una vez a partir de todos los PageSpec.
+
+Cada nodo es un segmento de URL. Los nodos comparten su cadena de
+breadcrumbs con los hijos, de modo que obtenerla cuesta O(profundidad).
+Los nodos intermedios sin fila en el CSV (/travel/, /fan/...) reciben una
+página índice generada que lista a sus hijos.
+
+Las etapas que generan páginas desde content/*.json (equipos, etc.)
+reclaman sus rutas con claim() antes de escribir, para que el control de
+colisiones y los breadcrumbs cubran todo el sitio. Sus páginas se
+describen como Route: el build las escribe y serve.py las renderiza bajo
+demanda a partir de las mismas rutas.
+"""
+
+from collections import namedtuple
+from functools import partial
+from pathlib import Path
+
+from page_shell import esc, render_breadcrumb, render_page
+
+
+# Página de una etapa: URL sin barras exteriores, archivo de salida y render() -> html
+Route = namedtuple('Route', 'path file render')
+
+
+class UrlCollisionError(ValueError):
+    """Dos páginas que terminarían escribiendo sobre la misma ruta"""
+
+
+class TrieNode:
+    """Segmento de URL con su página (si existe) y sus hijos"""
+    __slots__ = ('segment', 'path', 'parent', 'children', 'spec', 'stage', 'page_title', '_crumbs')
+
+    def __init__(self, segment='', parent=None):
+        self.segment = segment
+        self.parent = parent
+        self.path = f"{parent.path}/{segment}".lstrip('/') if parent else ''
+        self.children = {}
+        self.spec = None
+        # Etapa que genera esta página en lugar del CSV / índice de sección
+        self.stage = None
+        self.page_title = None
+        self._crumbs = None
+
+    @property
+    def label(self):
+        """Texto del breadcrumb: el slug en formato título"""
+        return self.segment.replace('-', ' ').title()
+
+    @property
+    def title(self):
+        """Título de la página: el de su etapa, el H1 de su fila o el slug en formato título"""
+        if self.page_title:
+            return self.page_title
+        return self.spec.h1 if self.spec else self.label
+
+    @property
+    def output_path(self):
+        """
+        Archivo HTML de este nodo. Los nodos con hijos se escriben como
+        carpeta/index.html para que /ruta/ y sus hijas no choquen.
+        """
+        if not self.parent:
+            return 'index.html'
+        if self.children:
+            return f"{self.path}/index.html"
+        return f"{self.path}.html"
+
+    def crumbs(self):
+        """Tupla de (ruta, título) desde la raíz hasta este nodo, compartida con los ancestros"""
+        if self._crumbs is None:
+            if self.parent is None:
+                self._crumbs = ()
+            else:
+                self._crumbs = self.parent.crumbs() + ((self.path, self.title),)
+        return self._crumbs
+
+    def breadcrumb_html(self):
+        """Bloque de breadcrumbs con el mismo marcado que los generadores"""
+        return render_breadcrumb(self.crumbs())
+
+
+class UrlTrie:
+    """Trie de URLs del sitio"""
+
+    def __init__(self):
+        self.root = TrieNode()
+        self.duplicates = []
+
+    @classmethod
+    def from_specs(cls, specs):
+        """Construye el trie con todas las páginas no placeholder"""
+        trie = cls()
+        for spec in specs:
+            if not spec.is_placeholder:
+                trie.insert(spec)
+        return trie
+
+    def _node(self, parts):
+        node = self.root
+        for part in parts:
+            child = node.children.get(part)
+            if child is None:
+                child = node.children[part] = TrieNode(part, node)
+            node = child
+        return node
+
+    def insert(self, spec):
+        """Añade una página; las URLs repetidas quedan en self.duplicates"""
+        node = self._node(spec.path_parts)
+        if node.spec is not None:
+            self.duplicates.append((node.spec, spec))
+        else:
+            node.spec = spec
+        return node
+
+    def claim(self, path, stage, title):
+        """
+        Reserva una ruta para una etapa. Si el CSV ya tiene esa URL, la
+        página de la etapa la reemplaza; si otra etapa ya la reclamó, es
+        una colisión.
+        """
+        node = self._node(part for part in path.split('/') if part)
+        if node.stage is not None and node.stage != stage:
+            self.duplicates.append((f"{node.stage}:{node.path}", f"{stage}:{path}"))
+        node.stage = stage
+        node.page_title = title
+        return node
+
+    def find(self, url):
+        """Nodo de una URL ('/a/b/' o 'a/b') o None"""
+        node = self.root
+        for part in url.strip('/').split('/'):
+            if not part:
+                continue
+            node = node.children.get(part)
+            if node is None:
+                return None
+        return node
+
+    def iter_nodes(self):
+        """Recorre todos los nodos en orden de inserción (preorden), sin la raíz"""
+        stack = list(reversed(self.root.children.values()))
+        while stack:
+            node = stack.pop()
+            yield node
+            stack.extend(reversed(node.children.values()))
+
+    def page_nodes(self):
+        """Nodos con fila en el CSV que no reemplaza ninguna etapa"""
+        return [node for node in self.iter_nodes() if node.spec is not None and node.stage is None]
+
+    def section_nodes(self):
+        """Nodos intermedios sin fila ni etapa que necesitan página índice"""
+        return [node for node in self.iter_nodes() if node.spec is None and node.stage is None]
+
+    def stage_nodes(self, stage):
+        """Nodos reclamados por una etapa"""
+        return [node for node in self.iter_nodes() if node.stage == stage]
+
+    def collisions(self):
+        """
+        Lista de conflictos antes de escribir nada: URLs repetidas, dos
+        nodos con el mismo archivo de salida, o un archivo con el mismo
+        nombre que una carpeta (x.html junto a x/).
+        """
+        problems = [
+            f"URL repetida: {_describe(first)} y {_describe(second)}"
+            for first, second in self.duplicates
+        ]
+        files = {}
+        dirs = set()
+        for node in self.iter_nodes():
+            out = node.output_path
+            if out in files:
+                problems.append(f"/{files[out]}/ y /{node.path}/ escriben {out}")
+            files[out] = node.path
+            parent_dir = out.rpartition('/')[0]
+            while parent_dir:
+                dirs.add(parent_dir)
+                parent_dir = parent_dir.rpartition('/')[0]
+        for out, path in files.items():
+            stem = out[:-len('.html')]
+            if stem in dirs:
+                problems.append(f"/{path}/ escribe {out} pero {stem}/ es una carpeta")
+        return problems
+
+    def disk_collisions(self, out_dir):
+        """
+        Archivos que ya están en la carpeta de salida y chocan con lo que
+        se va a escribir: un x.html viejo junto a la carpeta x/ de un nodo
+        con hijos, o una carpeta x/ donde un nodo escribe x.html.
+        """
+        out_dir = Path(out_dir)
+        problems = []
+        for node in self.iter_nodes():
+            out = node.output_path
+            if out.endswith('/index.html'):
+                stale = out_dir / f"{out[:-len('/index.html')]}.html"
+                if stale.is_file():
+                    problems.append(f"{stale.relative_to(out_dir)} ya existe y choca con la carpeta de /{node.path}/")
+            elif (out_dir / out[:-len('.html')]).is_dir():
+                problems.append(f"{out[:-len('.html')]}/ ya existe y choca con {out} de /{node.path}/")
+        return problems
+
+    def check(self, out_dir=None):
+        """Lanza UrlCollisionError si hay conflictos (también con los archivos de out_dir)"""
+        problems = self.collisions()
+        if out_dir is not None:
+            problems += self.disk_collisions(out_dir)
+        if problems:
+            raise UrlCollisionError('\n'.join(problems))
+
+
+def stage_route(trie, path, render, index=False):
+    """
+    Route de una página de etapa; render acepta crumbs=. Las rutas
+    reclamadas en el trie (las del idioma principal) usan su archivo y sus
+    breadcrumbs; las demás, path/index.html (index=True) o path.html y los
+    breadcrumbs por defecto del render.
+    """
+    node = trie.find(path)
+    if node is not None and node.stage is not None:
+        return Route(path, node.output_path, partial(render, crumbs=node.crumbs()))
+    return Route(path, f"{path}/index.html" if index else f"{path}.html", render)
+
+
+def write_routes(routes, write):
+    """Escribe cada Route con write(archivo, html); devuelve el número de archivos"""
+    count = 0
+    for route in routes:
+        write(route.file, route.render())
+        count += 1
+    return count
+
+
+def _describe(page):
+    """PageSpec o 'etapa:ruta' en texto para los mensajes de colisión"""
+    if isinstance(page, str):
+        return page
+    return f"/{page.url}/ ('{page.h1}')"
+
+
+def render_section_index(node):
+    """Página índice de un nodo intermedio: lista de sus páginas hijas"""
+    items = []
+    for child in node.children.values():
+        items.append(f'            <li><a href="/{child.path}/">{esc(child.title)}</a></li>')
+    body = f'''<p>Todas las guías de la sección {node.label} del Mundial 2026 en un solo lugar. Elige una página para ver la información completa.</p>
+
+        <ul>
+{chr(10).join(items)}
+        </ul>'''
+    keywords = ', '.join(child.label.lower() for child in node.children.values())
+    return render_page(
+        title=node.label,
+        description=f"Índice de {node.label} para el Mundial 2026: todas las guías de la sección en un solo lugar, con enlaces a la información completa.",
+        keywords=f"{keywords}, mundial 2026, world cup 2026",
+        path=node.path,
+        crumbs=node.crumbs(),
+        body_html=body,
+        schema_type='CollectionPage',
+    )
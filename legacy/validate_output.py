@@ -0,0 +1,208 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Validación de las páginas generadas.
+
+Revisa cada .html de la carpeta de salida en un pool de procesos y
+reporta solo los fallos:
+- etiquetas sin cerrar o cerradas sin abrir
+- exactamente un <h1> (el camino markdown de generate_seo_content puede
+  añadir un segundo)
+- longitud del <title> y de la meta description
+- que cada href interno apunte a un archivo del árbol de salida
+
+Los href siguen la misma convención que el build: /ruta/ se sirve desde
+ruta.html o ruta/index.html. Con --directory-urls solo vale
+ruta/index.html (hosts sin URLs limpias, donde /about/ no encuentra
+about.html).
+
+Las páginas se analizan con expresiones regulares compiladas una vez, no
+con un parser completo, para que un sitio de 100.000 páginas se valide en
+segundos.
+
+Uso:
+    python3 validate_output.py [--out DIR] [--workers N] [--directory-urls]
+"""
+
+import argparse
+import os
+import re
+import sys
+from concurrent.futures import ProcessPoolExecutor
+from html import unescape
+from pathlib import Path
+from urllib.parse import unquote, urlsplit
+
+TITLE_MAX = 70
+DESCRIPTION_MIN = 50
+DESCRIPTION_MAX = 160
+# Fallos que se muestran por página; el resto solo se cuenta
+MAX_PAGE_ERRORS = 20
+
+VOID_TAGS = frozenset({'area', 'base', 'br', 'col', 'embed', 'hr', 'img', 'input', 'link',
+                       'meta', 'source', 'track', 'wbr'})
+# Comentarios, doctype y el contenido de script/style no se revisan
+SKIP_RE = re.compile(r'<!--.*?-->|<!doctype[^>]*>|<(script|style)\b[^>]*>.*?</\1\s*>', re.S | re.I)
+TAG_RE = re.compile(r'<(/?)([a-zA-Z][a-zA-Z0-9]*)\b((?:[^>"\']|"[^"]*"|\'[^\']*\')*?)(/?)>')
+ATTR_RE = re.compile(r'([a-zA-Z_:][-a-zA-Z0-9_:.]*)\s*=\s*(?:"([^"]*)"|\'([^\']*)\'|([^\s"\'>]+))')
+TITLE_RE = re.compile(r'<title[^>]*>(.*?)</title\s*>', re.S | re.I)
+EXTERNAL_RE = re.compile(r'^(?:[a-z][a-z0-9+.-]*:|//|#)', re.I)
+
+# Carpeta y archivos del árbol de salida, cargados una vez por proceso
+_root = '.'
+_files = frozenset()
+_directory_urls = False
+
+
+def _init_worker(root, files, directory_urls):
+    global _root, _files, _directory_urls
+    _root = root
+    _files = files
+    _directory_urls = directory_urls
+
+
+def attributes(text):
+    """{nombre: valor} de los atributos de una etiqueta"""
+    return {name.lower(): unescape(double or single or bare)
+            for name, double, single, bare in ATTR_RE.findall(text)}
+
+
+def resolve(href, page, files, directory_urls=False):
+    """True si un href interno llega a un archivo del árbol de salida"""
+    path = unquote(urlsplit(href).path)
+    if not path:
+        return True
+    if not path.startswith('/'):
+        # Relativo a la URL de la página (/ruta/ para ruta.html y ruta/index.html)
+        base = page[:-len('index.html')] if page.endswith('index.html') else page[:-len('.html')] + '/'
+        path = '/' + base + path
+    parts = []
+    for part in path.split('/'):
+        if part == '..':
+            if parts:
+                parts.pop()
+        elif part and part != '.':
+            parts.append(part)
+    rel = '/'.join(parts)
+    if not rel:
+        return 'index.html' in files
+    if not path.endswith('/') and rel in files:
+        return True
+    if f"{rel}/index.html" in files:
+        return True
+    return not directory_urls and f"{rel}.html" in files
+
+
+def check_page(rel_path):
+    """(ruta, [fallos]) de una página"""
+    try:
+        with open(os.path.join(_root, rel_path), encoding='utf-8') as f:
+            html = f.read()
+    except (OSError, UnicodeDecodeError) as e:
+        return rel_path, [f"no se pudo leer: {e}"]
+    page = rel_path
+    errors = []
+    stack = []
+    h1 = 0
+    description = None
+    for match in TAG_RE.finditer(SKIP_RE.sub('', html)):
+        closing, tag, attrs, self_closing = match.groups()
+        tag = tag.lower()
+        if closing:
+            if tag in VOID_TAGS:
+                continue
+            if tag in stack:
+                while stack[-1] != tag:
+                    errors.append(f"<{stack.pop()}> sin cerrar antes de </{tag}>")
+                stack.pop()
+            else:
+                errors.append(f"</{tag}> sin etiqueta de apertura")
+            continue
+        if tag not in VOID_TAGS and not self_closing:
+            stack.append(tag)
+        if tag == 'h1':
+            h1 += 1
+        if 'href' in attrs or tag == 'meta':
+            values = attributes(attrs)
+            if tag == 'meta' and values.get('name', '').lower() == 'description':
+                description = values.get('content', '')
+            href = values.get('href')
+            if (href is not None and tag != 'link' and not EXTERNAL_RE.match(href)
+                    and not resolve(href, page, _files, _directory_urls)):
+                errors.append(f"enlace roto: {href}")
+    errors += [f"<{tag}> sin cerrar" for tag in stack]
+
+    if h1 != 1:
+        errors.append(f"{h1} etiquetas <h1> (debe haber una)")
+    title = TITLE_RE.search(html)
+    if title is None:
+        errors.append("sin <title>")
+    elif len(unescape(title.group(1)).strip()) > TITLE_MAX:
+        errors.append(f"<title> de {len(unescape(title.group(1)).strip())} caracteres (máx. {TITLE_MAX})")
+    if description is None:
+        errors.append("sin meta description")
+    elif not DESCRIPTION_MIN <= len(description) <= DESCRIPTION_MAX:
+        errors.append(f"meta description de {len(description)} caracteres "
+                      f"({DESCRIPTION_MIN}-{DESCRIPTION_MAX})")
+    return rel_path, errors
+
+
+def output_files(out_dir):
+    """Rutas relativas de todos los archivos de salida (sin .build-state ni cachés)"""
+    files = []
+    for root, dirs, names in os.walk(out_dir):
+        dirs[:] = [d for d in dirs if not d.startswith('.') and d != '__pycache__']
+        rel_root = os.path.relpath(root, out_dir)
+        for name in names:
+            files.append(name if rel_root == '.' else f"{rel_root}/{name}".replace(os.sep, '/'))
+    return files
+
+
+def validate(out_dir, workers=None, directory_urls=False):
+    """
+    Valida todas las páginas de out_dir. Devuelve (páginas revisadas,
+    [(ruta, [fallos])] solo de las páginas con fallos).
+    """
+    files = output_files(out_dir)
+    pages = sorted(path for path in files if path.endswith('.html'))
+    workers = workers or os.cpu_count() or 1
+    chunksize = max(1, len(pages) // (workers * 8))
+    initargs = (str(out_dir), frozenset(files), directory_urls)
+    if workers == 1 or len(pages) < 200:
+        # Pocas páginas: arrancar el pool cuesta más que revisarlas
+        _init_worker(*initargs)
+        results = map(check_page, pages)
+        return len(pages), [(path, errors) for path, errors in results if errors]
+    with ProcessPoolExecutor(workers, initializer=_init_worker, initargs=initargs) as pool:
+        results = pool.map(check_page, pages, chunksize=chunksize)
+        return len(pages), [(path, errors) for path, errors in results if errors]
+
+
+def format_report(failures, limit=MAX_PAGE_ERRORS):
+    lines = []
+    for path, errors in failures:
+        for error in errors[:limit]:
+            lines.append(f"{path}: {error}")
+        if len(errors) > limit:
+            lines.append(f"{path}: ... {len(errors) - limit} fallos más")
+    return '\n'.join(lines)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description='Validación de las páginas generadas')
+    parser.add_argument('--out', default=str(Path(__file__).parent), help='carpeta de salida del build')
+    parser.add_argument('--workers', type=int, help='procesos (por defecto, uno por CPU)')
+    parser.add_argument('--directory-urls', action='store_true',
+                        help='/ruta/ solo se resuelve a ruta/index.html')
+    args = parser.parse_args(argv)
+
+    checked, failures = validate(Path(args.out), args.workers, args.directory_urls)
+    if failures:
+        print(format_report(failures))
+    errors = sum(len(errors) for _, errors in failures)
+    print(f"{checked} páginas revisadas, {len(failures)} con fallos ({errors} fallos)")
+    return 1 if failures else 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())